@@ -1,6 +1,10 @@
 import os
 
-if os.getenv("DJANGO_ENV", "dev").lower() == "prod":
+_DJANGO_ENV = os.getenv("DJANGO_ENV", "dev").lower()
+
+if _DJANGO_ENV == "prod":
     from .prod import *  # noqa: F401,F403
+elif _DJANGO_ENV == "test":
+    from .test import *  # noqa: F401,F403
 else:
     from .dev import *  # noqa: F401,F403
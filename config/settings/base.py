@@ -41,6 +41,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "intel.middleware.QueryTimingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -128,6 +129,28 @@ if WHITENOISE_ENABLED and _HAS_WHITENOISE and not DEBUG:
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Ingest runs bump a version key in this cache, so it must be shared between the
+# web and command processes: the file backend by default, or e.g.
+# django.core.cache.backends.redis.RedisCache with CACHE_LOCATION=redis://...
+PUBLIC_CACHE_TIMEOUT = int(os.getenv("PUBLIC_CACHE_TIMEOUT", "600"))
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND")
+        or "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("CACHE_LOCATION") or str(BASE_DIR / ".cache"),
+        "TIMEOUT": PUBLIC_CACHE_TIMEOUT,
+    }
+}
+
+# Live map streams (SSE, ASGI only) check the cache version every
+# LIVE_STREAM_CHECK_SECONDS and close after LIVE_STREAM_MAX_SECONDS so the
+# browser reconnects on a fresh connection.
+LIVE_STREAM_CHECK_SECONDS = int(os.getenv("LIVE_STREAM_CHECK_SECONDS", "5"))
+LIVE_STREAM_MAX_SECONDS = int(os.getenv("LIVE_STREAM_MAX_SECONDS", "600"))
+# Live endpoint ETags roll over every LIVE_WINDOW_BUCKET_SECONDS so records
+# sliding out of the time window are dropped even when nothing new arrived.
+LIVE_WINDOW_BUCKET_SECONDS = int(os.getenv("LIVE_WINDOW_BUCKET_SECONDS", "60"))
+
 INTEL_USER_AGENT = os.getenv(
     "INTEL_USER_AGENT", "borealsec-intel-bot/0.1 (+https://borealsec.io)"
 )
@@ -140,12 +163,29 @@ FEED_MAX_BYTES = int(
 )
 INTEL_FETCH_MAX_BYTES = FEED_MAX_BYTES
 INTEL_FETCH_RETRIES = int(os.getenv("INTEL_FETCH_RETRIES", "3"))
+INTEL_FETCH_CONCURRENCY = int(os.getenv("INTEL_FETCH_CONCURRENCY", "6"))
+INTEL_FETCH_PER_HOST_CONCURRENCY = int(os.getenv("INTEL_FETCH_PER_HOST_CONCURRENCY", "2"))
+# Outbound HTTP keep-alive pools (intel.http): host pools kept per thread's
+# session, and idle connections kept per host.
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "32"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "4"))
 
 DARK_TOR_SOCKS_URL = os.getenv("DARK_TOR_SOCKS_URL", "socks5h://127.0.0.1:9050")
 DARK_FETCH_TIMEOUT = int(os.getenv("DARK_FETCH_TIMEOUT", "20"))
 DARK_MAX_BYTES = int(os.getenv("DARK_MAX_BYTES", "750000"))
 DARK_FETCH_RETRIES = int(os.getenv("DARK_FETCH_RETRIES", "3"))
 DARK_INDEX_MAX_LINKS = int(os.getenv("DARK_INDEX_MAX_LINKS", "30"))
+DARK_FETCH_CONCURRENCY = int(os.getenv("DARK_FETCH_CONCURRENCY", "6"))
+DARK_FETCH_PER_SOURCE_CONCURRENCY = int(os.getenv("DARK_FETCH_PER_SOURCE_CONCURRENCY", "3"))
+# Give each concurrent fetch its own SOCKS credentials so Tor builds a separate
+# circuit per stream (needs IsolateSOCKSAuth, which is on by default).
+DARK_TOR_ISOLATE_STREAMS = env_bool("DARK_TOR_ISOLATE_STREAMS", False)
+# Child documents unchanged for DARK_REVISIT_STABLE_RUNS fetches in a row are
+# revisited after a doubling delay starting at DARK_REVISIT_BASE_MINUTES and
+# capped at DARK_REVISIT_MAX_HOURS. Index and single pages are fetched every run.
+DARK_REVISIT_STABLE_RUNS = int(os.getenv("DARK_REVISIT_STABLE_RUNS", "3"))
+DARK_REVISIT_BASE_MINUTES = int(os.getenv("DARK_REVISIT_BASE_MINUTES", "30"))
+DARK_REVISIT_MAX_HOURS = int(os.getenv("DARK_REVISIT_MAX_HOURS", "24"))
 
 EPSS_MAX_RESULTS = int(os.getenv("EPSS_MAX_RESULTS", "200"))
 EPSS_MIN_SCORE = float(os.getenv("EPSS_MIN_SCORE", "0.1"))
@@ -153,6 +193,9 @@ EPSS_MIN_SCORE = float(os.getenv("EPSS_MIN_SCORE", "0.1"))
 DARK_DISCORD_WEBHOOK = os.getenv("DARK_DISCORD_WEBHOOK", "")
 INTEL_DISCORD_WEBHOOK = os.getenv("INTEL_DISCORD_WEBHOOK", "")
 EPSS_ALERT_THRESHOLD = float(os.getenv("EPSS_ALERT_THRESHOLD", "0.7"))
+ALERT_BATCH_MAX_EMBEDS = int(os.getenv("ALERT_BATCH_MAX_EMBEDS", "10"))
+ALERT_MAX_ATTEMPTS = int(os.getenv("ALERT_MAX_ATTEMPTS", "5"))
+ALERT_DISPATCH_LIMIT = int(os.getenv("ALERT_DISPATCH_LIMIT", "200"))
 
 TOR_SOCKS_HOST = os.getenv("TOR_SOCKS_HOST", "127.0.0.1")
 TOR_SOCKS_PORT = int(os.getenv("TOR_SOCKS_PORT", "9050"))
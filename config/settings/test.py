@@ -0,0 +1,5 @@
+from .dev import *  # noqa: F401,F403
+
+# Tests must not read or bump the shared public cache of a running instance;
+# tests that exercise caching opt in with override_settings(CACHES=...).
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
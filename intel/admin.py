@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from .models import (
+    Cve,
     DarkDocument,
     DarkFetchRun,
     DarkHit,
@@ -10,7 +11,11 @@ from .models import (
     FetchRun,
     Item,
     OpsJob,
+    OutboundAlert,
     Source,
+    item_stat_keys,
+    refresh_source_daily_stats,
+    source_stat_key,
 )
 
 
@@ -42,10 +47,27 @@ class FeedAdmin(admin.ModelAdmin):
 @admin.register(Item)
 class ItemAdmin(admin.ModelAdmin):
     list_display = ("title", "source", "feed", "external_id", "published_at", "created_at")
-    list_filter = ("source", "feed__section")
+    list_filter = ("source", "section")
     search_fields = ("title", "summary", "canonical_url", "stable_id", "external_id")
     readonly_fields = ("stable_id", "title_hash", "normalized_title", "created_at", "updated_at")
 
+    def delete_model(self, request, obj):
+        stat_key = source_stat_key(obj.source_id, obj.section, obj.published_at)
+        super().delete_model(request, obj)
+        refresh_source_daily_stats({stat_key})
+
+    def delete_queryset(self, request, queryset):
+        stat_keys = item_stat_keys(queryset)
+        super().delete_queryset(request, queryset)
+        refresh_source_daily_stats(stat_keys)
+
+
+@admin.register(Cve)
+class CveAdmin(admin.ModelAdmin):
+    list_display = ("cve_id", "created_at")
+    search_fields = ("cve_id",)
+    readonly_fields = ("created_at",)
+
 
 @admin.register(FetchRun)
 class FetchRunAdmin(admin.ModelAdmin):
@@ -91,6 +113,14 @@ class OpsJobAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(OutboundAlert)
+class OutboundAlertAdmin(admin.ModelAdmin):
+    list_display = ("id", "channel", "status", "attempts", "created_at", "next_attempt_at", "sent_at")
+    list_filter = ("status", "channel")
+    search_fields = ("last_error",)
+    readonly_fields = ("created_at", "sent_at", "attempts", "last_error")
+
+
 @admin.register(DarkSource)
 class DarkSourceAdmin(admin.ModelAdmin):
     list_display = (
@@ -119,6 +149,8 @@ class DarkFetchRunAdmin(admin.ModelAdmin):
         "bytes_received",
         "documents_discovered",
         "documents_fetched",
+        "documents_not_modified",
+        "documents_deferred",
         "hits_new",
         "hits_updated",
     )
@@ -136,6 +168,7 @@ class DarkDocumentAdmin(admin.ModelAdmin):
         "last_fetched_at",
         "last_http_status",
         "last_seen",
+        "next_fetch_at",
         "active",
     )
     list_filter = ("active", "dark_source")
@@ -0,0 +1,121 @@
+"""Versioned cache for public pages.
+
+Public pages only change when an ingest run (or an operator edit) commits, so
+their responses and heavy view state are cached under a shared version number.
+Bumping the version invalidates every entry at once; stale entries simply age
+out. The version lives in the cache itself, so the backend must be shared
+between the web and ingest processes (file or Redis, not local memory) for
+bumps to reach the web workers.
+
+A bump writes a fresh version rather than incrementing the old one: the
+file-based backend has no atomic ``incr``, and two concurrent increments could
+both land on the same number, keeping pages built between them. Any write of
+an unseen value invalidates them, whichever bump wins.
+
+Page keys only ever contain normalized, whitelisted query parameters, so
+arbitrary query strings cannot grow the cache.
+"""
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+
+CACHE_VERSION_KEY = "intel:public-cache-version"
+
+_state = threading.local()
+
+
+def public_cache_version() -> int:
+    version = cache.get(CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(CACHE_VERSION_KEY, 1, timeout=None)
+        version = cache.get(CACHE_VERSION_KEY, 1)
+    return version
+
+
+def bump_public_cache_version() -> None:
+    """Invalidate all public cache entries (deferred while inside :func:`batched_invalidation`)."""
+    if getattr(_state, "depth", 0):
+        _state.dirty = True
+        return
+    cache.set(CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+@contextmanager
+def batched_invalidation():
+    """Collapse the bumps made inside the block into one bump when it exits.
+
+    Ingest commands wrap their whole run in this so pages are rebuilt once per
+    run rather than once per feed.
+    """
+    _state.depth = getattr(_state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _state.depth -= 1
+        if not _state.depth and getattr(_state, "dirty", False):
+            _state.dirty = False
+            bump_public_cache_version()
+
+
+def cached_fragment(name: str, build, *parts):
+    """Return ``build()`` cached under ``name`` and ``parts`` for the current version."""
+    key = _cache_key("fragment", name, *parts)
+    version = public_cache_version()
+    value = cache.get(key, version=version)
+    if value is None:
+        value = build()
+        cache.set(key, value, settings.PUBLIC_CACHE_TIMEOUT, version=version)
+    return value
+
+
+def cache_public_page(view_func=None, *, params=None):
+    """Serve anonymous GETs of a public page from the versioned cache.
+
+    ``params(request)`` returns the normalized filter values the page is keyed
+    on, or ``None`` to serve the request uncached (unknown parameters or values
+    outside a known set). Without it only requests with no query string are
+    cached.
+    """
+    if view_func is None:
+        return lambda func: cache_public_page(func, params=params)
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if request.method != "GET" or request.user.is_authenticated:
+            return view_func(request, *args, **kwargs)
+
+        key_params = params(request) if params is not None else _no_params(request)
+        if key_params is None:
+            return view_func(request, *args, **kwargs)
+
+        key = _cache_key(
+            "page",
+            view_func.__name__,
+            *key_params,
+            bool(request.headers.get("HX-Request")),
+        )
+        version = public_cache_version()
+        response = cache.get(key, version=version)
+        if response is not None:
+            return response
+
+        response = view_func(request, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming and not response.cookies:
+            cache.set(key, response, settings.PUBLIC_CACHE_TIMEOUT, version=version)
+        return response
+
+    return wrapper
+
+
+def _no_params(request):
+    return None if request.GET else ()
+
+
+def _cache_key(kind: str, name: str, *parts) -> str:
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f"intel:{kind}:{name}:{digest[:32]}"
@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 
@@ -51,6 +52,15 @@ class DarkSource(models.Model):
     tags = models.JSONField(default=list, blank=True)
     watch_keywords = models.TextField(blank=True)
     watch_regex = models.TextField(blank=True, help_text="One regex per line.")
+    # Newest DarkFetchRun, kept current by DarkFetchRun.save().
+    latest_run = models.ForeignKey(
+        "DarkFetchRun",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -84,6 +94,8 @@ class DarkFetchRun(models.Model):
     final_url = models.TextField(blank=True)
     documents_discovered = models.PositiveIntegerField(default=0)
     documents_fetched = models.PositiveIntegerField(default=0)
+    documents_not_modified = models.PositiveIntegerField(default=0)
+    documents_deferred = models.PositiveIntegerField(default=0)
     hits_new = models.PositiveIntegerField(default=0)
     hits_updated = models.PositiveIntegerField(default=0)
 
@@ -93,6 +105,15 @@ class DarkFetchRun(models.Model):
     def __str__(self) -> str:
         return f"{self.dark_source.name} @ {self.started_at.isoformat()}"
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            DarkSource.objects.filter(
+                Q(latest_run__isnull=True) | Q(latest_run__started_at__lte=self.started_at),
+                pk=self.dark_source_id,
+            ).update(latest_run=self)
+
 
 class DarkDocument(models.Model):
     dark_source = models.ForeignKey(
@@ -103,11 +124,18 @@ class DarkDocument(models.Model):
     title = models.CharField(max_length=500, blank=True)
     excerpt = models.TextField(blank=True)
     content_hash = models.CharField(max_length=64, db_index=True)
+    # Source watch/extractor settings the document's hits were last matched with.
+    watch_config_hash = models.CharField(max_length=64, blank=True)
     first_seen = models.DateTimeField(default=timezone.now)
     last_seen = models.DateTimeField(default=timezone.now)
     last_fetched_at = models.DateTimeField(null=True, blank=True)
     last_http_status = models.PositiveSmallIntegerField(null=True, blank=True)
     last_error = models.TextField(blank=True)
+    http_etag = models.CharField(max_length=255, blank=True)
+    http_last_modified = models.CharField(max_length=64, blank=True)
+    # Fetches in a row that found the same content hash; drives next_fetch_at.
+    unchanged_runs = models.PositiveIntegerField(default=0)
+    next_fetch_at = models.DateTimeField(null=True, blank=True)
     active = models.BooleanField(default=True)
 
     class Meta:
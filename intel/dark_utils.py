@@ -474,6 +474,12 @@ def build_content_hash(*, url: str, title: str, text: str) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+def build_watch_config_hash(*, extractor_profile: str, watch_keywords: str, watch_regex: str) -> str:
+    """Fingerprint of the source settings that decide which records of a document become hits."""
+    payload = "\x1f".join([extractor_profile or "", watch_keywords or "", watch_regex or ""])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def build_record_identity_hash(
     *,
     record_type: str = "",
@@ -591,6 +597,13 @@ def normalize_dark_country(value: str) -> tuple[str, str]:
     return fallback, COUNTRY_DISPLAY_TO_CODE.get(fallback, "")
 
 
+def normalized_country_key(value: str) -> str:
+    country_display, _country_code = normalize_dark_country(value)
+    if country_display:
+        return country_display.lower()
+    return (value or "").strip().lower()
+
+
 def resolve_group_name(
     *,
     record_type: str = "",
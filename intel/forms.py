@@ -87,6 +87,15 @@ class _BaseFeedForm(forms.ModelForm):
             else:
                 widget.attrs["class"] = _INPUT_CLASS
 
+    def save(self, commit=True):
+        editing = bool(self.instance.pk)
+        if editing and self.changed_data:
+            # New URL/limits/adapter must see the next payload in full, not a 304 or digest hit.
+            self.instance.http_etag = ""
+            self.instance.http_last_modified = ""
+            self.instance.payload_hash = ""
+        return super().save(commit=commit)
+
 
 class FeedCreateForm(_BaseFeedForm):
     class Meta:
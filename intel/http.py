@@ -0,0 +1,79 @@
+"""Shared HTTP client for outbound fetches.
+
+Every thread gets one ``requests.Session`` (sessions are not thread-safe)
+whose adapter keeps a keep-alive pool per host, and per SOCKS proxy through
+requests' proxy managers. Repeated fetches to the same CERT/vendor host or
+onion service then reuse connections instead of paying a TCP/TLS (and SOCKS)
+handshake each time. Fetch worker threads live for a whole ingest run, so
+their pools do too.
+"""
+import threading
+from collections import defaultdict
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+_local = threading.local()
+_sessions: list[requests.Session] = []
+_sessions_lock = threading.Lock()
+
+
+def http_session() -> requests.Session:
+    """Return this thread's pooled session, creating it on first use."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max(1, settings.HTTP_POOL_CONNECTIONS),
+            pool_maxsize=max(1, settings.HTTP_POOL_MAXSIZE),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _local.session = session
+        with _sessions_lock:
+            _sessions.append(session)
+    return session
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Return ``{origin: {"requests": n, "connections": n}}`` across all live sessions.
+
+    ``connections`` counts new connections opened, so ``requests`` above it is
+    keep-alive reuse. Pools evicted beyond ``HTTP_POOL_CONNECTIONS`` drop out.
+    """
+    stats = defaultdict(lambda: {"requests": 0, "connections": 0})
+    with _sessions_lock:
+        sessions = list(_sessions)
+    for session in sessions:
+        for adapter in {id(adapter): adapter for adapter in session.adapters.values()}.values():
+            managers = [getattr(adapter, "poolmanager", None)]
+            managers.extend(getattr(adapter, "proxy_manager", {}).values())
+            for manager in managers:
+                if manager is None:
+                    continue
+                for key in manager.pools.keys():
+                    pool = manager.pools.get(key)
+                    if pool is None:
+                        continue
+                    origin = stats[f"{pool.scheme}://{pool.host}:{pool.port}"]
+                    origin["requests"] += pool.num_requests
+                    origin["connections"] += pool.num_connections
+    return dict(stats)
+
+
+def pool_summary() -> str:
+    stats = pool_stats()
+    requests_total = sum(row["requests"] for row in stats.values())
+    connections_total = sum(row["connections"] for row in stats.values())
+    return f"http: hosts={len(stats)} requests={requests_total} connections={connections_total}"
+
+
+def close_sessions() -> None:
+    """Close every pooled session (the end of an ingest run)."""
+    with _sessions_lock:
+        sessions = list(_sessions)
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+    _local.session = None
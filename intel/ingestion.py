@@ -9,13 +9,23 @@ from typing import Any
 from urllib.parse import urlsplit
 
 import feedparser
-import requests
 from django.conf import settings
 from django.db import transaction
 from django.utils import timezone as django_timezone
 from django.utils.dateparse import parse_datetime
 
-from .models import Feed, Item
+from .models import (
+    Feed,
+    Item,
+    add_source_daily_stats,
+    refresh_source_daily_stats,
+    source_stat_key,
+    sync_item_cves,
+    sync_ransomware_victims,
+)
+from .http import http_session
+from .ransomware import RANSOMWARE_ADAPTER_KEY
+from .search import index_items
 from .utils import build_stable_id, canonicalize_url, normalize_title, sanitize_summary
 
 logger = logging.getLogger(__name__)
@@ -221,7 +231,7 @@ def parse_json_payload(feed: Feed, payload: bytes, *, fetched_at: datetime) -> l
         return _parse_cisa_kev(feed, parsed, fetched_at=fetched_at)
     if adapter_key == "epss":
         return _parse_epss(feed, parsed, fetched_at=fetched_at)
-    if adapter_key == "ransomware_live_victims":
+    if adapter_key == RANSOMWARE_ADAPTER_KEY:
         return _parse_ransomware_live_victims(feed, parsed, fetched_at=fetched_at)
     if adapter_key == "psbdmp":
         return _parse_psbdmp(feed, parsed, fetched_at=fetched_at)
@@ -235,6 +245,18 @@ def _infer_json_adapter(feed: Feed) -> str:
     return "generic_json"
 
 
+# Adapters that make further requests while parsing: the feed URL's own
+# response (a 304 or an unchanged body) says nothing about those results.
+PARSE_TIME_FETCH_ADAPTERS = {"psbdmp"}
+
+
+def fetches_during_parse(feed: Feed) -> bool:
+    if feed.feed_type != Feed.FeedType.JSON:
+        return False
+    adapter_key = (feed.adapter_key or "").strip().lower() or _infer_json_adapter(feed)
+    return adapter_key in PARSE_TIME_FETCH_ADAPTERS
+
+
 def _parse_cisa_kev(feed: Feed, payload: Any, *, fetched_at: datetime) -> list[NormalizedEntry]:
     if not isinstance(payload, dict):
         raise ValueError("CISA KEV payload must be an object.")
@@ -473,7 +495,7 @@ def _parse_psbdmp(feed: Feed, payload: Any, *, fetched_at: datetime) -> list[Nor
         encoded = query.replace(" ", "+")
         url = f"https://psbdmp.ws/api/v3/search/{encoded}"
         try:
-            resp = requests.get(url, timeout=timeout, headers={"User-Agent": ua})
+            resp = http_session().get(url, timeout=timeout, headers={"User-Agent": ua})
             resp.raise_for_status()
             data = resp.json()
             if isinstance(data, list):
@@ -602,7 +624,51 @@ def is_valid_normalized_entry(entry: NormalizedEntry, *, feed: Feed | None = Non
     return False
 
 
-def upsert_normalized_item(feed: Feed, entry: NormalizedEntry):
+UPSERT_BATCH_SIZE = 500
+_ITEM_UPSERT_FIELDS = [
+    "source",
+    "feed",
+    "section",
+    "adapter_key",
+    "title",
+    "normalized_title",
+    "title_hash",
+    "external_id",
+    "url",
+    "canonical_url",
+    "summary",
+    "published_at",
+    "raw_payload",
+    "content_fingerprint",
+    "signal_score",
+    "signal_category",
+    "signal_flags",
+    "cve_ids",
+    "updated_at",
+]
+
+
+@dataclass(slots=True)
+class UpsertResult:
+    item: Item
+    created: bool
+    changed: bool = True
+
+
+@dataclass(slots=True)
+class _PreparedEntry:
+    title: str
+    url: str
+    canonical_url: str
+    canonical_for_dedupe: str
+    external_id: str
+    summary: str
+    published_at: datetime
+    stable_id: str
+    raw_payload: dict[str, Any]
+
+
+def _prepare_entry(feed: Feed, entry: NormalizedEntry) -> _PreparedEntry:
     title = normalize_title(entry.title or "Untitled")
     url = (entry.url or "").strip()
     canonical_url = canonicalize_url(entry.canonical_url or url)
@@ -634,49 +700,179 @@ def upsert_normalized_item(feed: Feed, entry: NormalizedEntry):
     if external_id and not raw_payload.get("id"):
         raw_payload["id"] = external_id
 
-    with transaction.atomic():
+    return _PreparedEntry(
+        title=title,
+        url=url,
+        canonical_url=canonical_url,
+        canonical_for_dedupe=canonical_for_dedupe,
+        external_id=external_id,
+        summary=summary,
+        published_at=published_at,
+        stable_id=stable_id,
+        raw_payload=raw_payload,
+    )
+
+
+class _ItemLookup:
+    """Dedupe index for one batch, mirroring the external_id -> canonical_url -> stable_id order."""
+
+    def __init__(self, feed: Feed, items):
+        self.feed_id = feed.id
+        self.by_external_id: dict[str, Item] = {}
+        self.by_canonical_url: dict[str, Item] = {}
+        self.by_stable_id: dict[str, Item] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Item):
+        if item.external_id and item.feed_id == self.feed_id:
+            self.by_external_id.setdefault(item.external_id, item)
+        if item.canonical_url:
+            self.by_canonical_url.setdefault(item.canonical_url, item)
+        self.by_stable_id.setdefault(item.stable_id, item)
+
+    def discard(self, item: Item):
+        for index, key in (
+            (self.by_external_id, item.external_id),
+            (self.by_canonical_url, item.canonical_url),
+            (self.by_stable_id, item.stable_id),
+        ):
+            if index.get(key) is item:
+                del index[key]
+
+    def find(self, prepared: _PreparedEntry) -> Item | None:
         existing = None
-        if external_id:
-            existing = (
-                Item.objects.select_for_update()
-                .filter(feed=feed, external_id=external_id)
-                .first()
+        if prepared.external_id:
+            existing = self.by_external_id.get(prepared.external_id)
+        if existing is None and prepared.canonical_for_dedupe:
+            existing = self.by_canonical_url.get(prepared.canonical_for_dedupe)
+        if existing is None:
+            existing = self.by_stable_id.get(prepared.stable_id)
+        return existing
+
+
+def _load_existing_items(feed: Feed, prepared_entries: list[_PreparedEntry]) -> list[Item]:
+    external_ids = {row.external_id for row in prepared_entries if row.external_id}
+    canonical_urls = {row.canonical_for_dedupe for row in prepared_entries if row.canonical_for_dedupe}
+    stable_ids = {row.stable_id for row in prepared_entries}
+
+    items: dict[int, Item] = {}
+    querysets = []
+    if external_ids:
+        querysets.append(Item.objects.filter(feed=feed, external_id__in=external_ids))
+    if canonical_urls:
+        querysets.append(Item.objects.filter(canonical_url__in=canonical_urls))
+    querysets.append(Item.objects.filter(stable_id__in=stable_ids))
+    for queryset in querysets:
+        for item in queryset.select_for_update().order_by("-published_at", "-id"):
+            items.setdefault(item.pk, item)
+    return sorted(items.values(), key=lambda item: (item.published_at, item.pk), reverse=True)
+
+
+def upsert_normalized_items(feed: Feed, entries: list[NormalizedEntry]) -> list[UpsertResult]:
+    """Upsert a batch of entries with a few IN lookups and bulk writes.
+
+    Returns one ``UpsertResult`` per entry, in input order, with the same
+    dedupe outcome as upserting the entries one at a time. Matched rows whose
+    content fingerprint is unchanged are reported with ``changed=False`` and
+    are not written.
+    """
+    results: list[UpsertResult] = []
+    for start in range(0, len(entries), UPSERT_BATCH_SIZE):
+        chunk = entries[start : start + UPSERT_BATCH_SIZE]
+        results.extend(_upsert_chunk(feed, [_prepare_entry(feed, entry) for entry in chunk]))
+    return results
+
+
+def _upsert_chunk(feed: Feed, prepared_entries: list[_PreparedEntry]) -> list[UpsertResult]:
+    if not prepared_entries:
+        return []
+
+    now = django_timezone.now()
+    with transaction.atomic():
+        lookup = _ItemLookup(feed, _load_existing_items(feed, prepared_entries))
+        pending_create: dict[int, Item] = {}
+        pending_update: dict[int, Item] = {}
+        cve_items: dict[int, Item] = {}
+        moved_stat_keys = set()
+        results: list[UpsertResult] = []
+
+        for prepared in prepared_entries:
+            existing = lookup.find(prepared)
+            if existing is not None:
+                lookup.discard(existing)
+                previous_fingerprint = existing.content_fingerprint
+                had_cves = bool(existing.cve_ids)
+                previous_stat_key = source_stat_key(
+                    existing.source_id, existing.section, existing.published_at
+                )
+                existing.source = feed.source
+                existing.feed = feed
+                existing.title = prepared.title
+                existing.external_id = prepared.external_id
+                existing.url = prepared.url
+                existing.canonical_url = prepared.canonical_url
+                existing.summary = prepared.summary
+                existing.published_at = prepared.published_at
+                existing.raw_payload = prepared.raw_payload
+                existing.normalize_fields()
+                lookup.add(existing)
+                changed = existing.content_fingerprint != previous_fingerprint
+                if changed and id(existing) not in pending_create:
+                    existing.updated_at = now
+                    pending_update[id(existing)] = existing
+                    if had_cves or existing.cve_ids:
+                        cve_items[id(existing)] = existing
+                    stat_key = source_stat_key(
+                        existing.source_id, existing.section, existing.published_at
+                    )
+                    if stat_key != previous_stat_key:
+                        moved_stat_keys.update((stat_key, previous_stat_key))
+                results.append(UpsertResult(item=existing, created=False, changed=changed))
+                continue
+
+            item = Item(
+                source=feed.source,
+                feed=feed,
+                title=prepared.title,
+                external_id=prepared.external_id,
+                url=prepared.url,
+                canonical_url=prepared.canonical_url,
+                summary=prepared.summary,
+                published_at=prepared.published_at,
+                stable_id=prepared.stable_id,
+                raw_payload=prepared.raw_payload,
             )
-        if existing is None and canonical_for_dedupe:
-            existing = (
-                Item.objects.select_for_update()
-                .filter(canonical_url=canonical_for_dedupe)
-                .first()
+            item.normalize_fields()
+            lookup.add(item)
+            pending_create[id(item)] = item
+            results.append(UpsertResult(item=item, created=True))
+
+        if pending_update:
+            Item.objects.bulk_update(
+                list(pending_update.values()),
+                _ITEM_UPSERT_FIELDS,
+                batch_size=UPSERT_BATCH_SIZE,
             )
-        if existing is None:
-            existing = Item.objects.select_for_update().filter(stable_id=stable_id).first()
-
-        if existing is not None:
-            existing.source = feed.source
-            existing.feed = feed
-            existing.title = title
-            existing.external_id = external_id
-            existing.url = url
-            existing.canonical_url = canonical_url
-            existing.summary = summary
-            existing.published_at = published_at
-            existing.raw_payload = raw_payload
-            existing.save()
-            return existing, False
-
-        created = Item.objects.create(
-            source=feed.source,
-            feed=feed,
-            title=title,
-            external_id=external_id,
-            url=url,
-            canonical_url=canonical_url,
-            summary=summary,
-            published_at=published_at,
-            stable_id=stable_id,
-            raw_payload=raw_payload,
-        )
-        return created, True
+        if pending_create:
+            Item.objects.bulk_create(
+                list(pending_create.values()),
+                batch_size=UPSERT_BATCH_SIZE,
+            )
+        created = list(pending_create.values())
+        cve_items.update((id(item), item) for item in created if item.cve_ids)
+        sync_item_cves(list(cve_items.values()))
+        index_items([*pending_update.values(), *created])
+        add_source_daily_stats(created)
+        refresh_source_daily_stats(moved_stat_keys)
+        if feed.adapter_key == RANSOMWARE_ADAPTER_KEY:
+            sync_ransomware_victims([*pending_update.values(), *created])
+    return results
+
+
+def upsert_normalized_item(feed: Feed, entry: NormalizedEntry):
+    result = upsert_normalized_items(feed, [entry])[0]
+    return result.item, result.created
 
 
 def upsert_item(feed, entry: dict[str, Any], *, published_at: datetime | None = None):
@@ -688,3 +884,52 @@ def upsert_item(feed, entry: dict[str, Any], *, published_at: datetime | None =
             {"published": published_at}, fallback=published_at
         )
     return upsert_normalized_item(feed, normalized)
+
+
+def refresh_feed_items(feed: Feed) -> int:
+    """Re-copy section/adapter and recompute signals after a feed's section or adapter changes."""
+    items = list(
+        feed.items.only(
+            "id",
+            "title",
+            "external_id",
+            "url",
+            "canonical_url",
+            "summary",
+            "raw_payload",
+            "feed_id",
+            "source_id",
+            "section",
+            "adapter_key",
+            "published_at",
+        )
+    )
+    had_victims = any(item.adapter_key == RANSOMWARE_ADAPTER_KEY for item in items)
+    stat_keys = set()
+    for item in items:
+        stat_keys.add(source_stat_key(item.source_id, item.section, item.published_at))
+        item.section = feed.section
+        item.adapter_key = feed.adapter_key
+        item.refresh_signal()
+        item.refresh_fingerprint()
+    Item.objects.bulk_update(
+        items,
+        [
+            "section",
+            "adapter_key",
+            "signal_score",
+            "signal_category",
+            "signal_flags",
+            "cve_ids",
+            "content_fingerprint",
+        ],
+        batch_size=UPSERT_BATCH_SIZE,
+    )
+    stat_keys.update(
+        source_stat_key(item.source_id, item.section, item.published_at) for item in items
+    )
+    refresh_source_daily_stats(stat_keys)
+    if had_victims or feed.adapter_key == RANSOMWARE_ADAPTER_KEY:
+        sync_ransomware_victims(items)
+    return len(items)
+
@@ -0,0 +1,116 @@
+"""Server-Sent Events stream for the live map endpoints.
+
+Ingest runs bump the public cache version when they commit (see
+:mod:`intel.cache`), so a stream only has to watch that version, which is a
+cache read. It rebuilds its payload only when the version moves and sends a
+message only when the payload's cursor is past the client's. Idle viewers
+therefore cost no database queries.
+
+Streaming needs the ASGI entry point (``config.asgi``). Under WSGI the stream
+answers 204, which stops ``EventSource`` from reconnecting, and the page keeps
+polling the JSON endpoint instead. The JSON endpoints themselves answer
+``304 Not Modified`` to a poll whose ETag still matches :func:`live_etag`.
+"""
+import asyncio
+import hashlib
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+from django.db.models import Max
+from django.http import HttpResponse, StreamingHttpResponse
+
+from .cache import public_cache_version
+
+KEEPALIVE_SECONDS = 25
+
+
+def _parse_int(raw) -> int | None:
+    try:
+        return max(int((raw or "").strip()), 0)
+    except ValueError:
+        return None
+
+
+def live_etag(request, model) -> str:
+    """Watermark for a live endpoint: newest id, ingest generation and window bucket.
+
+    One index lookup; rows only appear or change through ingest runs (which
+    bump the public cache version) or with a new, higher id. The payload also
+    depends on the sliding time window, so the clock is folded in truncated to
+    ``LIVE_WINDOW_BUCKET_SECONDS``.
+    """
+    latest_id = model.objects.aggregate(latest_id=Max("pk"))["latest_id"] or 0
+    window_bucket = int(time.time()) // max(settings.LIVE_WINDOW_BUCKET_SECONDS, 1)
+    raw = (
+        f"{request.get_full_path()}\x1f{latest_id}\x1f{public_cache_version()}"
+        f"\x1f{window_bucket}"
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def request_cursor(request) -> int:
+    return _parse_int(request.GET.get("cursor")) or 0
+
+
+def _stream_position(request) -> tuple[int, int | None]:
+    """Return the client's ``(cursor, cache version)``.
+
+    A reconnecting ``EventSource`` sends the last event id (``cursor:version``)
+    in ``Last-Event-ID``; a first connect passes both as query parameters,
+    taken from the page it was rendered with.
+    """
+    last_event_id = request.headers.get("Last-Event-ID", "")
+    if last_event_id:
+        raw_cursor, _separator, raw_version = last_event_id.partition(":")
+    else:
+        raw_cursor, raw_version = request.GET.get("cursor"), request.GET.get("version")
+    return _parse_int(raw_cursor) or 0, _parse_int(raw_version)
+
+
+def live_event_stream(request, build_payload):
+    """Stream ``build_payload(cursor)`` to the client whenever ingest moves the cursor on."""
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    cursor, version = _stream_position(request)
+    response = StreamingHttpResponse(
+        _events(build_payload, cursor=cursor, version=version),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _build(build_payload, cursor: int):
+    try:
+        return build_payload(cursor)
+    finally:
+        close_old_connections()
+
+
+async def _events(build_payload, *, cursor: int, version: int | None):
+    check_seconds = settings.LIVE_STREAM_CHECK_SECONDS
+    deadline = time.monotonic() + settings.LIVE_STREAM_MAX_SECONDS
+    last_write = time.monotonic()
+    yield f"retry: {check_seconds * 1000}\n\n"
+
+    while time.monotonic() < deadline:
+        # A cache read only: keep it off the shared sync thread the views use.
+        current_version = await sync_to_async(public_cache_version, thread_sensitive=False)()
+        if current_version != version:
+            version = current_version
+            payload = await sync_to_async(_build)(build_payload, cursor)
+            if payload["cursor"] > cursor:
+                cursor = payload["cursor"]
+                data = json.dumps(payload, cls=DjangoJSONEncoder)
+                yield f"id: {cursor}:{version}\ndata: {data}\n\n"
+                last_write = time.monotonic()
+        if time.monotonic() - last_write >= KEEPALIVE_SECONDS:
+            yield ": keepalive\n\n"
+            last_write = time.monotonic()
+        await asyncio.sleep(check_seconds)
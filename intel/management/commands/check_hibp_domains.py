@@ -13,11 +13,11 @@ Settings required:
 """
 import time
 
-import requests
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
+from intel.http import http_session
 from intel.ingestion import NormalizedEntry, upsert_normalized_item
 from intel.models import Feed, Source
 from intel.utils import canonicalize_url, normalize_title, sanitize_summary
@@ -133,7 +133,7 @@ class Command(BaseCommand):
 
     def _fetch_domain_breaches(self, domain: str, api_key: str) -> list[dict]:
         url = f"{_HIBP_BASE}/breacheddomain/{domain}"
-        resp = requests.get(
+        resp = http_session().get(
             url,
             headers={
                 "hibp-api-key": api_key,
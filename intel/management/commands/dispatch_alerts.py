@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from intel.notifications import dispatch_pending_alerts
+
+
+class Command(BaseCommand):
+    help = "Send queued Discord alerts in batches, honouring rate limits and retries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Maximum queued alerts to process (default: ALERT_DISPATCH_LIMIT).",
+        )
+
+    def handle(self, *args, **options):
+        stats = dispatch_pending_alerts(limit=options["limit"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Done. "
+                f"sent={stats['sent']} retried={stats['retried']} "
+                f"failed={stats['failed']} deferred={stats['deferred']}"
+            )
+        )
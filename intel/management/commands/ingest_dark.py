@@ -1,17 +1,23 @@
 import time
-from urllib.parse import urlsplit
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import timedelta
+from urllib.parse import urlsplit, urlunsplit
 
 import feedparser
-import requests
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 
+from intel.cache import bump_public_cache_version
+from intel.http import close_sessions, http_session, pool_summary
 from intel.dark_utils import (
     build_record_identity_hash,
     build_content_hash,
+    build_watch_config_hash,
     evaluate_record_watch_matches,
     extract_links,
     resolve_group_name,
@@ -28,21 +34,112 @@ from intel.notifications import (
 from intel.utils import canonicalize_url, sanitize_summary
 
 
-def _latest_alerted_dark_hit(*, source, hit, alert_identity_hash: str):
+_DARK_HIT_UPDATE_FIELDS = [
+    "matched_keywords",
+    "matched_regex",
+    "is_watch_match",
+    "record_type",
+    "group_name",
+    "victim_name",
+    "country",
+    "industry",
+    "website_url",
+    "victim_count",
+    "last_activity_text",
+    "title",
+    "excerpt",
+    "url",
+    "raw",
+    "alert_identity_hash",
+    "content_hash",
+    "last_seen_at",
+    "last_alerted_at",
+    "last_alert_fingerprint",
+]
+
+
+def _load_alert_history(source, alert_identity_hashes, *, known_hits) -> defaultdict:
+    """Return the source's alerted hits grouped by alert identity, in one query.
+
+    Rows already loaded for the document are reused, so alert state set while
+    its records are processed is seen by later records with the same identity.
+    """
+    known_by_pk = {hit.pk: hit for hit in known_hits}
+    history = defaultdict(list)
+    if not alert_identity_hashes:
+        return history
+    for hit in DarkHit.objects.filter(
+        dark_source=source,
+        alert_identity_hash__in=alert_identity_hashes,
+        last_alerted_at__isnull=False,
+    ):
+        history[hit.alert_identity_hash].append(known_by_pk.get(hit.pk, hit))
+    return history
+
+
+def _latest_alerted_dark_hit(alert_history, *, hit, alert_identity_hash: str):
     if (
         hit is not None
         and hit.last_alerted_at is not None
         and hit.last_alert_fingerprint
     ):
         return hit
-    queryset = DarkHit.objects.filter(
-        dark_source=source,
-        alert_identity_hash=alert_identity_hash,
-        last_alerted_at__isnull=False,
+    candidates = [
+        candidate
+        for candidate in alert_history.get(alert_identity_hash, ())
+        if candidate is not hit
+        and candidate.alert_identity_hash == alert_identity_hash
+        and candidate.last_alerted_at is not None
+    ]
+    if not candidates:
+        return None
+    # Newest alert first, then newest row; unsaved rows are created after every stored one.
+    return max(
+        candidates,
+        key=lambda candidate: (candidate.last_alerted_at, candidate.pk or float("inf")),
     )
-    if hit is not None and hit.pk:
-        queryset = queryset.exclude(pk=hit.pk)
-    return queryset.order_by("-last_alerted_at", "-id").first()
+
+
+def _next_fetch_at(unchanged_runs: int, now):
+    """When to revisit a child document after ``unchanged_runs`` fetches found the same content.
+
+    ``None`` (fetch every run) until DARK_REVISIT_STABLE_RUNS is reached, then a
+    delay that doubles per further unchanged fetch, capped at DARK_REVISIT_MAX_HOURS.
+    """
+    stable_runs = settings.DARK_REVISIT_STABLE_RUNS
+    if stable_runs <= 0 or unchanged_runs < stable_runs:
+        return None
+    delay = timedelta(minutes=max(1, settings.DARK_REVISIT_BASE_MINUTES))
+    delay *= 2 ** min(unchanged_runs - stable_runs, 16)
+    return now + min(delay, timedelta(hours=max(1, settings.DARK_REVISIT_MAX_HOURS)))
+
+
+def _isolated_socks_url(socks_url: str, *, source, slot: int) -> str:
+    """Add per-(source, slot) SOCKS credentials so Tor (IsolateSOCKSAuth) uses a separate circuit."""
+    parts = urlsplit(socks_url)
+    if not parts.hostname or parts.username:
+        return socks_url
+    return urlunsplit(parts._replace(netloc=f"intel-{source.pk}:{slot}@{parts.netloc}"))
+
+
+@dataclass(slots=True)
+class _SourceCrawl:
+    source: DarkSource
+    free_slots: list[int]
+    run: DarkFetchRun | None = None
+    started: float = 0.0
+    discovered: bool = False
+    failure: Exception | None = None
+    pending: deque = field(default_factory=deque)
+    documents: dict = field(default_factory=dict)
+    bytes_received: int = 0
+    documents_discovered: int = 0
+    documents_fetched: int = 0
+    documents_not_modified: int = 0
+    documents_deferred: int = 0
+    hits_new: int = 0
+    hits_updated: int = 0
+    errors: list[str] = field(default_factory=list)
 
 
 class Command(BaseCommand):
@@ -59,6 +156,11 @@ class Command(BaseCommand):
             default=[],
             help="Dark source slug/name to ingest. May be used multiple times.",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Ignore stored ETag/Last-Modified validators and revisit schedules; fetch every document.",
+        )
 
     def handle(self, *args, **options):
         sources = DarkSource.objects.filter(enabled=True).order_by("name")
@@ -72,84 +174,190 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("No enabled dark sources matched."))
             return
 
-        for source in sources:
-            self._run_source(source)
+        self.force = options.get("force", False)
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max(1, settings.DARK_FETCH_CONCURRENCY),
+                thread_name_prefix="dark-fetch",
+            ) as executor:
+                self._crawl(list(sources), executor)
+            self.stdout.write(pool_summary())
+        finally:
+            close_sessions()
+        bump_public_cache_version()
+
+    def _crawl(self, sources, executor):
+        """Fetch documents for all sources concurrently; every DB write stays on this thread.
+
+        At most DARK_FETCH_CONCURRENCY fetches are in flight overall and
+        DARK_FETCH_PER_SOURCE_CONCURRENCY per source. Each in-flight fetch of a
+        source holds one of its slots, which with DARK_TOR_ISOLATE_STREAMS picks
+        its Tor circuit.
+        """
+        capacity = max(1, settings.DARK_FETCH_CONCURRENCY)
+        per_source = max(1, settings.DARK_FETCH_PER_SOURCE_CONCURRENCY)
+        crawls = [_SourceCrawl(source=source, free_slots=list(range(per_source))) for source in sources]
+        futures = {}
+
+        while True:
+            for crawl in crawls:
+                while len(futures) < capacity and crawl.free_slots:
+                    if crawl.run is None:
+                        self._start_crawl(crawl)
+                        url = None
+                    elif crawl.pending:
+                        url = crawl.pending.popleft()
+                    else:
+                        break
+                    slot = crawl.free_slots.pop()
+                    validators = {}
+                    if url is None:
+                        future = executor.submit(self._discover_documents, crawl.source, slot=slot)
+                    else:
+                        future = executor.submit(
+                            self._fetch_with_retries,
+                            url,
+                            crawl.source,
+                            slot=slot,
+                            document=crawl.documents.get(url),
+                            validators=validators,
+                        )
+                    futures[future] = (crawl, url, slot, validators)
+            if not futures:
+                break
+
+            done, _pending = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                crawl, url, slot, validators = futures.pop(future)
+                crawl.free_slots.append(slot)
+                if url is None:
+                    self._store_discovery(crawl, future)
+                else:
+                    self._store_document(crawl, url, future, validators)
+                if crawl.discovered and not crawl.pending and len(crawl.free_slots) == per_source:
+                    self._finish_crawl(crawl)
 
-    def _run_source(self, source: DarkSource):
-        started_at = timezone.now()
-        run = DarkFetchRun.objects.create(dark_source=source, started_at=started_at)
-        started = time.monotonic()
-        bytes_received_total = 0
-        docs_discovered = 0
-        docs_fetched = 0
-        hits_new = 0
-        hits_updated = 0
-        errors = []
+    def _start_crawl(self, crawl):
+        crawl.run = DarkFetchRun.objects.create(dark_source=crawl.source, started_at=timezone.now())
+        crawl.started = time.monotonic()
 
+    def _store_discovery(self, crawl, future):
+        crawl.discovered = True
         try:
-            candidate_urls, root_status, root_final_url, root_bytes = self._discover_documents(source)
-            bytes_received_total += root_bytes
-            docs_discovered = len(candidate_urls)
-            run.http_status = root_status
-            run.final_url = root_final_url
+            candidate_urls, root_status, root_final_url, root_bytes = future.result()
+        except Exception as exc:
+            crawl.failure = exc
+            return
+        crawl.bytes_received += root_bytes
+        crawl.documents_discovered = len(candidate_urls)
+        crawl.run.http_status = root_status
+        crawl.run.final_url = root_final_url
+        self._schedule_documents(crawl, candidate_urls)
 
-            for doc_url in candidate_urls:
-                try:
-                    markup, status, final_url, doc_bytes = self._fetch_with_retries(doc_url, source)
-                    bytes_received_total += doc_bytes
-                    docs_fetched += 1
-                    created_count, updated_count = self._upsert_document_and_hits(
-                        source=source,
-                        doc_url=doc_url,
-                        final_url=final_url,
-                        status=status,
-                        markup=markup,
-                    )
-                    hits_new += created_count
-                    hits_updated += updated_count
-                except Exception as exc:
-                    errors.append(f"{doc_url}: {exc}")
-
-            run.ok = len(errors) == 0
-            if errors:
-                run.error = "; ".join(errors)[:4000]
-            run.bytes_received = bytes_received_total
-            run.documents_discovered = docs_discovered
-            run.documents_fetched = docs_fetched
-            run.hits_new = hits_new
-            run.hits_updated = hits_updated
-            run.finished_at = timezone.now()
-            run.duration_ms = int((time.monotonic() - started) * 1000)
-            run.save()
-
-            style = self.style.SUCCESS if run.ok else self.style.WARNING
-            self.stdout.write(
-                style(
-                    f"[{source.id}] {source.name}: "
-                    f"docs={docs_fetched}/{docs_discovered} "
-                    f"hits_new={hits_new} hits_updated={hits_updated} "
-                    f"bytes={bytes_received_total}"
+    def _schedule_documents(self, crawl, candidate_urls):
+        """Queue the documents due this run and remember their stored validators.
+
+        The source URL itself (index, feed root or single page) is always due;
+        child documents wait until their ``next_fetch_at``. A deferred document
+        is still linked from the source, so it and its hits count as seen.
+        """
+        source = crawl.source
+        canonical_urls = {url: canonicalize_url(url) for url in candidate_urls}
+        documents = {}
+        if not self.force:
+            documents = {
+                document.canonical_url: document
+                for document in DarkDocument.objects.filter(
+                    dark_source=source,
+                    canonical_url__in=set(canonical_urls.values()),
                 )
+            }
+        now = timezone.now()
+        deferred_ids = []
+        for url in candidate_urls:
+            document = documents.get(canonical_urls[url])
+            if (
+                document is not None
+                and url != source.url
+                and document.next_fetch_at is not None
+                and document.next_fetch_at > now
+            ):
+                crawl.documents_deferred += 1
+                deferred_ids.append(document.pk)
+                continue
+            if document is not None:
+                crawl.documents[url] = document
+            crawl.pending.append(url)
+        if deferred_ids:
+            with transaction.atomic():
+                DarkDocument.objects.filter(pk__in=deferred_ids).update(last_seen=now)
+                DarkHit.objects.filter(dark_document_id__in=deferred_ids).update(last_seen_at=now)
+
+    def _store_document(self, crawl, doc_url, future, validators):
+        try:
+            markup, status, final_url, doc_bytes = future.result()
+            crawl.bytes_received += doc_bytes
+            crawl.documents_fetched += 1
+            if status == 304 and doc_url in crawl.documents:
+                crawl.documents_not_modified += 1
+                self._mark_not_modified(crawl.documents[doc_url], validators)
+                return
+            created_count, updated_count = self._upsert_document_and_hits(
+                source=crawl.source,
+                doc_url=doc_url,
+                final_url=final_url,
+                status=status,
+                markup=markup,
+                validators=validators,
             )
+            crawl.hits_new += created_count
+            crawl.hits_updated += updated_count
         except Exception as exc:
+            crawl.errors.append(f"{doc_url}: {exc}")
+
+    def _finish_crawl(self, crawl):
+        source = crawl.source
+        run = crawl.run
+        if crawl.failure is not None:
             run.ok = False
-            run.error = str(exc)[:4000]
-            run.finished_at = timezone.now()
-            run.duration_ms = int((time.monotonic() - started) * 1000)
-            run.bytes_received = bytes_received_total
-            run.documents_discovered = docs_discovered
-            run.documents_fetched = docs_fetched
-            run.hits_new = hits_new
-            run.hits_updated = hits_updated
-            run.save()
-            self.stderr.write(self.style.ERROR(f"[{source.id}] {source.name}: {exc}"))
-
-    def _discover_documents(self, source: DarkSource):
+            run.error = str(crawl.failure)[:4000]
+        else:
+            run.ok = len(crawl.errors) == 0
+            if crawl.errors:
+                run.error = "; ".join(crawl.errors)[:4000]
+        run.bytes_received = crawl.bytes_received
+        run.documents_discovered = crawl.documents_discovered
+        run.documents_fetched = crawl.documents_fetched
+        run.documents_not_modified = crawl.documents_not_modified
+        run.documents_deferred = crawl.documents_deferred
+        run.hits_new = crawl.hits_new
+        run.hits_updated = crawl.hits_updated
+        run.finished_at = timezone.now()
+        run.duration_ms = int((time.monotonic() - crawl.started) * 1000)
+        run.save()
+
+        if crawl.failure is not None:
+            self.stderr.write(self.style.ERROR(f"[{source.id}] {source.name}: {crawl.failure}"))
+            return
+        style = self.style.SUCCESS if run.ok else self.style.WARNING
+        self.stdout.write(
+            style(
+                f"[{source.id}] {source.name}: "
+                f"docs={crawl.documents_fetched}/{crawl.documents_discovered} "
+                f"not_modified={crawl.documents_not_modified} deferred={crawl.documents_deferred} "
+                f"hits_new={crawl.hits_new} hits_updated={crawl.hits_updated} "
+                f"bytes={crawl.bytes_received}"
+            )
+        )
+
+    def _discover_documents(self, source: DarkSource, *, slot: int = 0):
         source_type = source.source_type
         if source_type == DarkSource.SourceType.SINGLE_PAGE:
             return [source.url], None, source.url, 0
 
-        markup, status, final_url, bytes_received = self._fetch_with_retries(source.url, source)
+        markup, status, final_url, bytes_received = self._fetch_with_retries(
+            source.url, source, slot=slot
+        )
         if source_type == DarkSource.SourceType.INDEX_PAGE:
             links = extract_links(
                 markup,
@@ -188,7 +396,27 @@ class Command(BaseCommand):
 
         raise ValueError(f"Unsupported dark source type: {source_type}")
 
-    def _upsert_document_and_hits(self, *, source, doc_url, final_url, status, markup):
+    def _mark_not_modified(self, document, validators):
+        """Record a ``304`` for ``document``: its content and hits are still current."""
+        now = timezone.now()
+        unchanged_runs = document.unchanged_runs + 1
+        with transaction.atomic():
+            DarkDocument.objects.filter(pk=document.pk).update(
+                http_etag=validators.get("etag") or document.http_etag,
+                http_last_modified=validators.get("last_modified") or document.http_last_modified,
+                unchanged_runs=unchanged_runs,
+                next_fetch_at=_next_fetch_at(unchanged_runs, now),
+                last_seen=now,
+                last_fetched_at=now,
+                last_http_status=304,
+                last_error="",
+                active=True,
+            )
+            DarkHit.objects.filter(dark_document=document).update(last_seen_at=now)
+
+    def _upsert_document_and_hits(
+        self, *, source, doc_url, final_url, status, markup, validators=None
+    ):
         summary = summarize_profile_content(
             markup,
             profile=source.extractor_profile,
@@ -199,7 +427,18 @@ class Command(BaseCommand):
         excerpt = sanitize_summary(summary["excerpt"])
         records = summary["records"]
         content_hash = build_content_hash(url=final_url or doc_url, title=title, text=text)
+        watch_config_hash = build_watch_config_hash(
+            extractor_profile=source.extractor_profile,
+            watch_keywords=source.watch_keywords,
+            watch_regex=source.watch_regex,
+        )
         canonical_url = canonicalize_url(final_url or doc_url)
+        http_validators = {}
+        if validators is not None:
+            http_validators = {
+                "http_etag": validators.get("etag", ""),
+                "http_last_modified": validators.get("last_modified", ""),
+            }
 
         now = timezone.now()
         with transaction.atomic():
@@ -211,20 +450,31 @@ class Command(BaseCommand):
                     "title": title,
                     "excerpt": excerpt,
                     "content_hash": content_hash,
+                    "watch_config_hash": watch_config_hash,
                     "first_seen": now,
                     "last_seen": now,
                     "last_fetched_at": now,
                     "last_http_status": status,
                     "last_error": "",
                     "active": True,
+                    **http_validators,
                 },
             )
             if not created:
                 previous_hash = document.content_hash
+                previous_watch_config_hash = document.watch_config_hash
+                if previous_hash == content_hash:
+                    document.unchanged_runs += 1
+                else:
+                    document.unchanged_runs = 0
+                document.next_fetch_at = _next_fetch_at(document.unchanged_runs, now)
+                for name, value in http_validators.items():
+                    setattr(document, name, value)
                 document.url = doc_url
                 document.title = title
                 document.excerpt = excerpt
                 document.content_hash = content_hash
+                document.watch_config_hash = watch_config_hash
                 document.last_seen = now
                 document.last_fetched_at = now
                 document.last_http_status = status
@@ -239,6 +489,13 @@ class Command(BaseCommand):
                         excerpt=excerpt,
                         raw=markup[:4000],
                     )
+                elif previous_watch_config_hash == watch_config_hash:
+                    # Same records matched against the same watch settings: the
+                    # hits and their alert state are current, only mark them seen.
+                    hits_updated = DarkHit.objects.filter(
+                        dark_source=source, dark_document=document
+                    ).update(last_seen_at=now)
+                    return 0, hits_updated
             else:
                 DarkSnapshot.objects.create(
                     dark_document=document,
@@ -276,6 +533,7 @@ class Command(BaseCommand):
                 )
                 structured_hits_by_identity.setdefault(identity_hash, existing_hit)
 
+            matched_records = []
             for record in records:
                 normalized_group_name = resolve_group_name(
                     record_type=record.record_type,
@@ -326,12 +584,26 @@ class Command(BaseCommand):
                     group_name=normalized_group_name,
                     url=record_values["url"],
                 )
+                matched_records.append((record, match_result, record_values, alert_identity_hash))
+
+            alert_history = _load_alert_history(
+                source,
+                {alert_identity_hash for *_values, alert_identity_hash in matched_records},
+                known_hits=existing_hits,
+            )
+            new_hits = []
+            changed_hits = {}
+            pending_alerts = []
+            for record, match_result, record_values, alert_identity_hash in matched_records:
+                keyword_matches = match_result.keywords
+                regex_matches = match_result.regex
+                is_watch_match = record_values["is_watch_match"]
                 alert_fingerprint = build_dark_hit_alert_fingerprint(
                     record_type=record.record_type,
                     title=record.title,
                     excerpt=record_values["excerpt"],
                     victim_name=record.victim_name,
-                    group_name=normalized_group_name,
+                    group_name=record_values["group_name"],
                     country=record.country,
                     industry=record.industry,
                     website_url=record.website_url,
@@ -344,7 +616,7 @@ class Command(BaseCommand):
                         record_type=record.record_type,
                         title=record.title,
                         victim_name=record.victim_name,
-                        group_name=normalized_group_name,
+                        group_name=record_values["group_name"],
                         url=record_values["url"],
                         fallback_url=fallback_hit_url,
                     )
@@ -359,11 +631,11 @@ class Command(BaseCommand):
 
                 if hit is None:
                     previous_alert_hit = _latest_alerted_dark_hit(
-                        source=source,
+                        alert_history,
                         hit=None,
                         alert_identity_hash=alert_identity_hash,
                     )
-                    hit = DarkHit.objects.create(
+                    hit = DarkHit(
                         dark_source=source,
                         dark_document=document,
                         content_hash=hit_hash,
@@ -371,6 +643,7 @@ class Command(BaseCommand):
                         last_seen_at=now,
                         **record_values,
                     )
+                    new_hits.append(hit)
                     hits_by_hash[hit_hash] = hit
                     if store_structured_records:
                         structured_hits_by_identity[hit_hash] = hit
@@ -386,26 +659,21 @@ class Command(BaseCommand):
                             keyword_matches=keyword_matches,
                             regex_matches=regex_matches,
                         )
-                        send_dark_hit_alert(
-                            hit,
-                            matched_fields=match_result.fields,
-                            why_alerted=alert_reason,
-                        )
+                        pending_alerts.append((hit, match_result.fields, alert_reason))
                         hit.last_alerted_at = now
                         hit.last_alert_fingerprint = alert_fingerprint
-                        hit.save(update_fields=["last_alerted_at", "last_alert_fingerprint"])
                     elif (
                         previous_alert_hit is not None
                         and previous_alert_hit.last_alert_fingerprint == alert_fingerprint
                     ):
                         hit.last_alerted_at = previous_alert_hit.last_alerted_at
                         hit.last_alert_fingerprint = previous_alert_hit.last_alert_fingerprint
-                        hit.save(update_fields=["last_alerted_at", "last_alert_fingerprint"])
+                    alert_history[alert_identity_hash].append(hit)
                     hits_new += 1
                     continue
 
                 previous_alert_hit = _latest_alerted_dark_hit(
-                    source=source,
+                    alert_history,
                     hit=hit,
                     alert_identity_hash=alert_identity_hash,
                 )
@@ -423,67 +691,72 @@ class Command(BaseCommand):
                         regex_matches=regex_matches,
                     )
 
-                hit.matched_keywords = keyword_matches
-                hit.matched_regex = regex_matches
-                hit.is_watch_match = is_watch_match
+                for name, value in record_values.items():
+                    setattr(hit, name, value)
                 hit.alert_identity_hash = alert_identity_hash
-                hit.record_type = record_values["record_type"]
-                hit.group_name = record_values["group_name"]
-                hit.victim_name = record_values["victim_name"]
-                hit.country = record_values["country"]
-                hit.industry = record_values["industry"]
-                hit.website_url = record_values["website_url"]
-                hit.victim_count = record_values["victim_count"]
-                hit.last_activity_text = record_values["last_activity_text"]
-                hit.title = record_values["title"]
-                hit.excerpt = record_values["excerpt"]
-                hit.url = record_values["url"]
-                hit.raw = record_values["raw"]
                 hit.content_hash = hit_hash
                 hit.last_seen_at = now
-                hit.save()
+                if hit.pk is not None:
+                    changed_hits[hit.pk] = hit
                 hits_by_hash[hit_hash] = hit
                 if store_structured_records:
                     structured_hits_by_identity[hit_hash] = hit
                 if alert_reason:
-                    send_dark_hit_alert(
-                        hit,
-                        matched_fields=match_result.fields,
-                        why_alerted=alert_reason,
-                    )
+                    pending_alerts.append((hit, match_result.fields, alert_reason))
                     hit.last_alerted_at = now
                     hit.last_alert_fingerprint = alert_fingerprint
-                    hit.save(update_fields=["last_alerted_at", "last_alert_fingerprint"])
                 elif (
                     previous_alert_hit is not None
                     and previous_alert_hit.last_alert_fingerprint == alert_fingerprint
-                    and (
-                        hit.last_alerted_at != previous_alert_hit.last_alerted_at
-                        or hit.last_alert_fingerprint != previous_alert_hit.last_alert_fingerprint
-                    )
                 ):
                     hit.last_alerted_at = previous_alert_hit.last_alerted_at
                     hit.last_alert_fingerprint = previous_alert_hit.last_alert_fingerprint
-                    hit.save(update_fields=["last_alerted_at", "last_alert_fingerprint"])
+                if not any(known is hit for known in alert_history[alert_identity_hash]):
+                    alert_history[alert_identity_hash].append(hit)
                 hits_updated += 1
+
+            # Updates first: they can release content hashes the new rows reuse.
+            if changed_hits:
+                DarkHit.objects.bulk_update(list(changed_hits.values()), _DARK_HIT_UPDATE_FIELDS)
+            if new_hits:
+                DarkHit.objects.bulk_create(new_hits)
+            for hit, matched_fields, alert_reason in pending_alerts:
+                send_dark_hit_alert(hit, matched_fields=matched_fields, why_alerted=alert_reason)
             return hits_new, hits_updated
 
-    def _fetch_with_retries(self, url: str, source: DarkSource):
+    def _fetch_with_retries(
+        self, url: str, source: DarkSource, *, slot: int = 0, document=None, validators=None
+    ):
         retries = max(source.effective_fetch_retries(), 1)
         last_error = None
         for attempt in range(1, retries + 1):
             try:
-                return self._fetch_once(url, source)
+                return self._fetch_once(
+                    url, source, slot=slot, document=document, validators=validators
+                )
             except Exception as exc:
                 last_error = exc
                 if attempt < retries:
                     time.sleep(2 ** (attempt - 1))
         raise RuntimeError(f"Failed to fetch after {retries} attempt(s): {last_error}")
 
-    def _fetch_once(self, url: str, source: DarkSource):
-        kwargs = self._request_kwargs(url, source)
-        response = requests.get(url, **kwargs)
+    def _fetch_once(
+        self, url: str, source: DarkSource, *, slot: int = 0, document=None, validators=None
+    ):
+        kwargs = self._request_kwargs(url, source, slot=slot)
+        if document is not None:
+            if document.http_etag:
+                kwargs["headers"]["If-None-Match"] = document.http_etag
+            if document.http_last_modified:
+                kwargs["headers"]["If-Modified-Since"] = document.http_last_modified
+        response = http_session().get(url, **kwargs)
         response.raise_for_status()
+        if validators is not None:
+            validators["etag"] = (response.headers.get("ETag") or "")[:255]
+            validators["last_modified"] = (response.headers.get("Last-Modified") or "")[:64]
+        if response.status_code == 304 and document is not None:
+            response.close()
+            return "", response.status_code, response.url, 0
 
         max_bytes = source.effective_max_bytes()
         size = 0
@@ -500,7 +773,7 @@ class Command(BaseCommand):
         markup = b"".join(chunks).decode("utf-8", errors="replace")
         return markup, response.status_code, response.url, size
 
-    def _request_kwargs(self, url: str, source: DarkSource):
+    def _request_kwargs(self, url: str, source: DarkSource, *, slot: int = 0):
         kwargs = {
             "headers": {"User-Agent": settings.INTEL_USER_AGENT},
             "timeout": source.effective_timeout_seconds(),
@@ -508,6 +781,8 @@ class Command(BaseCommand):
         }
         if self._should_use_tor(url, source) and settings.TOR_ENABLED:
             socks_url = settings.DARK_TOR_SOCKS_URL
+            if settings.DARK_TOR_ISOLATE_STREAMS:
+                socks_url = _isolated_socks_url(socks_url, source=source, slot=slot)
             kwargs["proxies"] = {
                 "http": socks_url,
                 "https": socks_url,
@@ -1,16 +1,24 @@
+import hashlib
+import threading
 import time
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 
-import requests
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db.models import Q
 from django.utils import timezone
 
+from intel.cache import batched_invalidation, bump_public_cache_version
+from intel.http import close_sessions, http_session, pool_summary
 from intel.ingestion import (
+    NormalizedEntry,
+    fetches_during_parse,
     is_valid_normalized_entry,
     parse_feed_payload,
-    upsert_normalized_item,
+    upsert_normalized_items,
 )
 from intel.models import Feed, FetchRun
 from intel.notifications import (
@@ -21,6 +29,20 @@ from intel.notifications import (
 )
 
 
+@dataclass(slots=True)
+class FeedFetchResult:
+    feed: Feed
+    started_at: datetime
+    started: float
+    http_status: int | None = None
+    not_modified: bool = False
+    payload_unchanged: bool = False
+    payload_hash: str = ""
+    validators: dict[str, str] | None = None
+    entries: list[NormalizedEntry] = field(default_factory=list)
+    error: Exception | None = None
+
+
 class Command(BaseCommand):
     help = "Fetch enabled feeds and upsert deduplicated items."
 
@@ -49,6 +71,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Use feed expanded collection settings for this run.",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Ignore stored ETag/Last-Modified validators and download every feed in full.",
+        )
 
     def handle(self, *args, **options):
         feeds = Feed.objects.filter(enabled=True, source__enabled=True).select_related("source")
@@ -66,111 +93,228 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("No enabled feeds matched."))
             return
 
-        total_new = 0
-        total_updated = 0
-        total_skipped_old = 0
-        total_skipped_invalid = 0
-        total_fetched = 0
-        total_limited = 0
+        feeds = list(feeds)
+        totals = {
+            "new": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "skipped_old": 0,
+            "skipped_invalid": 0,
+            "fetched": 0,
+            "limited": 0,
+            "skipped_unchanged": 0,
+        }
+
+        # Scoped backfills and dry-runs must see the full body, so they skip conditional GETs.
+        conditional = not (
+            options.get("force")
+            or options.get("dry_run")
+            or options.get("expanded")
+            or options.get("since_days") is not None
+            or options.get("max_items") is not None
+        )
 
-        for feed in feeds:
-            run = FetchRun.objects.create(feed=feed, started_at=timezone.now())
-            started = time.monotonic()
-            try:
-                payload, status = self._fetch_with_retries(feed)
-                run.http_status = status
-                fetched_at = run.started_at
-
-                entries = parse_feed_payload(feed, payload, fetched_at=fetched_at)
-                max_items, max_age_days = self._effective_limits(feed, options)
-                cutoff = fetched_at - timedelta(days=max_age_days)
-
-                run.items_fetched = len(entries)
-                run.items_limited = max(0, len(entries) - max_items)
-
-                items_new = 0
-                items_updated = 0
-                skipped_old = 0
-                skipped_invalid = 0
-                processed_entries = 0
-
-                for entry in entries[:max_items]:
-                    processed_entries += 1
-                    if not is_valid_normalized_entry(entry, feed=feed):
-                        skipped_invalid += 1
-                        continue
-                    if entry.published_at < cutoff:
-                        skipped_old += 1
-                        continue
-
-                    if options["dry_run"]:
-                        continue
-
-                    item, created = upsert_normalized_item(feed, entry)
-                    if created:
-                        items_new += 1
-                        if feed.adapter_key == "epss":
-                            send_high_epss_alert(item)
-                        elif feed.adapter_key == "ransomware_live_victims":
-                            send_ransomware_victim_alert(item)
-                        else:
-                            generic_alert_context = get_generic_intel_alert_context(item)
-                            if generic_alert_context:
-                                send_generic_intel_alert(item, **generic_alert_context)
-                    else:
-                        items_updated += 1
+        # Fetch and parse run concurrently; every DB write stays on this thread.
+        host_limits = self._host_limits(feeds)
+        workers = max(1, min(settings.INTEL_FETCH_CONCURRENCY, len(feeds)))
+        # Public pages are rebuilt once, after the whole run has committed.
+        with batched_invalidation(), ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ingest-fetch"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._fetch_and_parse,
+                    feed,
+                    host_limits[self._host_key(feed)],
+                    conditional=conditional,
+                )
+                for feed in feeds
+            ]
+            for future in as_completed(futures):
+                self._store_result(future.result(), options, totals)
+        bump_public_cache_version()
+        self.stdout.write(pool_summary())
+        close_sessions()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Done. "
+                f"fetched={totals['fetched']}, new={totals['new']}, updated={totals['updated']}, "
+                f"unchanged={totals['unchanged']}, "
+                f"skipped_old={totals['skipped_old']}, skipped_invalid={totals['skipped_invalid']}, "
+                f"limited={totals['limited']}, skipped_unchanged={totals['skipped_unchanged']}"
+            )
+        )
+
+    def _fetch_and_parse(
+        self, feed: Feed, host_limit: threading.Semaphore, *, conditional: bool = False
+    ) -> FeedFetchResult:
+        result = FeedFetchResult(feed=feed, started_at=timezone.now(), started=time.monotonic())
+        validators = {} if conditional else None
+        # A 304 or an unchanged body on the feed URL would also skip the adapter's own searches.
+        incremental = conditional and not fetches_during_parse(feed)
+        try:
+            with host_limit:
+                payload, status = self._fetch_with_retries(
+                    feed, conditional=incremental, validators=validators
+                )
+            result.http_status = status
+            result.validators = validators
+            if status == 304:
+                result.not_modified = True
+                return result
+            result.payload_hash = hashlib.sha256(payload).hexdigest()
+            if incremental and feed.payload_hash == result.payload_hash:
+                result.payload_unchanged = True
+                return result
+            result.entries = parse_feed_payload(feed, payload, fetched_at=result.started_at)
+        except Exception as exc:
+            result.error = exc
+        return result
+
+    def _store_result(self, result: FeedFetchResult, options, totals: dict):
+        feed = result.feed
+        run = FetchRun.objects.create(
+            feed=feed,
+            started_at=result.started_at,
+            http_status=result.http_status,
+        )
+        try:
+            if result.error is not None:
+                raise result.error
 
+            if result.not_modified or result.payload_unchanged:
                 run.ok = True
-                run.items_new = items_new
-                run.items_updated = items_updated
-                run.items_stored = items_new + items_updated
-                run.items_deduped = items_updated
-                run.items_skipped_old = skipped_old
-                run.items_skipped_invalid = skipped_invalid
+                run.not_modified = result.not_modified
+                run.items_skipped_unchanged = feed.payload_entries
                 run.finished_at = timezone.now()
-                run.duration_ms = int((time.monotonic() - started) * 1000)
+                run.duration_ms = int((time.monotonic() - result.started) * 1000)
                 run.save()
 
                 feed.last_success_at = run.finished_at
                 feed.last_error = ""
                 feed.save(update_fields=["last_success_at", "last_error", "updated_at"])
 
-                total_new += items_new
-                total_updated += items_updated
-                total_skipped_old += skipped_old
-                total_skipped_invalid += skipped_invalid
-                total_fetched += run.items_fetched
-                total_limited += run.items_limited
-
+                totals["skipped_unchanged"] += run.items_skipped_unchanged
+                reason = "not modified" if result.not_modified else "payload unchanged"
                 self.stdout.write(
                     self.style.SUCCESS(
-                        f"[{feed.id}] {feed.name}: "
-                        f"fetched={run.items_fetched} limited={run.items_limited} "
-                        f"stored={run.items_stored} (new={items_new} deduped={items_updated}) "
-                        f"skip_old={skipped_old} skip_invalid={skipped_invalid} "
-                        f"processed={processed_entries} window={max_age_days}d"
+                        f"[{feed.id}] {feed.name}: {reason} "
+                        f"skip_unchanged={run.items_skipped_unchanged}"
                     )
                 )
-            except Exception as exc:
-                run.ok = False
-                run.error = str(exc)[:4000]
-                run.finished_at = timezone.now()
-                run.duration_ms = int((time.monotonic() - started) * 1000)
-                run.save()
-
-                feed.last_error = str(exc)[:2000]
-                feed.save(update_fields=["last_error", "updated_at"])
-
-                self.stderr.write(self.style.ERROR(f"[{feed.id}] {feed.name}: {exc}"))
-
-        self.stdout.write(
-            self.style.SUCCESS(
-                "Done. "
-                f"fetched={total_fetched}, new={total_new}, deduped={total_updated}, "
-                f"skipped_old={total_skipped_old}, skipped_invalid={total_skipped_invalid}, "
-                f"limited={total_limited}"
+                return
+
+            entries = result.entries
+            max_items, max_age_days = self._effective_limits(feed, options)
+            cutoff = result.started_at - timedelta(days=max_age_days)
+
+            run.items_fetched = len(entries)
+            run.items_limited = max(0, len(entries) - max_items)
+
+            items_new = 0
+            items_updated = 0
+            items_unchanged = 0
+            skipped_old = 0
+            skipped_invalid = 0
+            processed_entries = 0
+            batch = []
+
+            for entry in entries[:max_items]:
+                processed_entries += 1
+                if not is_valid_normalized_entry(entry, feed=feed):
+                    skipped_invalid += 1
+                    continue
+                if entry.published_at < cutoff:
+                    skipped_old += 1
+                    continue
+                if not options["dry_run"]:
+                    batch.append(entry)
+
+            for upserted in upsert_normalized_items(feed, batch):
+                item = upserted.item
+                if upserted.created:
+                    items_new += 1
+                    if feed.adapter_key == "epss":
+                        send_high_epss_alert(item)
+                    elif feed.adapter_key == "ransomware_live_victims":
+                        send_ransomware_victim_alert(item)
+                    else:
+                        generic_alert_context = get_generic_intel_alert_context(item)
+                        if generic_alert_context:
+                            send_generic_intel_alert(item, **generic_alert_context)
+                elif upserted.changed:
+                    items_updated += 1
+                else:
+                    items_unchanged += 1
+
+            run.ok = True
+            run.items_new = items_new
+            run.items_updated = items_updated
+            run.items_unchanged = items_unchanged
+            run.items_stored = items_new + items_updated
+            run.items_deduped = items_updated + items_unchanged
+            run.items_skipped_old = skipped_old
+            run.items_skipped_invalid = skipped_invalid
+            run.finished_at = timezone.now()
+            run.duration_ms = int((time.monotonic() - result.started) * 1000)
+            run.save()
+
+            feed.last_success_at = run.finished_at
+            feed.last_error = ""
+            update_fields = ["last_success_at", "last_error", "updated_at"]
+            if result.validators is not None:
+                feed.http_etag = result.validators.get("etag", "")
+                feed.http_last_modified = result.validators.get("last_modified", "")
+                feed.payload_hash = result.payload_hash
+                feed.payload_entries = len(entries)
+                update_fields.extend(
+                    ["http_etag", "http_last_modified", "payload_hash", "payload_entries"]
+                )
+            feed.save(update_fields=update_fields)
+
+            totals["new"] += items_new
+            totals["updated"] += items_updated
+            totals["unchanged"] += items_unchanged
+            totals["skipped_old"] += skipped_old
+            totals["skipped_invalid"] += skipped_invalid
+            totals["fetched"] += run.items_fetched
+            totals["limited"] += run.items_limited
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[{feed.id}] {feed.name}: "
+                    f"fetched={run.items_fetched} limited={run.items_limited} "
+                    f"stored={run.items_stored} (new={items_new} updated={items_updated}) "
+                    f"unchanged={items_unchanged} "
+                    f"skip_old={skipped_old} skip_invalid={skipped_invalid} "
+                    f"processed={processed_entries} window={max_age_days}d"
+                )
             )
-        )
+        except Exception as exc:
+            run.ok = False
+            run.error = str(exc)[:4000]
+            run.finished_at = timezone.now()
+            run.duration_ms = int((time.monotonic() - result.started) * 1000)
+            run.save()
+
+            feed.last_error = str(exc)[:2000]
+            feed.save(update_fields=["last_error", "updated_at"])
+
+            self.stderr.write(self.style.ERROR(f"[{feed.id}] {feed.name}: {exc}"))
+
+    def _host_key(self, feed: Feed) -> str:
+        try:
+            return (urlsplit(feed.url).hostname or "").lower()
+        except ValueError:
+            return ""
+
+    def _host_limits(self, feeds) -> dict[str, threading.Semaphore]:
+        per_host = max(1, settings.INTEL_FETCH_PER_HOST_CONCURRENCY)
+        return {
+            host: threading.BoundedSemaphore(per_host)
+            for host in {self._host_key(feed) for feed in feeds}
+        }
 
     def _effective_limits(self, feed: Feed, options):
         since_override = options.get("since_days")
@@ -191,13 +335,13 @@ class Command(BaseCommand):
 
         return max_items, max_age_days
 
-    def _fetch_with_retries(self, feed):
+    def _fetch_with_retries(self, feed, *, conditional=False, validators=None):
         retries = max(settings.INTEL_FETCH_RETRIES, 1)
         last_error = None
 
         for attempt in range(1, retries + 1):
             try:
-                return self._fetch_once(feed)
+                return self._fetch_once(feed, conditional=conditional, validators=validators)
             except Exception as exc:
                 last_error = exc
                 if attempt < retries:
@@ -207,23 +351,36 @@ class Command(BaseCommand):
             f"Failed to fetch feed after {retries} attempt(s): {last_error}"
         )
 
-    def _fetch_once(self, feed):
+    def _fetch_once(self, feed, *, conditional=False, validators=None):
         timeout = max(1, min(feed.timeout_seconds, settings.INTEL_FETCH_TIMEOUT))
         max_bytes = max(1, min(feed.max_bytes, settings.FEED_MAX_BYTES))
 
-        response = requests.get(
+        headers = {
+            "User-Agent": settings.INTEL_USER_AGENT,
+            "Accept": (
+                "application/rss+xml, application/atom+xml, application/xml;q=0.9, "
+                "application/json;q=0.9, */*;q=0.8"
+            ),
+        }
+        if conditional:
+            if feed.http_etag:
+                headers["If-None-Match"] = feed.http_etag
+            if feed.http_last_modified:
+                headers["If-Modified-Since"] = feed.http_last_modified
+
+        response = http_session().get(
             feed.url,
-            headers={
-                "User-Agent": settings.INTEL_USER_AGENT,
-                "Accept": (
-                    "application/rss+xml, application/atom+xml, application/xml;q=0.9, "
-                    "application/json;q=0.9, */*;q=0.8"
-                ),
-            },
+            headers=headers,
             timeout=timeout,
             stream=True,
         )
         response.raise_for_status()
+        if validators is not None:
+            validators["etag"] = (response.headers.get("ETag") or "")[:255]
+            validators["last_modified"] = (response.headers.get("Last-Modified") or "")[:64]
+        if response.status_code == 304:
+            response.close()
+            return b"", response.status_code
 
         size = 0
         chunks = []
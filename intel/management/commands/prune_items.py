@@ -3,7 +3,17 @@ from datetime import timedelta
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
-from intel.models import Feed, Item
+from intel.cache import bump_public_cache_version
+from intel.models import (
+    Feed,
+    Item,
+    OutboundAlert,
+    item_stat_keys,
+    refresh_source_daily_stats,
+)
+from intel.search import prune_search_index
+
+SENT_ALERT_RETENTION = timedelta(days=7)
 
 
 class Command(BaseCommand):
@@ -22,6 +32,7 @@ class Command(BaseCommand):
         dry_run = options["dry_run"]
         now = timezone.now()
         total = 0
+        stat_keys = set()
 
         for feed in Feed.objects.all().order_by("id"):
             cutoff = now - timedelta(days=feed.max_age_days + 30)
@@ -36,9 +47,26 @@ class Command(BaseCommand):
                     f"[dry-run] [{feed.id}] {feed.name}: {count} would be deleted"
                 )
             else:
+                stat_keys.update(item_stat_keys(queryset))
                 queryset.delete()
                 self.stdout.write(f"[{feed.id}] {feed.name}: deleted {count}")
 
+        if not dry_run and total:
+            prune_search_index()
+            refresh_source_daily_stats(stat_keys)
+            bump_public_cache_version()
+
+        sent_alerts = OutboundAlert.objects.filter(
+            status=OutboundAlert.Status.SENT,
+            sent_at__lt=now - SENT_ALERT_RETENTION,
+        )
+        if dry_run:
+            self.stdout.write(f"[dry-run] sent alerts: {sent_alerts.count()} would be deleted")
+        else:
+            alerts_deleted, _ = sent_alerts.delete()
+            if alerts_deleted:
+                self.stdout.write(f"Sent alerts: deleted {alerts_deleted}")
+
         if dry_run:
             self.stdout.write(self.style.SUCCESS(f"Dry-run complete. would_delete={total}"))
         else:
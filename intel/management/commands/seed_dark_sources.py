@@ -1,8 +1,8 @@
 import sys
 
-import requests
 from django.core.management.base import BaseCommand
 
+from intel.http import http_session
 from intel.models import DarkSource
 
 RANSOMWARE_LIVE_API = "https://api.ransomware.live/v2/groups"
@@ -67,7 +67,7 @@ def _pick_available_page(pages: list) -> dict | None:
 
 def _fetch_ransomwatch() -> list:
     """Fetch and return the ransomware.live groups list. Raises on error."""
-    response = requests.get(
+    response = http_session().get(
         RANSOMWARE_LIVE_API,
         timeout=RANSOMWATCH_TIMEOUT,
         stream=True,
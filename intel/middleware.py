@@ -0,0 +1,44 @@
+import time
+
+from django.conf import settings
+from django.db import connection
+
+
+class _QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+class QueryTimingMiddleware:
+    """Report the request's database query count and time in a ``Server-Timing`` header.
+
+    The header is only sent in DEBUG or to superusers, and shows up in the
+    browser's network panel next to each response.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = _QueryStats()
+        started = time.perf_counter()
+        with connection.execute_wrapper(stats):
+            response = self.get_response(request)
+        total = time.perf_counter() - started
+
+        user = getattr(request, "user", None)
+        if settings.DEBUG or (user is not None and user.is_superuser):
+            response["Server-Timing"] = (
+                f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+                f"app;dur={total * 1000:.1f}"
+            )
+        return response
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0011_darkhit_alert_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feed',
+            name='http_etag',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='http_last_modified',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='fetchrun',
+            name='not_modified',
+            field=models.BooleanField(default=False),
+        ),
+    ]
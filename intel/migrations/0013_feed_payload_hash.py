@@ -0,0 +1,28 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0012_feed_http_validators'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feed',
+            name='payload_entries',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='payload_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='fetchrun',
+            name='items_skipped_unchanged',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0013_feed_payload_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fetchrun',
+            name='items_unchanged',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='content_fingerprint',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
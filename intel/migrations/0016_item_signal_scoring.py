@@ -0,0 +1,186 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:40
+
+import re
+
+from django.db import migrations, models
+
+# Frozen copy of intel.scoring as of this migration, so later scoring changes
+# do not alter what the historical backfill computes.
+EXPLOIT_KEYWORDS = (
+    "actively exploited",
+    "exploited in the wild",
+    "in the wild",
+    "zero-day",
+    "0day",
+    "kev",
+    "authentication bypass",
+    "remote code execution",
+    "rce",
+)
+RANSOMWARE_KEYWORDS = (
+    "ransomware",
+    "extortion",
+    "leak site",
+    "data leak",
+    "victim listing",
+)
+LOW_SIGNAL_TITLE_HINTS = (
+    "release notes",
+    "release note",
+    "maintenance release",
+    "maintenance update",
+    "version ",
+    "version:",
+    "product update",
+    "feature update",
+    "service update",
+    "platform update",
+    "minor update",
+    "release announcement",
+    "now available",
+)
+HIGH_SIGNAL_KEYWORDS = (
+    "actively exploited",
+    "zero-day",
+    "0day",
+    "kev",
+    "rce",
+    "critical",
+    "remote code",
+    "authentication bypass",
+)
+URGENT_KEYWORDS = ("critical", "urgent", "emergency")
+SECTION_WEIGHTS = {
+    "advisories": 8,
+    "sweden": 4,
+    "research": 3,
+}
+CVE_RE = re.compile(r"\bCVE-\d{4}-\d+\b", re.IGNORECASE)
+
+
+def _extract_cve_ids(text):
+    seen = set()
+    cves = []
+    for match in CVE_RE.findall(text or ""):
+        cve = match.upper()
+        if cve in seen:
+            continue
+        seen.add(cve)
+        cves.append(cve)
+    return cves
+
+
+def _item_signal(title, summary, *, section, adapter_key):
+    lowered_title = (title or "").lower()
+    lowered_text = f"{title or ''}\n{summary or ''}".lower()
+    cves = _extract_cve_ids(f"{title or ''}\n{summary or ''}")
+
+    exploit_keyword = any(keyword in lowered_text for keyword in EXPLOIT_KEYWORDS)
+    ransomware_keyword = any(keyword in lowered_text for keyword in RANSOMWARE_KEYWORDS)
+    high_signal_keyword = any(keyword in lowered_text for keyword in HIGH_SIGNAL_KEYWORDS)
+    urgent = any(keyword in lowered_text for keyword in URGENT_KEYWORDS)
+    low_signal_title = any(hint in lowered_title for hint in LOW_SIGNAL_TITLE_HINTS)
+
+    has_exploitation = section == "active" or exploit_keyword
+    has_ransomware = adapter_key == "ransomware_live_victims" or ransomware_keyword
+
+    score = 0
+    if has_exploitation:
+        score += 24
+    if has_ransomware:
+        score += 20
+    if cves:
+        score += 18 + min(len(cves), 3) * 2
+    if high_signal_keyword:
+        score += 12
+    if urgent:
+        score += 8
+    score += SECTION_WEIGHTS.get(section, 0)
+    if low_signal_title and not (cves or has_exploitation or has_ransomware or high_signal_keyword):
+        score -= 18
+
+    label = ""
+    if has_exploitation:
+        label = "Active exploitation"
+    elif has_ransomware:
+        label = "Ransomware"
+    elif cves and urgent:
+        label = "Critical CVE"
+    elif cves:
+        label = "CVE-driven"
+    elif high_signal_keyword or urgent:
+        label = "Urgent"
+
+    flags = [
+        flag
+        for flag, present in (
+            ("exploit_keyword", exploit_keyword),
+            ("ransomware_keyword", ransomware_keyword),
+            ("high_signal_keyword", high_signal_keyword),
+            ("urgent", urgent),
+            ("low_signal_title", low_signal_title),
+        )
+        if present
+    ]
+    return score, label, flags, cves
+
+
+def backfill_item_signals(apps, schema_editor):
+    Item = apps.get_model("intel", "Item")
+    batch = []
+    queryset = Item.objects.select_related("feed").only(
+        "id", "title", "summary", "feed__section", "feed__adapter_key"
+    )
+    for item in queryset.iterator(chunk_size=500):
+        (
+            item.signal_score,
+            item.signal_category,
+            item.signal_flags,
+            item.cve_ids,
+        ) = _item_signal(
+            item.title,
+            item.summary,
+            section=item.feed.section,
+            adapter_key=item.feed.adapter_key,
+        )
+        batch.append(item)
+        if len(batch) >= 500:
+            Item.objects.bulk_update(
+                batch, ["signal_score", "signal_category", "signal_flags", "cve_ids"]
+            )
+            batch = []
+    if batch:
+        Item.objects.bulk_update(
+            batch, ["signal_score", "signal_category", "signal_flags", "cve_ids"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0015_outboundalert'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='item',
+            name='cve_ids',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='signal_category',
+            field=models.CharField(blank=True, db_index=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='signal_flags',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='signal_score',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(backfill_item_signals, migrations.RunPython.noop),
+    ]
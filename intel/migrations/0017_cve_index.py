@@ -0,0 +1,73 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_item_cves(apps, schema_editor):
+    Item = apps.get_model("intel", "Item")
+    Cve = apps.get_model("intel", "Cve")
+    ItemCve = apps.get_model("intel", "ItemCve")
+
+    rows = list(
+        Item.objects.exclude(cve_ids=[]).values_list("id", "cve_ids", "published_at")
+    )
+    wanted = {cve_id for _item_id, cve_ids, _published_at in rows for cve_id in cve_ids or []}
+    Cve.objects.bulk_create([Cve(cve_id=cve_id) for cve_id in sorted(wanted)], batch_size=500)
+    cve_pks = dict(Cve.objects.values_list("cve_id", "id"))
+    ItemCve.objects.bulk_create(
+        [
+            ItemCve(item_id=item_id, cve_id=cve_pks[cve_id], published_at=published_at)
+            for item_id, cve_ids, published_at in rows
+            for cve_id in cve_ids or []
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0016_item_signal_scoring'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Cve',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cve_id', models.CharField(max_length=32, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['cve_id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ItemCve',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('published_at', models.DateTimeField()),
+                ('cve', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='item_links', to='intel.cve')),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cve_links', to='intel.item')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='cve',
+            name='items',
+            field=models.ManyToManyField(related_name='cve_records', through='intel.ItemCve', to='intel.item'),
+        ),
+        migrations.AddIndex(
+            model_name='itemcve',
+            index=models.Index(fields=['cve', '-published_at'], name='intel_itemcve_cve_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='itemcve',
+            index=models.Index(fields=['-published_at'], name='intel_itemcve_pub_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='itemcve',
+            constraint=models.UniqueConstraint(fields=('item', 'cve'), name='intel_itemcve_unique'),
+        ),
+        migrations.RunPython(backfill_item_cves, migrations.RunPython.noop),
+    ]
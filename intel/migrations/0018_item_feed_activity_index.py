@@ -0,0 +1,17 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0017_cve_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['feed', '-published_at', '-id'], name='intel_item_feed_pub_idx'),
+        ),
+    ]
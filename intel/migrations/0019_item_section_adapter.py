@@ -0,0 +1,43 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:47
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_feed_section_and_adapter(apps, schema_editor):
+    Feed = apps.get_model("intel", "Feed")
+    Item = apps.get_model("intel", "Item")
+    feeds = Feed.objects.filter(pk=OuterRef("feed_id"))
+    Item.objects.update(
+        section=Subquery(feeds.values("section")[:1]),
+        adapter_key=Subquery(feeds.values("adapter_key")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0018_item_feed_activity_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='item',
+            name='adapter_key',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='section',
+            field=models.CharField(choices=[('active', 'Active'), ('advisories', 'Advisories'), ('research', 'Research'), ('sweden', 'Sweden')], default='advisories', max_length=20),
+        ),
+        migrations.RunPython(copy_feed_section_and_adapter, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['section', '-published_at', '-id'], name='intel_item_sec_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['adapter_key', '-published_at'], name='intel_item_adapter_pub_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+PG_FORWARD = [
+    """
+    ALTER TABLE intel_item ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple'::regconfig, coalesce(summary, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX intel_item_search_gin ON intel_item USING gin (search_vector)",
+]
+PG_REVERSE = [
+    "DROP INDEX IF EXISTS intel_item_search_gin",
+    "ALTER TABLE intel_item DROP COLUMN IF EXISTS search_vector",
+]
+# '-' is a token character so CVE IDs and hyphenated terms stay whole tokens.
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE intel_item_fts USING fts5(
+        title, summary, tokenize = "unicode61 tokenchars '-'"
+    )
+    """,
+    "INSERT INTO intel_item_fts(rowid, title, summary) SELECT id, title, summary FROM intel_item",
+]
+SQLITE_REVERSE = ["DROP TABLE IF EXISTS intel_item_fts"]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        statements = statements_by_vendor.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intel", "0019_item_section_adapter"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"postgresql": PG_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": PG_REVERSE, "sqlite": SQLITE_REVERSE}),
+        ),
+    ]
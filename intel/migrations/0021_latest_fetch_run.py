@@ -0,0 +1,47 @@
+# Generated by Django 5.2.11 on 2026-10-17 04:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_latest_runs(apps, schema_editor):
+    Feed = apps.get_model("intel", "Feed")
+    FetchRun = apps.get_model("intel", "FetchRun")
+    DarkSource = apps.get_model("intel", "DarkSource")
+    DarkFetchRun = apps.get_model("intel", "DarkFetchRun")
+    Feed.objects.update(
+        latest_run=Subquery(
+            FetchRun.objects.filter(feed=OuterRef("pk"))
+            .order_by("-started_at", "-id")
+            .values("id")[:1]
+        )
+    )
+    DarkSource.objects.update(
+        latest_run=Subquery(
+            DarkFetchRun.objects.filter(dark_source=OuterRef("pk"))
+            .order_by("-started_at", "-id")
+            .values("id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0020_item_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='darksource',
+            name='latest_run',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='intel.darkfetchrun'),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='latest_run',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='intel.fetchrun'),
+        ),
+        migrations.RunPython(backfill_latest_runs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:03
+
+from datetime import timezone
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max
+from django.db.models.functions import TruncDate
+
+
+def backfill_source_daily_stats(apps, schema_editor):
+    Item = apps.get_model("intel", "Item")
+    SourceDailyStat = apps.get_model("intel", "SourceDailyStat")
+    rows = (
+        Item.objects.annotate(day=TruncDate("published_at", tzinfo=timezone.utc))
+        .values("source_id", "section", "day")
+        .annotate(item_count=Count("id"), last_item_at=Max("published_at"))
+        .order_by()
+    )
+    SourceDailyStat.objects.bulk_create(
+        (
+            SourceDailyStat(
+                source_id=row["source_id"],
+                section=row["section"],
+                day=row["day"],
+                item_count=row["item_count"],
+                last_item_at=row["last_item_at"],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0021_latest_fetch_run'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SourceDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(choices=[('active', 'Active'), ('advisories', 'Advisories'), ('research', 'Research'), ('sweden', 'Sweden')], max_length=20)),
+                ('day', models.DateField()),
+                ('item_count', models.PositiveIntegerField(default=0)),
+                ('last_item_at', models.DateTimeField()),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='intel.source')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['day'], name='intel_srcstat_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'section', 'day'), name='intel_srcstat_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_source_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from intel.ransomware import RANSOMWARE_ADAPTER_KEY, victim_fields
+
+
+def backfill_ransomware_victims(apps, schema_editor):
+    Item = apps.get_model("intel", "Item")
+    RansomwareVictim = apps.get_model("intel", "RansomwareVictim")
+    items = Item.objects.filter(adapter_key=RANSOMWARE_ADAPTER_KEY).only(
+        "id", "title", "raw_payload", "published_at"
+    )
+    RansomwareVictim.objects.bulk_create(
+        (RansomwareVictim(item_id=item.pk, **victim_fields(item)) for item in items.iterator()),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0022_source_daily_stat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RansomwareVictim',
+            fields=[
+                ('item', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ransomware_victim', serialize=False, to='intel.item')),
+                ('published_at', models.DateTimeField()),
+                ('day', models.DateField()),
+                ('group_name', models.CharField(blank=True, max_length=200)),
+                ('group_key', models.CharField(blank=True, max_length=200)),
+                ('victim_name', models.CharField(blank=True, max_length=500)),
+                ('country', models.CharField(blank=True, max_length=120)),
+                ('country_code', models.CharField(blank=True, max_length=8)),
+                ('country_key', models.CharField(blank=True, max_length=120)),
+            ],
+            options={
+                'ordering': ['-published_at', '-item_id'],
+                'indexes': [models.Index(fields=['-published_at'], name='intel_ransom_pub_idx'), models.Index(fields=['group_key', '-published_at'], name='intel_ransom_group_pub_idx'), models.Index(fields=['country_key', '-published_at'], name='intel_ransom_country_pub_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_ransomware_victims, migrations.RunPython.noop),
+    ]
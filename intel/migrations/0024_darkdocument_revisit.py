@@ -0,0 +1,43 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0023_ransomware_victim'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='darkdocument',
+            name='http_etag',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='darkdocument',
+            name='http_last_modified',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='darkdocument',
+            name='next_fetch_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='darkdocument',
+            name='unchanged_runs',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='darkfetchrun',
+            name='documents_deferred',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='darkfetchrun',
+            name='documents_not_modified',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
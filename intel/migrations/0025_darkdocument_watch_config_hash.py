@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 05:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0024_darkdocument_revisit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='darkdocument',
+            name='watch_config_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
@@ -0,0 +1,72 @@
+import hashlib
+import json
+from datetime import timezone
+
+from django.db import migrations
+
+
+def _item_fingerprint(item):
+    # Frozen copy of intel.utils.build_item_fingerprint as of this migration.
+    published_at = item.published_at
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=timezone.utc)
+    payload = "\n".join(
+        [
+            str(item.source_id or ""),
+            str(item.feed_id or ""),
+            item.section,
+            item.adapter_key,
+            item.title,
+            item.external_id,
+            item.url,
+            item.canonical_url,
+            item.summary,
+            published_at.astimezone(timezone.utc).isoformat(),
+            json.dumps(item.raw_payload, sort_keys=True, default=str),
+            str(item.signal_score),
+            item.signal_category,
+            json.dumps(item.signal_flags),
+        ]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def backfill_item_fingerprints(apps, schema_editor):
+    Item = apps.get_model("intel", "Item")
+    batch = []
+    queryset = Item.objects.only(
+        "id",
+        "source_id",
+        "feed_id",
+        "section",
+        "adapter_key",
+        "title",
+        "external_id",
+        "url",
+        "canonical_url",
+        "summary",
+        "published_at",
+        "raw_payload",
+        "signal_score",
+        "signal_category",
+        "signal_flags",
+    )
+    for item in queryset.iterator(chunk_size=500):
+        item.content_fingerprint = _item_fingerprint(item)
+        batch.append(item)
+        if len(batch) >= 500:
+            Item.objects.bulk_update(batch, ["content_fingerprint"])
+            batch = []
+    if batch:
+        Item.objects.bulk_update(batch, ["content_fingerprint"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intel', '0025_darkdocument_watch_config_hash'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_item_fingerprints, migrations.RunPython.noop),
+    ]
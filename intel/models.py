@@ -1,9 +1,24 @@
+import threading
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
 from django.conf import settings
-from django.db import models
-from django.db.models import Index
+from django.db import connection, models
+from django.db.models import Count, Index, Max, Q
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 
-from .utils import build_stable_id, canonicalize_url, hash_title, normalize_title, sanitize_summary
+from .ransomware import RANSOMWARE_ADAPTER_KEY, victim_fields
+from .scoring import compute_item_signal
+from .search import index_items
+from .utils import (
+    build_item_fingerprint,
+    build_stable_id,
+    canonicalize_url,
+    hash_title,
+    normalize_title,
+    sanitize_summary,
+)
 
 
 class Source(models.Model):
@@ -55,6 +70,19 @@ class Feed(models.Model):
     max_age_days = models.PositiveIntegerField(default=180)
     last_success_at = models.DateTimeField(null=True, blank=True)
     last_error = models.TextField(blank=True)
+    http_etag = models.CharField(max_length=255, blank=True)
+    http_last_modified = models.CharField(max_length=64, blank=True)
+    payload_hash = models.CharField(max_length=64, blank=True)
+    payload_entries = models.PositiveIntegerField(default=0)
+    # Newest FetchRun, kept current by FetchRun.save() so health pages never scan run history.
+    latest_run = models.ForeignKey(
+        "FetchRun",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -65,9 +93,31 @@ class Feed(models.Model):
         return f"{self.source.name} / {self.name}"
 
 
+# Item columns that feed the CVE index, search index, ransomware facts and daily
+# stats. content_fingerprint covers all of them, so an unchanged fingerprint
+# means there is nothing to re-sync.
+ITEM_SYNC_FIELDS = (
+    "source_id",
+    "section",
+    "adapter_key",
+    "title",
+    "summary",
+    "published_at",
+    "cve_ids",
+    "content_fingerprint",
+)
+
+
 class Item(models.Model):
     source = models.ForeignKey(Source, on_delete=models.CASCADE, related_name="items")
     feed = models.ForeignKey(Feed, on_delete=models.CASCADE, related_name="items")
+    # Copied from the feed so section/adapter filters stay on the item table.
+    section = models.CharField(
+        max_length=20,
+        choices=Feed.Section.choices,
+        default=Feed.Section.ADVISORIES,
+    )
+    adapter_key = models.CharField(max_length=64, blank=True, default="")
     title = models.CharField(max_length=1500)
     normalized_title = models.CharField(max_length=1500, blank=True)
     title_hash = models.CharField(max_length=64, db_index=True)
@@ -78,6 +128,12 @@ class Item(models.Model):
     published_at = models.DateTimeField(default=timezone.now, db_index=True)
     summary = models.TextField(blank=True)
     raw_payload = models.JSONField(default=dict, blank=True)
+    content_fingerprint = models.CharField(max_length=64, blank=True)
+    # Static part of the dashboard score; the recency bonus is added at read time.
+    signal_score = models.IntegerField(default=0, db_index=True)
+    signal_category = models.CharField(max_length=32, blank=True, db_index=True)
+    signal_flags = models.JSONField(default=list, blank=True)
+    cve_ids = models.JSONField(default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -86,9 +142,14 @@ class Item(models.Model):
         indexes = [
             Index(fields=["-published_at"], name="intel_item_pub_idx"),
             Index(fields=["source", "-published_at"], name="intel_item_src_pub_idx"),
+            Index(fields=["feed", "-published_at", "-id"], name="intel_item_feed_pub_idx"),
+            Index(fields=["section", "-published_at", "-id"], name="intel_item_sec_pub_idx"),
+            Index(fields=["adapter_key", "-published_at"], name="intel_item_adapter_pub_idx"),
         ]
 
-    def save(self, *args, **kwargs):
+    def normalize_fields(self):
+        self.section = self.feed.section
+        self.adapter_key = self.feed.adapter_key
         self.title = normalize_title(self.title)
         self.normalized_title = normalize_title(self.title)
         self.title_hash = hash_title(self.normalized_title)
@@ -103,12 +164,365 @@ class Item(models.Model):
                 external_id=self.external_id,
                 summary=self.summary,
             )
-        return super().save(*args, **kwargs)
+        self.refresh_signal()
+        self.refresh_fingerprint()
+
+    def refresh_signal(self):
+        signal = compute_item_signal(
+            self.title,
+            self.summary,
+            section=self.section,
+            adapter_key=self.adapter_key,
+        )
+        self.signal_score = signal.score
+        self.signal_category = signal.label
+        self.signal_flags = signal.flags
+        self.cve_ids = signal.cves
+
+    def refresh_fingerprint(self):
+        self.content_fingerprint = build_item_fingerprint(
+            source_id=self.source_id,
+            feed_id=self.feed_id,
+            section=self.section,
+            adapter_key=self.adapter_key,
+            title=self.title,
+            external_id=self.external_id,
+            url=self.url,
+            canonical_url=self.canonical_url,
+            summary=self.summary,
+            published_at=self.published_at,
+            raw_payload=self.raw_payload,
+            signal_score=self.signal_score,
+            signal_category=self.signal_category,
+            signal_flags=self.signal_flags,
+        )
+
+    # ITEM_SYNC_FIELDS as last loaded or saved; None for unsaved or partly deferred rows.
+    _synced = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        item = super().from_db(db, field_names, values)
+        item._synced = item._sync_state()
+        return item
+
+    def _sync_state(self):
+        """Inputs of the rows ``save`` keeps in sync, or None if any is deferred."""
+        if any(field not in self.__dict__ for field in ITEM_SYNC_FIELDS):
+            return None
+        state = {field: getattr(self, field) for field in ITEM_SYNC_FIELDS}
+        state["cve_ids"] = list(state["cve_ids"] or [])
+        return state
+
+    def save(self, *args, **kwargs):
+        previous = None
+        if not self._state.adding:
+            previous = self._synced
+            if previous is None:
+                row = Item.objects.filter(pk=self.pk).values(*ITEM_SYNC_FIELDS).first()
+                previous = row and {**row, "cve_ids": list(row["cve_ids"] or [])}
+        self.normalize_fields()
+        result = super().save(*args, **kwargs)
+        current = self._synced = self._sync_state()
+
+        if previous is None:
+            if self.cve_ids:
+                sync_item_cves([self])
+            index_items([self])
+            if self.adapter_key == RANSOMWARE_ADAPTER_KEY:
+                sync_ransomware_victims([self])
+            _record_stat_changes(created=[self])
+            return result
+
+        # Only the parts whose inputs changed are re-synced.
+        if current["content_fingerprint"] == previous["content_fingerprint"]:
+            return result
+        if current["cve_ids"] != previous["cve_ids"]:
+            sync_item_cves([self])
+        if (current["title"], current["summary"]) != (previous["title"], previous["summary"]):
+            index_items([self])
+        if RANSOMWARE_ADAPTER_KEY in {current["adapter_key"], previous["adapter_key"]}:
+            sync_ransomware_victims([self])
+        stat_key = source_stat_key(self.source_id, self.section, self.published_at)
+        previous_key = source_stat_key(
+            previous["source_id"], previous["section"], previous["published_at"]
+        )
+        if stat_key != previous_key:
+            _record_stat_changes(moved={stat_key, previous_key})
+        return result
 
     def __str__(self) -> str:
         return self.title
 
 
+class Cve(models.Model):
+    cve_id = models.CharField(max_length=32, unique=True)
+    items = models.ManyToManyField(Item, through="ItemCve", related_name="cve_records")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["cve_id"]
+
+    def __str__(self) -> str:
+        return self.cve_id
+
+
+class ItemCve(models.Model):
+    item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name="cve_links")
+    cve = models.ForeignKey(Cve, on_delete=models.CASCADE, related_name="item_links")
+    # Copy of Item.published_at so trending/lookup queries stay on this table.
+    published_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["item", "cve"], name="intel_itemcve_unique"),
+        ]
+        indexes = [
+            Index(fields=["cve", "-published_at"], name="intel_itemcve_cve_pub_idx"),
+            Index(fields=["-published_at"], name="intel_itemcve_pub_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"cve={self.cve_id} item={self.item_id}"
+
+
+def sync_item_cves(items) -> None:
+    """Rewrite ItemCve links for saved items from their stored ``cve_ids``."""
+    items = [item for item in items if item.pk]
+    if not items:
+        return
+    wanted = {cve_id for item in items for cve_id in item.cve_ids or []}
+    cve_pks = {}
+    if wanted:
+        Cve.objects.bulk_create(
+            [Cve(cve_id=cve_id) for cve_id in sorted(wanted)],
+            ignore_conflicts=True,
+        )
+        cve_pks = dict(Cve.objects.filter(cve_id__in=wanted).values_list("cve_id", "id"))
+    ItemCve.objects.filter(item_id__in=[item.pk for item in items]).delete()
+    ItemCve.objects.bulk_create(
+        [
+            ItemCve(item_id=item.pk, cve_id=cve_pks[cve_id], published_at=item.published_at)
+            for item in items
+            for cve_id in item.cve_ids or []
+        ],
+        batch_size=500,
+    )
+
+
+class SourceDailyStat(models.Model):
+    """Item count per (source, section, UTC day), kept in step with items on write."""
+
+    source = models.ForeignKey(Source, on_delete=models.CASCADE, related_name="daily_stats")
+    section = models.CharField(max_length=20, choices=Feed.Section.choices)
+    day = models.DateField()
+    item_count = models.PositiveIntegerField(default=0)
+    last_item_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "section", "day"], name="intel_srcstat_unique"
+            ),
+        ]
+        indexes = [
+            Index(fields=["day"], name="intel_srcstat_day_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.source_id}/{self.section} {self.day}: {self.item_count}"
+
+
+def source_stat_key(source_id: int, section: str, published_at: datetime):
+    return (source_id, section, published_at.astimezone(dt_timezone.utc).date())
+
+
+def item_stat_keys(queryset) -> set:
+    """Return the ``source_stat_key`` buckets of the items in ``queryset``, in one query."""
+    return set(
+        queryset.annotate(day=TruncDate("published_at", tzinfo=dt_timezone.utc))
+        .values_list("source_id", "section", "day")
+        .order_by()
+        .distinct()
+    )
+
+
+def add_source_daily_stats(items) -> None:
+    """Count newly created items into their daily buckets with one upsert."""
+    buckets = {}
+    for item in items:
+        key = source_stat_key(item.source_id, item.section, item.published_at)
+        count, last_item_at = buckets.get(key, (0, item.published_at))
+        buckets[key] = (count + 1, max(last_item_at, item.published_at))
+    if not buckets:
+        return
+    if connection.vendor not in {"postgresql", "sqlite"}:
+        refresh_source_daily_stats(buckets)
+        return
+
+    table = connection.ops.quote_name(SourceDailyStat._meta.db_table)
+    params = []
+    for (source_id, section, day), (count, last_item_at) in buckets.items():
+        params.extend(
+            [
+                source_id,
+                section,
+                connection.ops.adapt_datefield_value(day),
+                count,
+                connection.ops.adapt_datetimefield_value(last_item_at),
+            ]
+        )
+    values = ", ".join(["(%s, %s, %s, %s, %s)"] * len(buckets))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (source_id, section, day, item_count, last_item_at) "
+            f"VALUES {values} "
+            f"ON CONFLICT (source_id, section, day) DO UPDATE SET "
+            f"item_count = {table}.item_count + excluded.item_count, "
+            f"last_item_at = CASE WHEN excluded.last_item_at > {table}.last_item_at "
+            f"THEN excluded.last_item_at ELSE {table}.last_item_at END",
+            params,
+        )
+
+
+def refresh_source_daily_stats(keys) -> None:
+    """Recompute SourceDailyStat rows covering the given ``source_stat_key`` buckets.
+
+    Used when items leave a bucket (moved or deleted). Every (source, section,
+    day) combination of the touched sources, sections and days is rebuilt from
+    items.
+    """
+    keys = set(keys)
+    if not keys:
+        return
+    source_ids = {source_id for source_id, _section, _day in keys}
+    sections = {section for _source_id, section, _day in keys}
+    days = {day for _source_id, _section, day in keys}
+    start = datetime.combine(min(days), time.min, tzinfo=dt_timezone.utc)
+    end = datetime.combine(max(days), time.min, tzinfo=dt_timezone.utc) + timedelta(days=1)
+
+    rows = (
+        Item.objects.filter(
+            source_id__in=source_ids,
+            section__in=sections,
+            published_at__gte=start,
+            published_at__lt=end,
+        )
+        .annotate(day=TruncDate("published_at", tzinfo=dt_timezone.utc))
+        .values("source_id", "section", "day")
+        .annotate(item_count=Count("id"), last_item_at=Max("published_at"))
+    )
+    stats = [
+        SourceDailyStat(
+            source_id=row["source_id"],
+            section=row["section"],
+            day=row["day"],
+            item_count=row["item_count"],
+            last_item_at=row["last_item_at"],
+        )
+        for row in rows
+        if row["day"] in days
+    ]
+    SourceDailyStat.objects.filter(
+        source_id__in=source_ids, section__in=sections, day__in=days
+    ).delete()
+    SourceDailyStat.objects.bulk_create(stats, batch_size=500)
+
+
+_stat_batch = threading.local()
+
+
+@contextmanager
+def batched_source_stats():
+    """Defer the daily-stat updates of ``Item.save`` calls to one refresh on exit.
+
+    Scripts that save many items one at a time wrap the loop in this so the
+    touched buckets are recomputed once rather than after every save.
+    """
+    outermost = getattr(_stat_batch, "keys", None) is None
+    if outermost:
+        _stat_batch.keys = set()
+    try:
+        yield
+    finally:
+        if outermost:
+            keys, _stat_batch.keys = _stat_batch.keys, None
+            refresh_source_daily_stats(keys)
+
+
+def _record_stat_changes(*, created=(), moved=()) -> None:
+    keys = getattr(_stat_batch, "keys", None)
+    if keys is not None:
+        keys.update(
+            source_stat_key(item.source_id, item.section, item.published_at) for item in created
+        )
+        keys.update(moved)
+        return
+    add_source_daily_stats(created)
+    refresh_source_daily_stats(moved)
+
+
+class RansomwareVictim(models.Model):
+    """Map facts for one ransomware.live victim item, parsed once at write time."""
+
+    item = models.OneToOneField(
+        Item,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="ransomware_victim",
+    )
+    # Copy of Item.published_at so the map's window filters stay on this table.
+    published_at = models.DateTimeField()
+    day = models.DateField()
+    group_name = models.CharField(max_length=200, blank=True)
+    group_key = models.CharField(max_length=200, blank=True)
+    victim_name = models.CharField(max_length=500, blank=True)
+    country = models.CharField(max_length=120, blank=True)
+    country_code = models.CharField(max_length=8, blank=True)
+    country_key = models.CharField(max_length=120, blank=True)
+
+    class Meta:
+        ordering = ["-published_at", "-item_id"]
+        indexes = [
+            Index(fields=["-published_at"], name="intel_ransom_pub_idx"),
+            Index(fields=["group_key", "-published_at"], name="intel_ransom_group_pub_idx"),
+            Index(fields=["country_key", "-published_at"], name="intel_ransom_country_pub_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.group_name}: {self.victim_name}"
+
+
+def sync_ransomware_victims(items) -> None:
+    """Upsert RansomwareVictim rows for saved ransomware items and drop rows for the rest."""
+    items = [item for item in items if item.pk]
+    stale_ids = [item.pk for item in items if item.adapter_key != RANSOMWARE_ADAPTER_KEY]
+    if stale_ids:
+        RansomwareVictim.objects.filter(item_id__in=stale_ids).delete()
+    victims = [
+        RansomwareVictim(item_id=item.pk, **victim_fields(item))
+        for item in items
+        if item.adapter_key == RANSOMWARE_ADAPTER_KEY
+    ]
+    if victims:
+        RansomwareVictim.objects.bulk_create(
+            victims,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["item"],
+            update_fields=[
+                "published_at",
+                "day",
+                "group_name",
+                "group_key",
+                "victim_name",
+                "country",
+                "country_code",
+                "country_key",
+            ],
+        )
+
+
 class FetchRun(models.Model):
     feed = models.ForeignKey(Feed, on_delete=models.CASCADE, related_name="fetch_runs")
     started_at = models.DateTimeField(default=timezone.now, db_index=True)
@@ -116,14 +530,17 @@ class FetchRun(models.Model):
     ok = models.BooleanField(default=False)
     error = models.TextField(blank=True)
     http_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    not_modified = models.BooleanField(default=False)
     items_fetched = models.PositiveIntegerField(default=0)
     items_stored = models.PositiveIntegerField(default=0)
     items_skipped_old = models.PositiveIntegerField(default=0)
     items_skipped_invalid = models.PositiveIntegerField(default=0)
     items_deduped = models.PositiveIntegerField(default=0)
     items_limited = models.PositiveIntegerField(default=0)
+    items_skipped_unchanged = models.PositiveIntegerField(default=0)
     items_new = models.PositiveIntegerField(default=0)
     items_updated = models.PositiveIntegerField(default=0)
+    items_unchanged = models.PositiveIntegerField(default=0)
     duration_ms = models.PositiveIntegerField(null=True, blank=True)
 
     class Meta:
@@ -132,6 +549,15 @@ class FetchRun(models.Model):
     def __str__(self) -> str:
         return f"{self.feed.name} @ {self.started_at.isoformat()}"
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            Feed.objects.filter(
+                Q(latest_run__isnull=True) | Q(latest_run__started_at__lte=self.started_at),
+                pk=self.feed_id,
+            ).update(latest_run=self)
+
 
 class OpsJob(models.Model):
     class Status(models.TextChoices):
@@ -171,6 +597,39 @@ class OpsJob(models.Model):
         return f"{self.command_name} #{self.id} ({self.status})"
 
 
+class OutboundAlert(models.Model):
+    class Channel(models.TextChoices):
+        INTEL = "intel", "Intel"
+        DARK = "dark", "Dark"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    channel = models.CharField(max_length=16, choices=Channel.choices)
+    embed = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_at", "id"]
+        indexes = [
+            Index(fields=["status", "next_attempt_at"], name="intel_alert_due_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.channel} alert #{self.id} ({self.status})"
+
+
 from .dark_models import (  # noqa: E402,F401
     DarkDocument,
     DarkFetchRun,
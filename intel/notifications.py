@@ -3,6 +3,8 @@ from __future__ import annotations
 import hashlib
 import logging
 import re
+import time
+from collections import defaultdict, deque
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
@@ -11,12 +13,25 @@ from django.conf import settings
 from django.utils import timezone
 
 from intel.dark_utils import evaluate_record_watch_matches, normalize_text
+from intel.http import http_session
+from intel.models import OutboundAlert
+from intel.scoring import (
+    FLAG_EXPLOIT_KEYWORD,
+    FLAG_HIGH_SIGNAL_KEYWORD,
+    FLAG_LOW_SIGNAL_TITLE,
+    FLAG_RANSOMWARE_KEYWORD,
+    FLAG_URGENT,
+    recency_bonus,
+)
 
 if TYPE_CHECKING:
     from intel.models import DarkHit, Item
 
 logger = logging.getLogger(__name__)
 DARK_HIT_ALERT_COOLDOWN = timedelta(hours=24)
+ALERT_RETRY_BASE_DELAY = timedelta(seconds=30)
+ALERT_MAX_INLINE_RATE_LIMIT_WAIT = 5.0
+DISCORD_MAX_EMBED_CHARS_PER_MESSAGE = 6000
 GENERIC_INTEL_ALERT_MIN_SCORE = 20
 GENERIC_INTEL_ALERT_SECTIONS = {"active", "advisories", "research", "sweden"}
 NORDIC_SIGNAL_HINTS = (
@@ -225,8 +240,7 @@ def send_dark_hit_alert(
     matched_fields: list[str] | None = None,
     why_alerted: str | None = None,
 ) -> None:
-    webhook = getattr(settings, "DARK_DISCORD_WEBHOOK", "")
-    if not webhook:
+    if not _channel_webhook(OutboundAlert.Channel.DARK):
         logger.debug("DARK_DISCORD_WEBHOOK not configured, skipping dark hit alert.")
         return
     if not should_send_dark_hit_alert(hit):
@@ -253,65 +267,58 @@ def send_dark_hit_alert(
     ]
     matched_fields_str = ", ".join(matched_field_labels) if matched_field_labels else "(unknown)"
 
-    payload = {
-        "embeds": [
+    embed = {
+        "title": (hit.title or "")[:256],
+        "description": (hit.excerpt[:300] if hit.excerpt else "(no excerpt)"),
+        "color": 0xFF4444,
+        "fields": [
             {
-                "title": (hit.title or "")[:256],
-                "description": (hit.excerpt[:300] if hit.excerpt else "(no excerpt)"),
-                "color": 0xFF4444,
-                "fields": [
-                    {
-                        "name": "Source",
-                        "value": hit.dark_source.name,
-                        "inline": True,
-                    },
-                    {
-                        "name": "Keywords matched",
-                        "value": keywords_str,
-                        "inline": True,
-                    },
-                    {
-                        "name": "Regex matched",
-                        "value": regex_str,
-                        "inline": True,
-                    },
-                    {
-                        "name": "Matched in",
-                        "value": matched_fields_str,
-                        "inline": True,
-                    },
-                    *(
-                        [
-                            {
-                                "name": "Why alerted",
-                                "value": why_alerted[:200],
-                                "inline": True,
-                            }
-                        ]
-                        if why_alerted
-                        else []
-                    ),
-                    {
-                        "name": "URL",
-                        "value": "dark source (onion)",
-                        "inline": False,
-                    },
+                "name": "Source",
+                "value": hit.dark_source.name,
+                "inline": True,
+            },
+            {
+                "name": "Keywords matched",
+                "value": keywords_str,
+                "inline": True,
+            },
+            {
+                "name": "Regex matched",
+                "value": regex_str,
+                "inline": True,
+            },
+            {
+                "name": "Matched in",
+                "value": matched_fields_str,
+                "inline": True,
+            },
+            *(
+                [
                     {
-                        "name": "Detected",
-                        "value": str(hit.detected_at),
+                        "name": "Why alerted",
+                        "value": why_alerted[:200],
                         "inline": True,
-                    },
-                ],
-                "footer": {"text": "borealsec-intel \u00b7 dark monitor"},
-            }
-        ]
+                    }
+                ]
+                if why_alerted
+                else []
+            ),
+            {
+                "name": "URL",
+                "value": "dark source (onion)",
+                "inline": False,
+            },
+            {
+                "name": "Detected",
+                "value": str(hit.detected_at),
+                "inline": True,
+            },
+        ],
+        "footer": {"text": "borealsec-intel \u00b7 dark monitor"},
     }
 
-    logger.debug("Sending dark hit alert")
-    try:
-        requests.post(webhook, json=payload, timeout=10)
-    except requests.RequestException as e:
-        logger.warning("Discord alert failed: %s", e)
+    logger.debug("Queueing dark hit alert")
+    enqueue_alert(OutboundAlert.Channel.DARK, embed)
 
 
 def _intel_webhook() -> str:
@@ -320,6 +327,12 @@ def _intel_webhook() -> str:
     )
 
 
+def _channel_webhook(channel: str) -> str:
+    if channel == OutboundAlert.Channel.DARK:
+        return getattr(settings, "DARK_DISCORD_WEBHOOK", "")
+    return _intel_webhook()
+
+
 def _truncate_alert_text(value: str, limit: int, *, fallback: str = "") -> str:
     cleaned = normalize_text(value)
     if not cleaned:
@@ -335,30 +348,23 @@ def get_generic_intel_alert_context(item: Item) -> dict | None:
     if (item.feed.section or "").strip().lower() not in GENERIC_INTEL_ALERT_SECTIONS:
         return None
 
-    from intel.views import (
-        DASHBOARD_EXPLOIT_KEYWORDS,
-        DASHBOARD_RANSOMWARE_KEYWORDS,
-        HIGH_SIGNAL_KEYWORDS,
-        _dashboard_signal_profile,
-        _item_cves,
-        _item_text,
-    )
-
-    text = _item_text(item)
-    lowered_text = text.lower()
-    cves = _item_cves(item)
-    profile = _dashboard_signal_profile(item, cves=cves)
-
-    explicit_exploitation = any(keyword in lowered_text for keyword in DASHBOARD_EXPLOIT_KEYWORDS)
-    ransomware_signal = any(keyword in lowered_text for keyword in DASHBOARD_RANSOMWARE_KEYWORDS)
-    high_signal_keyword = any(keyword in lowered_text for keyword in HIGH_SIGNAL_KEYWORDS)
-    urgent_wording = any(keyword in lowered_text for keyword in ("critical", "urgent", "emergency"))
+    # Keyword flags, CVEs and the static score were computed when the item was upserted.
+    flags = set(item.signal_flags or [])
+    cves = list(item.cve_ids or [])
+    now = timezone.now()
+    score = item.signal_score + recency_bonus(item.published_at or item.created_at or now, now)
+
+    explicit_exploitation = FLAG_EXPLOIT_KEYWORD in flags
+    ransomware_signal = FLAG_RANSOMWARE_KEYWORD in flags
+    high_signal_keyword = FLAG_HIGH_SIGNAL_KEYWORD in flags
+    urgent_wording = FLAG_URGENT in flags
+    lowered_text = f"{item.title or ''}\n{item.summary or ''}".lower()
     nordic_signal = any(keyword in lowered_text for keyword in NORDIC_SIGNAL_HINTS)
     sweden_signal = (item.feed.section or "").strip().lower() == "sweden" or nordic_signal
 
-    if profile["score"] < GENERIC_INTEL_ALERT_MIN_SCORE:
+    if score < GENERIC_INTEL_ALERT_MIN_SCORE:
         return None
-    if profile["is_low_signal_title"] and not (
+    if FLAG_LOW_SIGNAL_TITLE in flags and not (
         explicit_exploitation
         or ransomware_signal
         or high_signal_keyword
@@ -383,8 +389,8 @@ def get_generic_intel_alert_context(item: Item) -> dict | None:
         why_alerted = "Sweden-relevant intel"
     elif urgent_wording:
         why_alerted = "urgent advisory"
-    elif profile["signal_label"]:
-        why_alerted = profile["signal_label"].lower()
+    elif item.signal_category:
+        why_alerted = item.signal_category.lower()
 
     if not why_alerted:
         return None
@@ -407,8 +413,7 @@ def send_generic_intel_alert(
     cves: list[str] | None = None,
     country: str = "",
 ) -> None:
-    webhook = _intel_webhook()
-    if not webhook:
+    if not _intel_webhook():
         return
 
     section_label = item.feed.get_section_display() if item.feed_id else (item.feed.section or "").title()
@@ -455,27 +460,19 @@ def send_generic_intel_alert(
         }
     )
 
-    payload = {
-        "embeds": [
-            {
-                "title": f"High-signal intel: {(item.title or '')[:220]}",
-                "description": summary_text,
-                "color": 0xF59E0B,
-                "fields": fields,
-                "footer": {"text": "borealsec-intel · intel stream"},
-            }
-        ]
+    embed = {
+        "title": f"High-signal intel: {(item.title or '')[:220]}",
+        "description": summary_text,
+        "color": 0xF59E0B,
+        "fields": fields,
+        "footer": {"text": "borealsec-intel · intel stream"},
     }
 
-    try:
-        requests.post(webhook, json=payload, timeout=10)
-    except requests.RequestException as e:
-        logger.warning("Discord alert failed: %s", e)
+    enqueue_alert(OutboundAlert.Channel.INTEL, embed)
 
 
 def send_high_epss_alert(item: Item) -> None:
-    webhook = _intel_webhook()
-    if not webhook:
+    if not _intel_webhook():
         return
 
     match = re.search(r"EPSS (\d+\.?\d*)%", item.title or "")
@@ -487,44 +484,36 @@ def send_high_epss_alert(item: Item) -> None:
     if score < threshold:
         return
 
-    payload = {
-        "embeds": [
+    embed = {
+        "title": f"High EPSS: {(item.title or '')[:200]}",
+        "description": (item.summary[:300] if item.summary else "(no summary)"),
+        "color": 0xFF8C00,
+        "fields": [
             {
-                "title": f"High EPSS: {(item.title or '')[:200]}",
-                "description": (item.summary[:300] if item.summary else "(no summary)"),
-                "color": 0xFF8C00,
-                "fields": [
-                    {
-                        "name": "EPSS Score",
-                        "value": f"{score:.1%}",
-                        "inline": True,
-                    },
-                    {
-                        "name": "Source",
-                        "value": item.source.name,
-                        "inline": True,
-                    },
-                    {
-                        "name": "Link",
-                        "value": (item.url[:500] if item.url else "(no link)"),
-                        "inline": False,
-                    },
-                ],
-                "footer": {"text": "borealsec-intel \u00b7 EPSS monitor"},
-            }
-        ]
+                "name": "EPSS Score",
+                "value": f"{score:.1%}",
+                "inline": True,
+            },
+            {
+                "name": "Source",
+                "value": item.source.name,
+                "inline": True,
+            },
+            {
+                "name": "Link",
+                "value": (item.url[:500] if item.url else "(no link)"),
+                "inline": False,
+            },
+        ],
+        "footer": {"text": "borealsec-intel \u00b7 EPSS monitor"},
     }
 
-    try:
-        requests.post(webhook, json=payload, timeout=10)
-    except requests.RequestException as e:
-        logger.warning("Discord alert failed: %s", e)
+    enqueue_alert(OutboundAlert.Channel.INTEL, embed)
 
 
 def send_ransomware_victim_alert(item: Item) -> None:
     # Primary: DARK_DISCORD_WEBHOOK (urgent intel); fallback: INTEL_DISCORD_WEBHOOK
-    webhook = _intel_webhook()
-    if not webhook:
+    if not _intel_webhook():
         return
 
     raw = item.raw_payload or {}
@@ -541,19 +530,176 @@ def send_ransomware_victim_alert(item: Item) -> None:
     if item.url:
         fields.append({"name": "Link", "value": item.url[:500], "inline": False})
 
-    payload = {
-        "embeds": [
-            {
-                "title": f"\U0001f6a8 Ransomware Victim: {item.title[:200]}",
-                "description": (item.summary[:300] if item.summary else "(no description)"),
-                "color": 0xFF4444,
-                "fields": fields,
-                "footer": {"text": "borealsec-intel \u00b7 ransomware.live"},
-            }
-        ]
+    embed = {
+        "title": f"\U0001f6a8 Ransomware Victim: {item.title[:200]}",
+        "description": (item.summary[:300] if item.summary else "(no description)"),
+        "color": 0xFF4444,
+        "fields": fields,
+        "footer": {"text": "borealsec-intel \u00b7 ransomware.live"},
     }
 
+    enqueue_alert(OutboundAlert.Channel.INTEL, embed)
+
+
+# ---------------------------------------------------------------------------
+# Outbound alert queue
+# ---------------------------------------------------------------------------
+
+def enqueue_alert(channel: str, embed: dict) -> OutboundAlert:
+    return OutboundAlert.objects.create(channel=channel, embed=embed)
+
+
+def _embed_text_length(embed: dict) -> int:
+    total = len(str(embed.get("title") or "")) + len(str(embed.get("description") or ""))
+    total += len(str((embed.get("footer") or {}).get("text") or ""))
+    for field in embed.get("fields") or []:
+        total += len(str(field.get("name") or "")) + len(str(field.get("value") or ""))
+    return total
+
+
+def _alert_batches(alerts: list[OutboundAlert]) -> list[list[OutboundAlert]]:
+    max_embeds = max(1, min(getattr(settings, "ALERT_BATCH_MAX_EMBEDS", 10), 10))
+    batches: list[list[OutboundAlert]] = []
+    current: list[OutboundAlert] = []
+    current_chars = 0
+    for alert in alerts:
+        chars = _embed_text_length(alert.embed)
+        if current and (
+            len(current) >= max_embeds
+            or current_chars + chars > DISCORD_MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append(alert)
+        current_chars += chars
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _retry_after_seconds(response) -> float:
+    raw = response.headers.get("Retry-After") or response.headers.get("X-RateLimit-Reset-After")
+    if not raw:
+        try:
+            raw = (response.json() or {}).get("retry_after")
+        except ValueError:
+            raw = None
     try:
-        requests.post(webhook, json=payload, timeout=10)
-    except requests.RequestException as e:
-        logger.warning("Discord alert failed: %s", e)
+        return max(float(raw), 0.0)
+    except (TypeError, ValueError):
+        return 5.0
+
+
+def _defer_alerts(alerts: list[OutboundAlert], *, delay_seconds: float) -> None:
+    OutboundAlert.objects.filter(pk__in=[alert.pk for alert in alerts]).update(
+        next_attempt_at=timezone.now() + timedelta(seconds=delay_seconds)
+    )
+
+
+def _mark_alerts_sent(alerts: list[OutboundAlert]) -> None:
+    OutboundAlert.objects.filter(pk__in=[alert.pk for alert in alerts]).update(
+        status=OutboundAlert.Status.SENT,
+        sent_at=timezone.now(),
+        last_error="",
+    )
+
+
+def _mark_alerts_retry(alerts: list[OutboundAlert], error: str) -> tuple[int, int]:
+    max_attempts = max(getattr(settings, "ALERT_MAX_ATTEMPTS", 5), 1)
+    now = timezone.now()
+    retried = 0
+    failed = 0
+    for alert in alerts:
+        alert.attempts += 1
+        alert.last_error = error[:2000]
+        if alert.attempts >= max_attempts:
+            alert.status = OutboundAlert.Status.FAILED
+            failed += 1
+        else:
+            alert.next_attempt_at = now + ALERT_RETRY_BASE_DELAY * (2 ** (alert.attempts - 1))
+            retried += 1
+    OutboundAlert.objects.bulk_update(
+        alerts, ["attempts", "last_error", "status", "next_attempt_at"]
+    )
+    return retried, failed
+
+
+def dispatch_pending_alerts(*, limit: int | None = None) -> dict[str, int]:
+    """Post due queued alerts to Discord, several embeds per message.
+
+    Honours Discord rate-limit responses by deferring the rest of the channel
+    and backs off failed batches until ALERT_MAX_ATTEMPTS is reached. A batch
+    rejected with a 4xx is resent one alert at a time.
+    """
+    limit = limit or getattr(settings, "ALERT_DISPATCH_LIMIT", 200)
+    stats = {"sent": 0, "retried": 0, "failed": 0, "deferred": 0}
+    due = list(
+        OutboundAlert.objects.filter(
+            status=OutboundAlert.Status.PENDING,
+            next_attempt_at__lte=timezone.now(),
+        ).order_by("created_at", "id")[:limit]
+    )
+    alerts_by_channel: dict[str, list[OutboundAlert]] = defaultdict(list)
+    for alert in due:
+        alerts_by_channel[alert.channel].append(alert)
+
+    for channel, alerts in alerts_by_channel.items():
+        webhook = _channel_webhook(channel)
+        if not webhook:
+            OutboundAlert.objects.filter(pk__in=[alert.pk for alert in alerts]).update(
+                status=OutboundAlert.Status.FAILED,
+                last_error="Discord webhook not configured.",
+            )
+            stats["failed"] += len(alerts)
+            continue
+
+        queue = deque(_alert_batches(alerts))
+        while queue:
+            batch = queue.popleft()
+            try:
+                response = http_session().post(
+                    webhook,
+                    json={"embeds": [alert.embed for alert in batch]},
+                    timeout=10,
+                )
+            except requests.RequestException as exc:
+                logger.warning("Discord alert batch failed: %s", exc)
+                retried, failed = _mark_alerts_retry(batch, str(exc))
+                stats["retried"] += retried
+                stats["failed"] += failed
+                continue
+
+            if response.status_code == 429:
+                remaining = [alert for rest in (batch, *queue) for alert in rest]
+                _defer_alerts(remaining, delay_seconds=_retry_after_seconds(response))
+                stats["deferred"] += len(remaining)
+                break
+            if 400 <= response.status_code < 500 and len(batch) > 1:
+                # One malformed embed rejects the whole message; resend the batch
+                # one alert at a time so only the bad one is retried and failed.
+                logger.warning(
+                    "Discord alert batch rejected: HTTP %s, resending singly", response.status_code
+                )
+                queue.extendleft([alert] for alert in reversed(batch))
+                continue
+            if response.status_code >= 400:
+                logger.warning("Discord alert batch rejected: HTTP %s", response.status_code)
+                retried, failed = _mark_alerts_retry(batch, f"HTTP {response.status_code}")
+                stats["retried"] += retried
+                stats["failed"] += failed
+                continue
+
+            _mark_alerts_sent(batch)
+            stats["sent"] += len(batch)
+
+            if queue and response.headers.get("X-RateLimit-Remaining") == "0":
+                wait_seconds = _retry_after_seconds(response)
+                if wait_seconds > ALERT_MAX_INLINE_RATE_LIMIT_WAIT:
+                    remaining = [alert for rest in queue for alert in rest]
+                    _defer_alerts(remaining, delay_seconds=wait_seconds)
+                    stats["deferred"] += len(remaining)
+                    break
+                time.sleep(wait_seconds)
+    return stats
+
@@ -0,0 +1,63 @@
+"""Keyset (cursor) pagination over ``(timestamp, id)`` in descending order.
+
+Each page is one ``LIMIT per_page + 1`` query seeked from the last row of the
+previous page, so deep pages cost the same as the first and no ``COUNT(*)`` is
+needed. Cursors are opaque URL-safe tokens.
+"""
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Q
+
+
+@dataclass(slots=True)
+class KeysetPage:
+    object_list: list
+    cursor: str = ""
+    next_cursor: str = ""
+
+    @property
+    def has_next(self) -> bool:
+        return bool(self.next_cursor)
+
+    @property
+    def is_first(self) -> bool:
+        return not self.cursor
+
+
+def encode_cursor(timestamp: datetime, pk: int) -> str:
+    raw = f"{timestamp.isoformat()}|{pk}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int] | None:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        timestamp, pk = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(pk)
+    except (ValueError, binascii.Error, UnicodeError):
+        return None
+
+
+def keyset_page(queryset, *, cursor: str, per_page: int, time_field: str) -> KeysetPage:
+    """Return the page after ``cursor`` (or the first page for a missing/invalid cursor)."""
+    position = decode_cursor(cursor) if cursor else None
+    if position is not None:
+        timestamp, pk = position
+        queryset = queryset.filter(
+            Q(**{f"{time_field}__lt": timestamp}) | Q(**{time_field: timestamp, "id__lt": pk})
+        )
+    rows = list(queryset.order_by(f"-{time_field}", "-id")[: per_page + 1])
+    next_cursor = ""
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, time_field), last.pk)
+    return KeysetPage(
+        object_list=rows,
+        cursor=cursor if position is not None else "",
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,52 @@
+"""Victim fields parsed from ransomware.live items.
+
+Group, victim and country are parsed from the item title and raw payload once,
+at write time, into ``RansomwareVictim`` rows so the ransomware map can
+aggregate with ``GROUP BY`` instead of re-parsing every item in the window on
+each request.
+"""
+from datetime import timezone as dt_timezone
+
+from django.utils.text import slugify
+
+from .dark_utils import normalize_dark_country, normalized_country_key
+
+RANSOMWARE_ADAPTER_KEY = "ransomware_live_victims"
+
+
+def ransomware_group_name(title: str, raw: dict) -> str:
+    title_prefix, separator, _title_suffix = (title or "").partition(":")
+    title_group = title_prefix.strip() if separator else ""
+    raw_group = str(raw.get("group") or "").strip()
+    if title_group:
+        return title_group
+    if raw_group:
+        return raw_group.title() if raw_group == raw_group.lower() else raw_group
+    return ""
+
+
+def ransomware_victim_name(title: str, raw: dict) -> str:
+    victim_name = str(raw.get("victim") or "").strip()
+    if victim_name:
+        return victim_name
+    _title_prefix, separator, title_suffix = (title or "").partition(":")
+    if separator and title_suffix.strip():
+        return title_suffix.strip()
+    return title
+
+
+def victim_fields(item) -> dict:
+    """Return the ``RansomwareVictim`` column values for a saved ransomware item."""
+    raw = item.raw_payload or {}
+    group_name = ransomware_group_name(item.title, raw)
+    country, country_code = normalize_dark_country(str(raw.get("country") or "").strip())
+    return {
+        "published_at": item.published_at,
+        "day": item.published_at.astimezone(dt_timezone.utc).date(),
+        "group_name": group_name[:200],
+        "group_key": slugify(group_name)[:200],
+        "victim_name": (ransomware_victim_name(item.title, raw) or "")[:500],
+        "country": country,
+        "country_code": country_code,
+        "country_key": normalized_country_key(country),
+    }
@@ -0,0 +1,173 @@
+"""Static signal scoring for standard intel items.
+
+The text-derived parts of an item's dashboard score (keywords, CVEs, section
+weight, low-signal penalty) are computed once at upsert time and stored on
+``Item``. Only the recency bonus depends on the clock and is applied at read
+time, either in Python (:func:`recency_bonus`) or in SQL.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+DASHBOARD_EXPLOIT_KEYWORDS = (
+    "actively exploited",
+    "exploited in the wild",
+    "in the wild",
+    "zero-day",
+    "0day",
+    "kev",
+    "authentication bypass",
+    "remote code execution",
+    "rce",
+)
+DASHBOARD_RANSOMWARE_KEYWORDS = (
+    "ransomware",
+    "extortion",
+    "leak site",
+    "data leak",
+    "victim listing",
+)
+DASHBOARD_LOW_SIGNAL_TITLE_HINTS = (
+    "release notes",
+    "release note",
+    "maintenance release",
+    "maintenance update",
+    "version ",
+    "version:",
+    "product update",
+    "feature update",
+    "service update",
+    "platform update",
+    "minor update",
+    "release announcement",
+    "now available",
+)
+CVE_RE = re.compile(r"\bCVE-\d{4}-\d+\b", re.IGNORECASE)
+HIGH_SIGNAL_KEYWORDS = (
+    "actively exploited",
+    "zero-day",
+    "0day",
+    "kev",
+    "rce",
+    "critical",
+    "remote code",
+    "authentication bypass",
+)
+URGENT_KEYWORDS = ("critical", "urgent", "emergency")
+
+SECTION_WEIGHTS = {
+    "advisories": 8,
+    "sweden": 4,
+    "research": 3,
+}
+RECENCY_BONUSES = (
+    (timedelta(hours=24), 10),
+    (timedelta(hours=72), 6),
+)
+RECENCY_DEFAULT_BONUS = 3
+
+SIGNAL_TONES = {
+    "Active exploitation": "amber",
+    "Ransomware": "rose",
+    "Critical CVE": "sky",
+    "CVE-driven": "sky",
+    "Urgent": "amber",
+}
+
+# Stored in Item.signal_flags so alerting can reuse the ingest-time keyword scan.
+FLAG_EXPLOIT_KEYWORD = "exploit_keyword"
+FLAG_RANSOMWARE_KEYWORD = "ransomware_keyword"
+FLAG_HIGH_SIGNAL_KEYWORD = "high_signal_keyword"
+FLAG_URGENT = "urgent"
+FLAG_LOW_SIGNAL_TITLE = "low_signal_title"
+
+
+@dataclass(frozen=True, slots=True)
+class ItemSignal:
+    score: int
+    label: str
+    cves: list[str]
+    flags: list[str]
+
+
+def extract_cve_ids(text: str) -> list[str]:
+    seen = set()
+    cves = []
+    for match in CVE_RE.findall(text or ""):
+        cve = match.upper()
+        if cve in seen:
+            continue
+        seen.add(cve)
+        cves.append(cve)
+    return cves
+
+
+def compute_item_signal(
+    title: str,
+    summary: str,
+    *,
+    section: str,
+    adapter_key: str = "",
+) -> ItemSignal:
+    lowered_title = (title or "").lower()
+    lowered_text = f"{title or ''}\n{summary or ''}".lower()
+    cves = extract_cve_ids(f"{title or ''}\n{summary or ''}")
+
+    exploit_keyword = any(keyword in lowered_text for keyword in DASHBOARD_EXPLOIT_KEYWORDS)
+    ransomware_keyword = any(keyword in lowered_text for keyword in DASHBOARD_RANSOMWARE_KEYWORDS)
+    high_signal_keyword = any(keyword in lowered_text for keyword in HIGH_SIGNAL_KEYWORDS)
+    urgent = any(keyword in lowered_text for keyword in URGENT_KEYWORDS)
+    low_signal_title = any(hint in lowered_title for hint in DASHBOARD_LOW_SIGNAL_TITLE_HINTS)
+
+    has_exploitation = section == "active" or exploit_keyword
+    has_ransomware = adapter_key == "ransomware_live_victims" or ransomware_keyword
+
+    score = 0
+    if has_exploitation:
+        score += 24
+    if has_ransomware:
+        score += 20
+    if cves:
+        score += 18 + min(len(cves), 3) * 2
+    if high_signal_keyword:
+        score += 12
+    if urgent:
+        score += 8
+    score += SECTION_WEIGHTS.get(section, 0)
+    if low_signal_title and not (cves or has_exploitation or has_ransomware or high_signal_keyword):
+        score -= 18
+
+    label = ""
+    if has_exploitation:
+        label = "Active exploitation"
+    elif has_ransomware:
+        label = "Ransomware"
+    elif cves and urgent:
+        label = "Critical CVE"
+    elif cves:
+        label = "CVE-driven"
+    elif high_signal_keyword or urgent:
+        label = "Urgent"
+
+    flags = [
+        flag
+        for flag, present in (
+            (FLAG_EXPLOIT_KEYWORD, exploit_keyword),
+            (FLAG_RANSOMWARE_KEYWORD, ransomware_keyword),
+            (FLAG_HIGH_SIGNAL_KEYWORD, high_signal_keyword),
+            (FLAG_URGENT, urgent),
+            (FLAG_LOW_SIGNAL_TITLE, low_signal_title),
+        )
+        if present
+    ]
+    return ItemSignal(score=score, label=label, cves=cves, flags=flags)
+
+
+def recency_bonus(activity_at: datetime, now: datetime) -> int:
+    age = max(now - activity_at, timedelta(0))
+    for max_age, bonus in RECENCY_BONUSES:
+        if age <= max_age:
+            return bonus
+    return RECENCY_DEFAULT_BONUS
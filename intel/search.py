@@ -0,0 +1,109 @@
+"""Full-text search over item titles and summaries.
+
+PostgreSQL uses a generated ``intel_item.search_vector`` column with a GIN
+index; SQLite (local dev) uses the FTS5 table ``intel_item_fts``, kept in step
+with items by :func:`index_items`. Both are created by migration 0020 and are
+invisible to the ORM, so queries go through ``RawSQL``.
+"""
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+PG_SEARCH_CONFIG = "simple"
+SQLITE_FTS_TABLE = "intel_item_fts"
+# bm25 column weights for (title, summary).
+SQLITE_FTS_WEIGHTS = (10.0, 1.0)
+
+_QUERY_PART_RE = re.compile(r'"([^"]*)"|(\S+)')
+_WORD_RE = re.compile(r"\w")
+
+
+def _fts5_query(query: str) -> str:
+    """Quote user input for FTS5: "phrases" stay phrases, bare terms become prefix terms."""
+    parts = []
+    for phrase, term in _QUERY_PART_RE.findall(query):
+        if phrase and _WORD_RE.search(phrase):
+            parts.append(f'"{phrase}"')
+        elif term:
+            term = term.replace('"', "")
+            if _WORD_RE.search(term):
+                parts.append(f'"{term}"*')
+    return " ".join(parts)
+
+
+def search_items(queryset, query: str):
+    """Filter ``queryset`` to items matching ``query`` and annotate ``search_rank``.
+
+    Source-name matches are kept (as before) with a NULL rank so they sort after
+    text matches.
+    """
+    source_match = Q(source__name__icontains=query)
+    vendor = connection.vendor
+
+    if vendor == "postgresql":
+        tsquery = f"websearch_to_tsquery('{PG_SEARCH_CONFIG}'::regconfig, %s)"
+        text_match = Q(
+            RawSQL(f"intel_item.search_vector @@ {tsquery}", [query], output_field=BooleanField())
+        )
+        rank = RawSQL(
+            f"CASE WHEN intel_item.search_vector @@ {tsquery} "
+            f"THEN ts_rank(intel_item.search_vector, {tsquery}) END",
+            [query, query, query],
+            output_field=FloatField(),
+        )
+    elif vendor == "sqlite":
+        fts_query = _fts5_query(query)
+        if not fts_query:
+            return queryset.filter(source_match).annotate(
+                search_rank=RawSQL("NULL", [], output_field=FloatField())
+            )
+        title_weight, summary_weight = SQLITE_FTS_WEIGHTS
+        text_match = Q(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s",
+                [fts_query],
+            )
+        )
+        rank = RawSQL(
+            f"(SELECT -bm25({SQLITE_FTS_TABLE}, {title_weight}, {summary_weight}) "
+            f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s "
+            f"AND rowid = intel_item.id)",
+            [fts_query],
+            output_field=FloatField(),
+        )
+    else:
+        return queryset.filter(
+            Q(title__icontains=query) | Q(summary__icontains=query) | source_match
+        ).annotate(search_rank=RawSQL("NULL", [], output_field=FloatField()))
+
+    return queryset.filter(text_match | source_match).annotate(search_rank=rank)
+
+
+def index_items(items) -> None:
+    """Refresh the SQLite FTS rows for saved items (PostgreSQL indexes itself)."""
+    if connection.vendor != "sqlite":
+        return
+    rows = [(item.pk, item.title, item.summary) for item in items if item.pk]
+    if not rows:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = %s",
+            [(pk,) for pk, _title, _summary in rows],
+        )
+        cursor.executemany(
+            f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, summary) VALUES (%s, %s, %s)",
+            rows,
+        )
+
+
+def prune_search_index() -> None:
+    """Drop SQLite FTS rows whose items were deleted."""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid NOT IN (SELECT id FROM intel_item)"
+        )
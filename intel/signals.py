@@ -0,0 +1,54 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .cache import bump_public_cache_version
+from .ingestion import refresh_feed_items
+from .models import Feed, Source, item_stat_keys, refresh_source_daily_stats
+
+FEED_ITEM_COPY_FIELDS = ("section", "adapter_key")
+
+
+# Item rows are deliberately not hooked: receivers would disable fast deletes in
+# prune_items, and item writes happen in commands that bump once per run.
+@receiver(post_save, sender=Source)
+@receiver(post_delete, sender=Source)
+@receiver(post_save, sender=Feed)
+@receiver(post_delete, sender=Feed)
+def invalidate_public_cache(sender, **kwargs):
+    bump_public_cache_version()
+
+
+@receiver(pre_save, sender=Feed)
+def remember_feed_item_copy_fields(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Stash the stored section/adapter so post_save can tell whether items need refreshing."""
+    instance._previous_item_copy_fields = None
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not set(FEED_ITEM_COPY_FIELDS) & set(update_fields):
+        return
+    instance._previous_item_copy_fields = (
+        Feed.objects.filter(pk=instance.pk).values_list(*FEED_ITEM_COPY_FIELDS).first()
+    )
+
+
+@receiver(post_save, sender=Feed)
+def refresh_items_after_feed_change(sender, instance, created=False, raw=False, **kwargs):
+    # Items carry a copy of section/adapter and scores weighted by them, whatever
+    # path (admin panel, Django admin, seed_sources --sync) changed the feed.
+    previous = getattr(instance, "_previous_item_copy_fields", None)
+    if created or raw or previous is None:
+        return
+    if previous != tuple(getattr(instance, name) for name in FEED_ITEM_COPY_FIELDS):
+        refresh_feed_items(instance)
+
+
+# Deleting a feed cascades to its items without Item signals, so the feed
+# collects its items' daily buckets first and rebuilds them once they are gone.
+@receiver(pre_delete, sender=Feed)
+def remember_feed_item_stat_keys(sender, instance, **kwargs):
+    instance._deleted_item_stat_keys = item_stat_keys(instance.items.all())
+
+
+@receiver(post_delete, sender=Feed)
+def refresh_stats_after_feed_delete(sender, instance, **kwargs):
+    refresh_source_daily_stats(getattr(instance, "_deleted_item_stat_keys", ()))
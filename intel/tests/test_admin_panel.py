@@ -3,8 +3,8 @@ from django.test import Client, TestCase
 from django.urls import reverse
 from django.utils import timezone
 
-from intel.forms import FeedCreateForm
-from intel.models import Feed, Source
+from intel.forms import FeedCreateForm, FeedEditForm
+from intel.models import Feed, Item, Source
 
 
 class AdminSecurityTests(TestCase):
@@ -308,3 +308,73 @@ class AdminPanelFeedFormValidationTests(TestCase):
         self.assertFalse(form.is_valid())
         self.assertIn("adapter_key", form.errors)
         self.assertIn("Adapter key should be empty for RSS/Atom feeds.", form.errors["adapter_key"])
+
+    def test_feed_edit_clears_conditional_fetch_cache(self):
+        form = FeedCreateForm(data=self._base_form_data())
+        self.assertTrue(form.is_valid(), msg=form.errors)
+        feed = form.save()
+        feed.http_etag = '"abc"'
+        feed.http_last_modified = "Sat, 07 Mar 2026 10:00:00 GMT"
+        feed.payload_hash = "f" * 64
+        feed.save()
+
+        form = FeedEditForm(data=self._base_form_data(max_age_days="30"), instance=feed)
+        self.assertTrue(form.is_valid(), msg=form.errors)
+        form.save()
+
+        feed.refresh_from_db()
+        self.assertEqual(feed.http_etag, "")
+        self.assertEqual(feed.http_last_modified, "")
+        self.assertEqual(feed.payload_hash, "")
+
+    def test_feed_section_edit_refreshes_item_copies_and_signal(self):
+        form = FeedCreateForm(data=self._base_form_data())
+        self.assertTrue(form.is_valid(), msg=form.errors)
+        feed = form.save()
+        item = Item.objects.create(
+            source=self.source,
+            feed=feed,
+            title="Routine vendor bulletin",
+            url="https://example.com/bulletin",
+        )
+        self.assertEqual(item.signal_category, "Active exploitation")
+
+        form = FeedEditForm(
+            data=self._base_form_data(section=Feed.Section.RESEARCH),
+            instance=feed,
+        )
+        self.assertTrue(form.is_valid(), msg=form.errors)
+        form.save()
+
+        item.refresh_from_db()
+        self.assertEqual(item.section, Feed.Section.RESEARCH)
+        self.assertEqual(item.adapter_key, "generic_json")
+        self.assertEqual(item.signal_category, "")
+        self.assertEqual(item.signal_score, 3)
+
+    def test_feed_section_change_outside_the_form_refreshes_item_copies(self):
+        form = FeedCreateForm(data=self._base_form_data())
+        self.assertTrue(form.is_valid(), msg=form.errors)
+        feed = form.save()
+        item = Item.objects.create(
+            source=self.source,
+            feed=feed,
+            title="Routine vendor bulletin",
+            url="https://example.com/bulletin",
+        )
+
+        # Django admin saves the whole row.
+        feed.section = Feed.Section.RESEARCH
+        feed.save()
+        item.refresh_from_db()
+        self.assertEqual(item.section, Feed.Section.RESEARCH)
+
+        # seed_sources --sync saves only the changed fields.
+        feed.section = Feed.Section.ACTIVE
+        feed.save(update_fields=["section", "updated_at"])
+        item.refresh_from_db()
+        self.assertEqual(item.section, Feed.Section.ACTIVE)
+        self.assertEqual(item.signal_category, "Active exploitation")
+
+        with self.assertNumQueries(1):
+            feed.save(update_fields=["priority"])
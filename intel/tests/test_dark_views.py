@@ -7,6 +7,7 @@ from django.urls import reverse
 from django.utils import timezone
 
 from intel.dark_models import DarkHit, DarkSource
+from intel.views import DARK_HITS_PER_PAGE
 
 User = get_user_model()
 DARK_GROUPS_URL = reverse("dark-dashboard")
@@ -313,6 +314,33 @@ class ActiveGroupsViewTests(TestCase):
         self.assertContains(response, "Watch Match")
 
 
+    def test_recent_hits_page_through_with_cursor(self):
+        for index in range(DARK_HITS_PER_PAGE + 2):
+            _make_hit(self.source_c, title=f"Paged hit {index:03d}", detected_offset_hours=1)
+        self.client.force_login(self.superuser)
+
+        first = self.client.get(DARK_RECENT_URL, {"window": "30d"})
+        first_page = first.context["page_obj"]
+
+        self.assertEqual(len(first_page.object_list), DARK_HITS_PER_PAGE)
+        self.assertTrue(first_page.has_next)
+        self.assertIsNotNone(first.context["hits_total"])
+
+        second = self.client.get(DARK_RECENT_URL, {"window": "30d", "cursor": first_page.next_cursor})
+        second_page = second.context["page_obj"]
+        seen_first = {hit.pk for hit in first_page.object_list}
+        seen_second = {hit.pk for hit in second_page.object_list}
+
+        self.assertFalse(seen_first & seen_second)
+        self.assertEqual(
+            len(seen_first | seen_second),
+            DarkHit.objects.filter(detected_at__gte=timezone.now() - timedelta(days=30)).count(),
+        )
+        self.assertFalse(second_page.has_next)
+        self.assertIsNone(second.context["hits_total"])
+        self.assertContains(second, "Newest")
+
+
 class DarkMapViewTests(TestCase):
     def setUp(self):
         self.superuser = User.objects.create_superuser(
@@ -669,6 +697,19 @@ class DarkMapViewTests(TestCase):
         top_countries = [row["country"] for row in payload["snapshot"]["top_countries"]]
         self.assertNotIn("Finland", top_countries)
 
+    def test_map_live_endpoint_answers_unchanged_poll_with_not_modified(self):
+        self.client.force_login(self.superuser)
+        params = {"window": "24h", "cursor": "0"}
+        etag = self.client.get(DARK_MAP_LIVE_URL, params)["ETag"]
+
+        response = self.client.get(DARK_MAP_LIVE_URL, params, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        _make_hit(self.source_a, title="Live Sweden Incident", country="Sweden", record_type="incident")
+        response = self.client.get(DARK_MAP_LIVE_URL, params, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Live Sweden Incident", [event["title"] for event in response.json()["events"]])
+
     def test_map_live_endpoint_does_not_fake_country_animation_for_countryless_records(self):
         countryless_source = _make_source(slug="map-live-countryless", name="Map Live Countryless")
         countryless_hit = _make_hit(
@@ -1,10 +1,15 @@
 from collections import Counter
 from datetime import timedelta
 
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
+from intel.cache import batched_invalidation, bump_public_cache_version, public_cache_version
 from intel.models import Feed, Item, Source
 
 
@@ -71,6 +76,58 @@ class DashboardViewTests(TestCase):
         self.assertEqual(trending["CVE-2026-2222"], 1)
         self.assertNotIn("CVE-2026-9999", trending)
 
+    def test_exact_cve_query_uses_item_cve_links(self):
+        feed = self._create_feed(
+            source_name="Advisory Lab",
+            source_slug="advisory-lab",
+            section=Feed.Section.ADVISORIES,
+        )
+        self._create_item(feed=feed, title="Fix for CVE-2026-1111", age_hours=1)
+        self._create_item(feed=feed, title="Fix for CVE-2026-11112", age_hours=2)
+        self._create_item(feed=feed, title="Unrelated advisory", age_hours=3)
+
+        response = self.client.get("/advisories/", {"q": "cve-2026-1111"})
+
+        self.assertEqual(
+            [item.title for item in response.context["page_obj"].object_list],
+            ["Fix for CVE-2026-1111"],
+        )
+
+    def test_item_lists_filter_on_bare_published_at_column(self):
+        feed = self._create_feed(
+            source_name="Advisory Lab",
+            source_slug="advisory-lab",
+            section=Feed.Section.ADVISORIES,
+        )
+        self._create_item(feed=feed, title="Recent advisory", age_hours=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/")
+            self.client.get("/advisories/")
+
+        item_queries = [query["sql"] for query in queries.captured_queries if "intel_item" in query["sql"]]
+        self.assertTrue(item_queries)
+        self.assertFalse(any("COALESCE" in sql.upper() for sql in item_queries))
+
+    def test_section_page_totals_do_not_join_feed_or_count(self):
+        feed = self._create_feed(
+            source_name="Active Lab",
+            source_slug="active-lab",
+            section=Feed.Section.ACTIVE,
+        )
+        self._create_item(feed=feed, title="Exploit report", age_hours=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/active/")
+
+        self.assertEqual(response.context["filtered_total"], 1)
+        item_sql = [query["sql"] for query in queries.captured_queries if '"intel_item"' in query["sql"]]
+        facet_queries = [sql for sql in item_sql if "GROUP BY" in sql]
+        self.assertTrue(facet_queries)
+        self.assertFalse(any('"intel_feed"' in sql for sql in facet_queries))
+        # Totals come from the facet rows and pages are cursor seeks: no COUNT(*) over items.
+        self.assertFalse(any(sql.startswith("SELECT COUNT(") for sql in item_sql))
+
     def test_advisories_block_balances_per_source(self):
         feed_alpha = self._create_feed(
             source_name="Alpha Advisories",
@@ -126,6 +183,42 @@ class DashboardViewTests(TestCase):
         self.assertEqual(top_labels[keyword_title], "Active exploitation")
         self.assertEqual(top_labels[cve_title], "CVE-driven")
 
+    def test_item_signal_columns_are_computed_on_save(self):
+        feed = self._create_feed(
+            source_name="Advisory Source",
+            source_slug="advisory-source",
+            section=Feed.Section.ADVISORIES,
+        )
+        item = self._create_item(
+            feed=feed,
+            title="Critical fix for CVE-2026-7777 and cve-2026-8888",
+            summary="Urgent patch guidance.",
+        )
+
+        item.refresh_from_db()
+        self.assertEqual(item.cve_ids, ["CVE-2026-7777", "CVE-2026-8888"])
+        self.assertEqual(item.signal_category, "Critical CVE")
+        # CVEs 18+4, high-signal keyword 12, urgent 8, advisories 8; no recency part.
+        self.assertEqual(item.signal_score, 50)
+        self.assertIn("urgent", item.signal_flags)
+
+    def test_high_signal_panel_adds_recency_to_stored_score(self):
+        feed = self._create_feed(
+            source_name="Active Source",
+            source_slug="active-source",
+            section=Feed.Section.ACTIVE,
+        )
+        for index in range(20):
+            self._create_item(feed=feed, title=f"Exploit wave {index}", age_hours=index)
+        self._create_item(feed=feed, title="Old exploit", age_days=10)
+
+        response = self.client.get("/")
+        high_signal_items = response.context["high_signal_items"]
+        self.assertEqual(len(high_signal_items), 15)
+        self.assertNotIn("Old exploit", [item.title for item in high_signal_items])
+        self.assertEqual(high_signal_items[0].title, "Exploit wave 0")
+        self.assertEqual(high_signal_items[0].dashboard_score, 24 + 10)
+
     def test_high_signal_item_source_links_use_item_section(self):
         feed = self._create_feed(
             source_name="Bleeping Computer",
@@ -491,3 +584,110 @@ class DashboardViewTests(TestCase):
         self.assertContains(response, 'data-mobile-section="trending-cves"', html=False)
         self.assertContains(response, 'data-iphone-mobile-trim="trending-cve-overflow"', html=False)
         self.assertContains(response, "Top 4 CVEs shown on smaller phones.")
+
+    def test_stat_tiles_come_from_combined_aggregates(self):
+        advisories = self._create_feed(
+            source_name="Stats Vendor",
+            source_slug="stats-vendor",
+            section=Feed.Section.ADVISORIES,
+        )
+        self._create_item(feed=advisories, title="Fresh advisory", age_hours=0)
+        self._create_item(feed=advisories, title="Two day advisory", age_days=2)
+        self._create_item(feed=advisories, title="Old advisory", age_days=9)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/")
+
+        self.assertEqual(response.context["items_today_count"], 1)
+        self.assertEqual(response.context["items_week_count"], 2)
+        self.assertEqual(response.context["active_feeds_count"], 1)
+        self.assertEqual(response.context["enabled_feed_count"], 1)
+        self.assertEqual(response.context["feed_status_counts"], {"ok": 0, "error": 0, "never": 1})
+        self.assertEqual(
+            [(row["source__slug"], row["item_count"]) for row in response.context["trending_sources"]],
+            [("stats-vendor", 1)],
+        )
+        count_queries = [query["sql"] for query in queries.captured_queries if "COUNT(" in query["sql"]]
+        self.assertEqual(len(count_queries), 4)
+
+    def test_server_timing_header_reports_queries_to_superusers(self):
+        self.assertNotIn("Server-Timing", self.client.get("/about/"))
+
+        user = get_user_model().objects.create_superuser(
+            username="timing-admin", email="timing-admin@example.com", password="pw"
+        )
+        self.client.force_login(user)
+        response = self.client.get("/")
+
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="\d+ queries", app;dur=[\d.]+$')
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class PublicPageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.source = Source.objects.create(name="Cache Source", slug="cache-source")
+        self.feed = Feed.objects.create(
+            source=self.source,
+            name="Cache Feed",
+            url="https://example.com/cache.xml",
+            feed_type=Feed.FeedType.RSS,
+            section=Feed.Section.ADVISORIES,
+        )
+
+    def _create_item(self, title):
+        return Item.objects.create(
+            source=self.source,
+            feed=self.feed,
+            title=title,
+            url=f"https://example.com/{title.lower().replace(' ', '-')}",
+            stable_id="",
+            published_at=timezone.now() - timedelta(hours=1),
+        )
+
+    def test_anonymous_page_is_served_from_cache_until_version_bump(self):
+        self._create_item("First cached advisory")
+        self.assertContains(self.client.get("/"), "First cached advisory")
+
+        self._create_item("Second cached advisory")
+        with self.assertNumQueries(0):
+            response = self.client.get("/")
+        self.assertNotContains(response, "Second cached advisory")
+
+        bump_public_cache_version()
+        self.assertContains(self.client.get("/"), "Second cached advisory")
+
+    def test_superuser_pages_bypass_response_cache(self):
+        user = get_user_model().objects.create_superuser(
+            username="cache-admin", email="cache-admin@example.com", password="pw"
+        )
+        self.client.force_login(user)
+        self._create_item("First cached advisory")
+        self.client.get("/sources/")
+
+        self._create_item("Second cached advisory")
+        self.assertContains(self.client.get("/"), "Second cached advisory")
+
+    def test_feed_edits_bump_version_once_per_batch(self):
+        start = public_cache_version()
+        with batched_invalidation():
+            self.feed.save()
+            self.source.save()
+            self.assertEqual(public_cache_version(), start)
+        batched = public_cache_version()
+        self.assertNotEqual(batched, start)
+
+        self.feed.save()
+        self.assertNotIn(public_cache_version(), {start, batched})
+
+    def test_page_cache_ignores_unknown_query_parameters(self):
+        self._create_item("First cached advisory")
+        self.client.get("/")
+        self.client.get("/", {"utm_source": "mail"})
+
+        self._create_item("Second cached advisory")
+        self.assertNotContains(self.client.get("/"), "Second cached advisory")
+        # Unknown parameters are served uncached rather than keyed one entry each.
+        self.assertContains(self.client.get("/", {"utm_source": "mail"}), "Second cached advisory")
@@ -1,7 +1,11 @@
+from datetime import datetime, timezone
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-from intel.ingestion import upsert_item
-from intel.models import Feed, Item, Source
+from intel.ingestion import NormalizedEntry, upsert_item, upsert_normalized_items
+from intel.models import Feed, Item, ItemCve, Source
 
 
 class DedupeTests(TestCase):
@@ -105,3 +109,97 @@ class DedupeTests(TestCase):
         self.assertTrue(created_a)
         self.assertTrue(created_b)
         self.assertEqual(Item.objects.count(), 2)
+
+    def _entry(self, idx, **overrides):
+        values = {
+            "title": f"Advisory {idx}",
+            "url": f"https://example.com/advisory-{idx}",
+            "canonical_url": f"https://example.com/advisory-{idx}",
+            "published_at": datetime(2026, 2, 8, 10, 0, tzinfo=timezone.utc),
+            "summary": f"summary {idx}",
+            "raw_payload": {},
+            "external_id": f"ADV-{idx}",
+        }
+        values.update(overrides)
+        return NormalizedEntry(**values)
+
+    def test_batch_upsert_uses_bounded_queries(self):
+        upsert_normalized_items(self.feed, [self._entry(idx) for idx in range(20)])
+
+        entries = [self._entry(idx, summary="changed") for idx in range(40)]
+        with CaptureQueriesContext(connection) as queries:
+            results = upsert_normalized_items(self.feed, entries)
+
+        self.assertLessEqual(len(queries), 10)
+        self.assertEqual([result.created for result in results], [False] * 20 + [True] * 20)
+        self.assertEqual(Item.objects.count(), 40)
+        self.assertEqual(Item.objects.filter(summary="changed").count(), 40)
+        self.assertTrue(all(result.item.pk for result in results))
+
+    def test_batch_upsert_dedupes_within_batch_like_sequential_upserts(self):
+        entries = [
+            self._entry(1, summary="first"),
+            self._entry(
+                2,
+                url="https://example.com/advisory-1?utm_source=rss",
+                canonical_url="https://example.com/advisory-1",
+                summary="second",
+            ),
+            self._entry(1, url="https://example.com/other", canonical_url="https://example.com/other"),
+        ]
+
+        results = upsert_normalized_items(self.feed, entries)
+
+        # The second entry re-keys the first item to ADV-2, so the third no longer matches it.
+        self.assertEqual([result.created for result in results], [True, False, True])
+        self.assertEqual(results[0].item.pk, results[1].item.pk)
+        self.assertEqual(Item.objects.count(), 2)
+        merged = Item.objects.get(pk=results[0].item.pk)
+        self.assertEqual(merged.external_id, "ADV-2")
+        self.assertEqual(merged.summary, "second")
+        self.assertEqual(Item.objects.get(pk=results[2].item.pk).external_id, "ADV-1")
+
+    def test_unchanged_entries_are_not_rewritten(self):
+        upsert_normalized_items(self.feed, [self._entry(1), self._entry(2)])
+        before = dict(Item.objects.values_list("external_id", "updated_at"))
+
+        with CaptureQueriesContext(connection) as queries:
+            results = upsert_normalized_items(
+                self.feed, [self._entry(1), self._entry(2, summary="new summary")]
+            )
+
+        self.assertEqual([result.changed for result in results], [False, True])
+        self.assertFalse(any(result.created for result in results))
+        self.assertFalse(any(query["sql"].startswith("INSERT") for query in queries.captured_queries))
+        after = dict(Item.objects.values_list("external_id", "updated_at"))
+        self.assertEqual(after["ADV-1"], before["ADV-1"])
+        self.assertGreater(after["ADV-2"], before["ADV-2"])
+        self.assertEqual(Item.objects.get(external_id="ADV-2").summary, "new summary")
+
+    def test_batch_upsert_maintains_cve_links(self):
+        upsert_normalized_items(
+            self.feed,
+            [
+                self._entry(1, summary="Fixes CVE-2026-1000 and CVE-2026-2000"),
+                self._entry(2, summary="Also CVE-2026-1000"),
+            ],
+        )
+
+        self.assertEqual(
+            sorted(ItemCve.objects.values_list("item__external_id", "cve__cve_id")),
+            [
+                ("ADV-1", "CVE-2026-1000"),
+                ("ADV-1", "CVE-2026-2000"),
+                ("ADV-2", "CVE-2026-1000"),
+            ],
+        )
+
+        upsert_normalized_items(self.feed, [self._entry(1, summary="Now only CVE-2026-3000")])
+
+        self.assertEqual(
+            sorted(ItemCve.objects.values_list("item__external_id", "cve__cve_id")),
+            [("ADV-1", "CVE-2026-3000"), ("ADV-2", "CVE-2026-1000")],
+        )
+        link = ItemCve.objects.get(cve__cve_id="CVE-2026-3000")
+        self.assertEqual(link.published_at, link.item.published_at)
+
@@ -0,0 +1,47 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import SimpleTestCase
+
+from intel.http import close_sessions, http_session, pool_stats
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpSessionPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(close_sessions)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+
+    def test_session_is_reused_per_thread(self):
+        self.assertIs(http_session(), http_session())
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(http_session()))
+        worker.start()
+        worker.join()
+        self.assertIsNot(other[0], http_session())
+
+    def test_repeated_fetches_reuse_one_connection(self):
+        for _attempt in range(3):
+            response = http_session().get(self.url, timeout=5)
+            self.assertEqual(response.text, "ok")
+
+        stats = pool_stats()[f"http://127.0.0.1:{self.server.server_port}"]
+        self.assertEqual(stats, {"requests": 3, "connections": 1})
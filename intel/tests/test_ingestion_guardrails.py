@@ -1,4 +1,5 @@
 import json
+import threading
 from datetime import timedelta
 from io import StringIO
 from unittest.mock import patch
@@ -145,7 +146,7 @@ class IngestionGuardrailTests(TestCase):
                 yield chunk
 
         with patch(
-            "intel.management.commands.ingest_sources.requests.get",
+            "requests.Session.get",
             return_value=DummyResponse(),
         ):
             payload, status = Command()._fetch_once(self.feed)
@@ -338,6 +339,175 @@ class IngestionGuardrailTests(TestCase):
         mock_epss.assert_called_once()
         mock_generic.assert_not_called()
 
+    @override_settings(INTEL_FETCH_CONCURRENCY=4, INTEL_FETCH_PER_HOST_CONCURRENCY=2)
+    def test_feeds_are_fetched_concurrently(self):
+        other_feed = Feed.objects.create(
+            source=self.source,
+            name="Guard Feed Two",
+            url="https://other.example.org/feed.xml",
+            feed_type=Feed.FeedType.RSS,
+            section=Feed.Section.ADVISORIES,
+        )
+        # Both fetches must be in flight at once to get past the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(feed, **kwargs):
+            barrier.wait()
+            return b"<rss/>", 200
+
+        with patch(
+            "intel.management.commands.ingest_sources.Command._fetch_with_retries",
+            side_effect=fetch,
+        ), patch(
+            "intel.management.commands.ingest_sources.parse_feed_payload",
+            return_value=[],
+        ):
+            call_command("ingest_sources", stdout=StringIO(), stderr=StringIO())
+
+        self.assertEqual(FetchRun.objects.filter(ok=True).count(), 2)
+        self.assertEqual(
+            set(FetchRun.objects.values_list("feed_id", flat=True)),
+            {self.feed.id, other_feed.id},
+        )
+
+    @override_settings(INTEL_FETCH_CONCURRENCY=4, INTEL_FETCH_PER_HOST_CONCURRENCY=1)
+    def test_per_host_limit_serializes_fetches_to_same_host(self):
+        for idx in range(3):
+            Feed.objects.create(
+                source=self.source,
+                name=f"Same Host {idx}",
+                url=f"https://example.com/feed-{idx}.xml",
+                feed_type=Feed.FeedType.RSS,
+                section=Feed.Section.ADVISORIES,
+            )
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fetch(feed, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            threading.Event().wait(0.05)
+            with lock:
+                state["active"] -= 1
+            return b"<rss/>", 200
+
+        with patch(
+            "intel.management.commands.ingest_sources.Command._fetch_with_retries",
+            side_effect=fetch,
+        ), patch(
+            "intel.management.commands.ingest_sources.parse_feed_payload",
+            return_value=[],
+        ):
+            call_command("ingest_sources", stdout=StringIO(), stderr=StringIO())
+
+        self.assertEqual(state["peak"], 1)
+        self.assertEqual(FetchRun.objects.filter(ok=True).count(), 4)
+
+    def _dummy_response(self, *, status_code, body=b"", headers=None):
+        class DummyResponse:
+            def __init__(self):
+                self.status_code = status_code
+                self.headers = headers or {}
+
+            def raise_for_status(self):
+                return None
+
+            def iter_content(self, chunk_size=8192):
+                del chunk_size
+                yield body
+
+            def close(self):
+                return None
+
+        return DummyResponse()
+
+    def test_conditional_get_stores_validators_and_short_circuits_on_304(self):
+        payload = b"""<?xml version="1.0"?>
+        <rss version="2.0"><channel><title>Example</title>
+          <item><title>Alert One</title><link>https://example.com/alert-one</link></item>
+        </channel></rss>"""
+        first = self._dummy_response(
+            status_code=200,
+            body=payload,
+            headers={"ETag": '"abc123"', "Last-Modified": "Sat, 07 Mar 2026 10:00:00 GMT"},
+        )
+        with patch(
+            "requests.Session.get",
+            return_value=first,
+        ) as mock_get:
+            call_command("ingest_sources", feed=str(self.feed.id), stdout=StringIO())
+
+        self.assertNotIn("If-None-Match", mock_get.call_args.kwargs["headers"])
+        self.feed.refresh_from_db()
+        self.assertEqual(self.feed.http_etag, '"abc123"')
+        self.assertEqual(self.feed.http_last_modified, "Sat, 07 Mar 2026 10:00:00 GMT")
+        self.assertEqual(Item.objects.filter(feed=self.feed).count(), 1)
+
+        with patch(
+            "requests.Session.get",
+            return_value=self._dummy_response(status_code=304),
+        ) as mock_get, patch(
+            "intel.management.commands.ingest_sources.parse_feed_payload"
+        ) as mock_parse:
+            call_command("ingest_sources", feed=str(self.feed.id), stdout=StringIO())
+
+        headers = mock_get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"abc123"')
+        self.assertEqual(headers["If-Modified-Since"], "Sat, 07 Mar 2026 10:00:00 GMT")
+        mock_parse.assert_not_called()
+        run = FetchRun.objects.filter(feed=self.feed).order_by("-id").first()
+        self.assertTrue(run.ok)
+        self.assertTrue(run.not_modified)
+        self.assertEqual(run.http_status, 304)
+        self.assertEqual(run.items_fetched, 0)
+        self.feed.refresh_from_db()
+        self.assertEqual(self.feed.http_etag, '"abc123"')
+
+    def test_force_and_backfill_runs_skip_conditional_headers(self):
+        self.feed.http_etag = '"abc123"'
+        self.feed.save(update_fields=["http_etag", "updated_at"])
+
+        for extra in ({"force": True}, {"since_days": 30}):
+            with patch(
+                "requests.Session.get",
+                return_value=self._dummy_response(status_code=200, body=b"<rss/>"),
+            ) as mock_get:
+                call_command("ingest_sources", feed=str(self.feed.id), stdout=StringIO(), **extra)
+            self.assertNotIn("If-None-Match", mock_get.call_args.kwargs["headers"])
+
+    def test_identical_payload_skips_parse_and_records_skip_counter(self):
+        payload = b"""<?xml version="1.0"?>
+        <rss version="2.0"><channel><title>Example</title>
+          <item><title>Alert One</title><link>https://example.com/alert-one</link></item>
+          <item><title>Alert Two</title><link>https://example.com/alert-two</link></item>
+        </channel></rss>"""
+
+        with patch(
+            "requests.Session.get",
+            return_value=self._dummy_response(status_code=200, body=payload),
+        ):
+            call_command("ingest_sources", feed=str(self.feed.id), stdout=StringIO())
+
+        self.feed.refresh_from_db()
+        self.assertEqual(len(self.feed.payload_hash), 64)
+        self.assertEqual(self.feed.payload_entries, 2)
+
+        with patch(
+            "requests.Session.get",
+            return_value=self._dummy_response(status_code=200, body=payload),
+        ), patch(
+            "intel.management.commands.ingest_sources.parse_feed_payload"
+        ) as mock_parse:
+            call_command("ingest_sources", feed=str(self.feed.id), stdout=StringIO())
+
+        mock_parse.assert_not_called()
+        run = FetchRun.objects.filter(feed=self.feed).order_by("-id").first()
+        self.assertTrue(run.ok)
+        self.assertFalse(run.not_modified)
+        self.assertEqual(run.items_skipped_unchanged, 2)
+        self.assertEqual(run.items_stored, 0)
+
 
 class PruneItemsCommandTests(TestCase):
     def setUp(self):
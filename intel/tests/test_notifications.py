@@ -1,4 +1,5 @@
 import json
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import requests
@@ -6,10 +7,12 @@ from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from intel.dark_models import DarkHit, DarkSource
-from intel.models import Feed, Item, Source
+from intel.models import Feed, Item, OutboundAlert, Source
 from intel.notifications import (
     build_dark_hit_alert_fingerprint,
     dark_hit_alert_reason,
+    dispatch_pending_alerts,
+    enqueue_alert,
     get_generic_intel_alert_context,
     send_dark_hit_alert,
     send_generic_intel_alert,
@@ -22,6 +25,20 @@ from intel.notifications import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _queued_embeds(channel=None):
+    queryset = OutboundAlert.objects.filter(status=OutboundAlert.Status.PENDING)
+    if channel:
+        queryset = queryset.filter(channel=channel)
+    return [alert.embed for alert in queryset.order_by("id")]
+
+
+def _response(status_code=204, headers=None, json_body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = json_body or {}
+    return response
+
 def _make_dark_source(slug="test-onion", url="http://test.onion/"):
     return DarkSource.objects.create(
         name="Test Onion",
@@ -131,9 +148,8 @@ class DarkHitAlertTests(TestCase):
     def test_dark_hit_no_webhook(self):
         source = _make_dark_source()
         hit = _make_dark_hit(source)
-        with patch("intel.notifications.requests.post") as mock_post:
-            send_dark_hit_alert(hit)
-            mock_post.assert_not_called()
+        send_dark_hit_alert(hit)
+        self.assertEqual(_queued_embeds(), [])
 
     @override_settings(DARK_DISCORD_WEBHOOK="https://discord.com/api/webhooks/test/token")
     def test_incident_dark_hit_sends_correct_payload(self):
@@ -149,33 +165,32 @@ class DarkHitAlertTests(TestCase):
             group_name="Akira",
             country="Sweden",
         )
-        with patch("intel.notifications.requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             send_dark_hit_alert(hit, why_alerted="new finding")
-            mock_post.assert_called_once()
-            call_kwargs = mock_post.call_args
-            sent_json = call_kwargs.kwargs.get("json") or call_kwargs.args[1]
-            embed = sent_json["embeds"][0]
-            self.assertEqual(embed["title"], "Breach data found")
-            self.assertIn(
-                {"name": "Regex matched", "value": r"victim", "inline": True},
-                embed["fields"],
-            )
-            self.assertIn(
-                {"name": "Matched in", "value": "victim, group, details", "inline": True},
-                embed["fields"],
-            )
-            self.assertIn(
-                {"name": "Why alerted", "value": "new finding", "inline": True},
-                embed["fields"],
-            )
+            mock_post.assert_not_called()
+        embeds = _queued_embeds(OutboundAlert.Channel.DARK)
+        self.assertEqual(len(embeds), 1)
+        embed = embeds[0]
+        self.assertEqual(embed["title"], "Breach data found")
+        self.assertIn(
+            {"name": "Regex matched", "value": r"victim", "inline": True},
+            embed["fields"],
+        )
+        self.assertIn(
+            {"name": "Matched in", "value": "victim, group, details", "inline": True},
+            embed["fields"],
+        )
+        self.assertIn(
+            {"name": "Why alerted", "value": "new finding", "inline": True},
+            embed["fields"],
+        )
 
     @override_settings(DARK_DISCORD_WEBHOOK="https://discord.com/api/webhooks/test/token")
     def test_group_dark_hit_does_not_send_alert(self):
         source = _make_dark_source()
         hit = _make_dark_hit(source, title="Black Basta", record_type="group")
-        with patch("intel.notifications.requests.post") as mock_post:
-            send_dark_hit_alert(hit)
-            mock_post.assert_not_called()
+        send_dark_hit_alert(hit)
+        self.assertEqual(_queued_embeds(), [])
 
     @override_settings(DARK_DISCORD_WEBHOOK="https://discord.com/api/webhooks/test/token")
     def test_unmatched_incident_dark_hit_does_not_send_alert(self):
@@ -187,32 +202,36 @@ class DarkHitAlertTests(TestCase):
             matched_keywords=[],
             is_watch_match=False,
         )
-        with patch("intel.notifications.requests.post") as mock_post:
-            send_dark_hit_alert(hit)
-            mock_post.assert_not_called()
+        send_dark_hit_alert(hit)
+        self.assertEqual(_queued_embeds(), [])
 
     @override_settings(DARK_DISCORD_WEBHOOK="https://discord.com/api/webhooks/test/token")
     def test_dark_hit_request_fails(self):
         source = _make_dark_source()
         hit = _make_dark_hit(source, record_type="incident")
+        send_dark_hit_alert(hit)
         with patch(
-            "intel.notifications.requests.post",
+            "requests.Session.post",
             side_effect=requests.RequestException("connection refused"),
         ):
-            # Must not raise
-            send_dark_hit_alert(hit)
+            # Must not raise; the alert stays queued for a later retry.
+            stats = dispatch_pending_alerts()
+
+        self.assertEqual(stats["retried"], 1)
+        alert = OutboundAlert.objects.get()
+        self.assertEqual(alert.status, OutboundAlert.Status.PENDING)
+        self.assertEqual(alert.attempts, 1)
+        self.assertGreater(alert.next_attempt_at, timezone.now())
+        self.assertNotIn("discord.com", alert.last_error)
 
     @override_settings(DARK_DISCORD_WEBHOOK="https://discord.com/api/webhooks/test/token")
     def test_dark_hit_onion_url_masked(self):
         source = _make_dark_source(url="http://abc123xyz.onion/secret-forum")
         hit = _make_dark_hit(source, record_type="incident")
-        with patch("intel.notifications.requests.post") as mock_post:
-            send_dark_hit_alert(hit)
-            mock_post.assert_called_once()
-            call_kwargs = mock_post.call_args
-            sent_json = call_kwargs.kwargs.get("json") or call_kwargs.args[1]
-            payload_str = json.dumps(sent_json)
-            self.assertNotIn(".onion", payload_str)
+        send_dark_hit_alert(hit)
+        embeds = _queued_embeds(OutboundAlert.Channel.DARK)
+        self.assertEqual(len(embeds), 1)
+        self.assertNotIn(".onion", json.dumps(embeds))
 
     def test_identical_recent_dark_hit_fingerprint_is_suppressed(self):
         source = _make_dark_source()
@@ -278,23 +297,20 @@ class EPSSAlertTests(TestCase):
     @override_settings(INTEL_DISCORD_WEBHOOK="https://discord.com/api/webhooks/epss/token", EPSS_ALERT_THRESHOLD=0.7)
     def test_epss_above_threshold(self):
         item = _make_item(title="CVE-2024-1234 \u2014 EPSS 85.0%")
-        with patch("intel.notifications.requests.post") as mock_post:
-            send_high_epss_alert(item)
-            mock_post.assert_called_once()
+        send_high_epss_alert(item)
+        self.assertEqual(len(_queued_embeds(OutboundAlert.Channel.INTEL)), 1)
 
     @override_settings(INTEL_DISCORD_WEBHOOK="https://discord.com/api/webhooks/epss/token", EPSS_ALERT_THRESHOLD=0.7)
     def test_epss_below_threshold(self):
         item = _make_item(title="CVE-2024-5678 \u2014 EPSS 50.0%")
-        with patch("intel.notifications.requests.post") as mock_post:
-            send_high_epss_alert(item)
-            mock_post.assert_not_called()
+        send_high_epss_alert(item)
+        self.assertEqual(_queued_embeds(), [])
 
     @override_settings(INTEL_DISCORD_WEBHOOK="https://discord.com/api/webhooks/epss/token", EPSS_ALERT_THRESHOLD=0.7)
     def test_epss_no_match_in_title(self):
         item = _make_item(title="Something without EPSS score here")
-        with patch("intel.notifications.requests.post") as mock_post:
-            send_high_epss_alert(item)
-            mock_post.assert_not_called()
+        send_high_epss_alert(item)
+        self.assertEqual(_queued_embeds(), [])
 
     @override_settings(
         INTEL_DISCORD_WEBHOOK="",
@@ -303,11 +319,12 @@ class EPSSAlertTests(TestCase):
     )
     def test_intel_webhook_fallback(self):
         item = _make_item(title="CVE-2024-9999 \u2014 EPSS 90.0%")
-        with patch("intel.notifications.requests.post") as mock_post:
-            send_high_epss_alert(item)
-            mock_post.assert_called_once()
-            call_url = mock_post.call_args.args[0]
-            self.assertIn("fallback", call_url)
+        send_high_epss_alert(item)
+        with patch("requests.Session.post", return_value=_response()) as mock_post:
+            dispatch_pending_alerts()
+        mock_post.assert_called_once()
+        call_url = mock_post.call_args.args[0]
+        self.assertIn("fallback", call_url)
 
 
 class GenericIntelAlertTests(TestCase):
@@ -341,17 +358,16 @@ class GenericIntelAlertTests(TestCase):
             raw_payload={"country": "Sweden"},
         )
 
-        with patch("intel.notifications.requests.post") as mock_post:
-            send_generic_intel_alert(
-                item,
-                why_alerted="Sweden-relevant intel",
-                cves=["CVE-2026-2222"],
-                country="Sweden",
-            )
+        send_generic_intel_alert(
+            item,
+            why_alerted="Sweden-relevant intel",
+            cves=["CVE-2026-2222"],
+            country="Sweden",
+        )
 
-        mock_post.assert_called_once()
-        sent_json = mock_post.call_args.kwargs.get("json") or mock_post.call_args.args[1]
-        embed = sent_json["embeds"][0]
+        embeds = _queued_embeds(OutboundAlert.Channel.INTEL)
+        self.assertEqual(len(embeds), 1)
+        embed = embeds[0]
         self.assertEqual(embed["title"], "High-signal intel: Nordic CERT warns of credential theft campaign")
         self.assertEqual(
             embed["description"],
@@ -369,3 +385,124 @@ class GenericIntelAlertTests(TestCase):
             {"name": "Country", "value": "Sweden", "inline": True},
             embed["fields"],
         )
+
+
+# ---------------------------------------------------------------------------
+# Alert dispatch tests
+# ---------------------------------------------------------------------------
+
+@override_settings(
+    INTEL_DISCORD_WEBHOOK="https://discord.com/api/webhooks/intel/token",
+    DARK_DISCORD_WEBHOOK="https://discord.com/api/webhooks/dark/token",
+    ALERT_BATCH_MAX_EMBEDS=10,
+    ALERT_MAX_ATTEMPTS=2,
+)
+class AlertDispatchTests(TestCase):
+    def _enqueue(self, count, channel=OutboundAlert.Channel.INTEL):
+        for index in range(count):
+            enqueue_alert(channel, {"title": f"Alert {index}", "description": "x"})
+
+    def test_dispatch_batches_embeds_per_channel(self):
+        self._enqueue(12)
+        self._enqueue(1, channel=OutboundAlert.Channel.DARK)
+
+        with patch("requests.Session.post", return_value=_response()) as mock_post:
+            stats = dispatch_pending_alerts()
+
+        self.assertEqual(stats["sent"], 13)
+        self.assertEqual(
+            sorted(len(call.kwargs["json"]["embeds"]) for call in mock_post.call_args_list),
+            [1, 2, 10],
+        )
+        dark_calls = [call for call in mock_post.call_args_list if "dark" in call.args[0]]
+        self.assertEqual(len(dark_calls), 1)
+        self.assertFalse(OutboundAlert.objects.exclude(status=OutboundAlert.Status.SENT).exists())
+
+    def test_dispatch_respects_embed_character_budget(self):
+        for index in range(3):
+            enqueue_alert(OutboundAlert.Channel.INTEL, {"title": f"Alert {index}", "description": "x" * 2500})
+
+        with patch("requests.Session.post", return_value=_response()) as mock_post:
+            dispatch_pending_alerts()
+
+        self.assertEqual(
+            [len(call.kwargs["json"]["embeds"]) for call in mock_post.call_args_list],
+            [2, 1],
+        )
+
+    def test_rate_limited_batch_is_deferred_without_counting_attempt(self):
+        self._enqueue(15)
+        responses = [
+            _response(),
+            _response(status_code=429, json_body={"retry_after": 30}),
+        ]
+        with patch("requests.Session.post", side_effect=responses) as mock_post:
+            stats = dispatch_pending_alerts()
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(stats["sent"], 10)
+        self.assertEqual(stats["deferred"], 5)
+        deferred = OutboundAlert.objects.filter(status=OutboundAlert.Status.PENDING)
+        self.assertEqual(deferred.count(), 5)
+        for alert in deferred:
+            self.assertEqual(alert.attempts, 0)
+            self.assertGreater(alert.next_attempt_at, timezone.now() + timedelta(seconds=20))
+
+        with patch("requests.Session.post") as mock_post:
+            dispatch_pending_alerts()
+        mock_post.assert_not_called()
+
+    def test_exhausted_retries_mark_alert_failed(self):
+        self._enqueue(1)
+        alert = OutboundAlert.objects.get()
+
+        with patch("requests.Session.post", return_value=_response(status_code=500)):
+            dispatch_pending_alerts()
+            alert.refresh_from_db()
+            self.assertEqual(alert.status, OutboundAlert.Status.PENDING)
+            OutboundAlert.objects.filter(pk=alert.pk).update(next_attempt_at=timezone.now())
+            stats = dispatch_pending_alerts()
+
+        alert.refresh_from_db()
+        self.assertEqual(stats["failed"], 1)
+        self.assertEqual(alert.status, OutboundAlert.Status.FAILED)
+        self.assertEqual(alert.attempts, 2)
+        self.assertEqual(alert.last_error, "HTTP 500")
+
+    def test_rejected_batch_is_resent_singly_so_only_bad_alert_fails(self):
+        self._enqueue(3)
+        enqueue_alert(OutboundAlert.Channel.INTEL, {"title": "Bad", "description": ""})
+
+        def fake_post(url, json, **kwargs):
+            if any(embed["title"] == "Bad" for embed in json["embeds"]):
+                return _response(status_code=400)
+            return _response()
+
+        with patch("requests.Session.post", side_effect=fake_post) as mock_post:
+            stats = dispatch_pending_alerts()
+            OutboundAlert.objects.filter(status=OutboundAlert.Status.PENDING).update(
+                next_attempt_at=timezone.now()
+            )
+            dispatch_pending_alerts()
+
+        self.assertEqual(
+            [len(call.kwargs["json"]["embeds"]) for call in mock_post.call_args_list],
+            [4, 1, 1, 1, 1, 1],
+        )
+        self.assertEqual((stats["sent"], stats["retried"]), (3, 1))
+        bad = OutboundAlert.objects.get(embed__title="Bad")
+        self.assertEqual((bad.status, bad.attempts), (OutboundAlert.Status.FAILED, 2))
+        self.assertEqual(
+            OutboundAlert.objects.filter(status=OutboundAlert.Status.SENT).count(), 3
+        )
+
+    @override_settings(INTEL_DISCORD_WEBHOOK="", DARK_DISCORD_WEBHOOK="")
+    def test_missing_webhook_marks_alerts_failed(self):
+        self._enqueue(2)
+
+        with patch("requests.Session.post") as mock_post:
+            stats = dispatch_pending_alerts()
+
+        mock_post.assert_not_called()
+        self.assertEqual(stats["failed"], 2)
+
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
@@ -152,3 +153,35 @@ class OpsDashboardTests(TestCase):
         self.assertEqual(response.context["ok_count"], 1)
         self.assertEqual(response.context["error_count"], 1)
         self.assertEqual(response.context["never_run_count"], 1)
+
+    def test_feed_latest_run_pointer_tracks_newest_run(self):
+        source = Source.objects.create(name="Pointer Source", slug="pointer-source")
+        feed = Feed.objects.create(
+            source=source,
+            name="Pointer Feed",
+            url="https://example.com/pointer.xml",
+            feed_type=Feed.FeedType.RSS,
+        )
+        now = timezone.now()
+        newest = FetchRun.objects.create(feed=feed, started_at=now, ok=True)
+        # A backdated run must not displace the newer one.
+        FetchRun.objects.create(
+            feed=feed, started_at=now - timedelta(hours=1), ok=False
+        )
+
+        feed.refresh_from_db()
+        self.assertEqual(feed.latest_run_id, newest.id)
+
+        newer = FetchRun.objects.create(
+            feed=feed, started_at=now + timedelta(minutes=5), ok=False
+        )
+        newer.ok = True
+        newer.save()
+        feed.refresh_from_db()
+        self.assertEqual(feed.latest_run_id, newer.id)
+
+        self.client.force_login(self.superuser)
+        response = self.client.get(reverse("intel_admin:panel"))
+        rows = {row["feed"].id: row for row in response.context["feed_rows"]}
+        self.assertEqual(rows[feed.id]["latest_run"].id, newer.id)
+        self.assertEqual(rows[feed.id]["status"], "ok")
@@ -1,11 +1,14 @@
 import json
+import time
 from datetime import datetime, timezone
+from io import StringIO
 from unittest.mock import MagicMock, patch
 
+from django.core.management import call_command
 from django.test import TestCase, override_settings
 
 from intel.ingestion import parse_json_payload
-from intel.models import Feed, Item, Source
+from intel.models import Feed, FetchRun, Item, Source
 
 
 def _make_feed():
@@ -63,7 +66,7 @@ class PsbdmpAdapterTests(TestCase):
     def test_psbdmp_initial_payload_parsed(self):
         """Pastes from the initial payload are returned."""
         payload = json.dumps([PASTE_A, PASTE_B]).encode()
-        with patch("intel.ingestion.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = _mock_response([])
             entries = parse_json_payload(self.feed, payload, fetched_at=FETCHED_AT)
         self.assertEqual(len(entries), 2)
@@ -76,7 +79,7 @@ class PsbdmpAdapterTests(TestCase):
         """Additional queries from PSBDMP_QUERIES are fetched and merged."""
         initial_payload = json.dumps([PASTE_A]).encode()
         extra_paste = {"id": "extra999", "tags": "nordic breach leak", "length": 200, "time": 1700003000}
-        with patch("intel.ingestion.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = _mock_response([extra_paste])
             entries = parse_json_payload(self.feed, initial_payload, fetched_at=FETCHED_AT)
         self.assertEqual(len(entries), 2)
@@ -88,7 +91,7 @@ class PsbdmpAdapterTests(TestCase):
     def test_psbdmp_deduplication(self):
         """Same paste ID appearing in multiple sources is deduplicated."""
         payload = json.dumps([PASTE_A, PASTE_A]).encode()
-        with patch("intel.ingestion.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = _mock_response([PASTE_A])
             entries = parse_json_payload(self.feed, payload, fetched_at=FETCHED_AT)
         # Only one entry for paste_id "abc123"
@@ -99,7 +102,7 @@ class PsbdmpAdapterTests(TestCase):
     def test_psbdmp_skips_missing_id(self):
         """Pastes without an id field are skipped."""
         payload = json.dumps([{"tags": "password", "time": 1700000000}]).encode()
-        with patch("intel.ingestion.requests.get"):
+        with patch("requests.Session.get"):
             entries = parse_json_payload(self.feed, payload, fetched_at=FETCHED_AT)
         self.assertEqual(len(entries), 0)
 
@@ -107,7 +110,7 @@ class PsbdmpAdapterTests(TestCase):
     def test_psbdmp_timestamp_parsed(self):
         """Unix timestamp in 'time' field is converted to UTC datetime."""
         payload = json.dumps([PASTE_A]).encode()
-        with patch("intel.ingestion.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = _mock_response([])
             entries = parse_json_payload(self.feed, payload, fetched_at=FETCHED_AT)
         self.assertEqual(len(entries), 1)
@@ -119,7 +122,7 @@ class PsbdmpAdapterTests(TestCase):
         """Missing 'time' field falls back to fetched_at."""
         paste = {"id": "notime", "tags": "credentials", "length": 10}
         payload = json.dumps([paste]).encode()
-        with patch("intel.ingestion.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = _mock_response([])
             entries = parse_json_payload(self.feed, payload, fetched_at=FETCHED_AT)
         self.assertEqual(len(entries), 1)
@@ -129,7 +132,7 @@ class PsbdmpAdapterTests(TestCase):
     def test_psbdmp_failed_query_does_not_raise(self):
         """A failed additional query is logged but does not abort the run."""
         payload = json.dumps([PASTE_A]).encode()
-        with patch("intel.ingestion.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = Exception("connection error")
             # Should not raise; initial payload still returns entries
             entries = parse_json_payload(self.feed, payload, fetched_at=FETCHED_AT)
@@ -142,10 +145,62 @@ class PsbdmpAdapterTests(TestCase):
 
         payload = json.dumps([PASTE_A]).encode()
         for _ in range(2):
-            with patch("intel.ingestion.requests.get") as mock_get:
+            with patch("requests.Session.get") as mock_get:
                 mock_get.return_value = _mock_response([])
                 entries = parse_json_payload(self.feed, payload, fetched_at=FETCHED_AT)
             for entry in entries:
                 upsert_normalized_item(self.feed, entry)
 
         self.assertEqual(Item.objects.filter(feed=self.feed).count(), 1)
+
+
+def _feed_response(body):
+    mock = MagicMock()
+    mock.status_code = 200
+    mock.headers = {"ETag": '"feed-v1"'}
+    mock.raise_for_status.return_value = None
+    mock.iter_content.return_value = [body]
+    return mock
+
+
+class PsbdmpIngestTests(TestCase):
+    def setUp(self):
+        self.feed = _make_feed()
+
+    def _ingest(self, query_pastes):
+        def fake_get(url, **kwargs):
+            if url == self.feed.url:
+                return _feed_response(b"[]")
+            return _mock_response(query_pastes)
+
+        with patch("requests.Session.get", side_effect=fake_get) as mock_get:
+            call_command("ingest_sources", feed=str(self.feed.id), stdout=StringIO())
+        return mock_get
+
+    @override_settings(PSBDMP_QUERIES="nordic breach")
+    def test_stored_validators_do_not_skip_query_searches(self):
+        self.feed.http_etag = '"feed-v1"'
+        self.feed.save(update_fields=["http_etag", "updated_at"])
+        paste = {"id": "fresh001", "tags": "nordic breach", "time": int(time.time())}
+
+        mock_get = self._ingest([paste])
+
+        feed_call = next(call for call in mock_get.call_args_list if call.args[0] == self.feed.url)
+        self.assertNotIn("If-None-Match", feed_call.kwargs["headers"])
+        self.assertTrue(Item.objects.filter(feed=self.feed, external_id="fresh001").exists())
+
+    @override_settings(PSBDMP_QUERIES="nordic breach")
+    def test_unchanged_primary_body_still_picks_up_new_query_results(self):
+        now = int(time.time())
+        first = {"id": "fresh001", "tags": "nordic breach", "time": now}
+        second = {"id": "fresh002", "tags": "nordic breach", "time": now}
+
+        self._ingest([first])
+        self._ingest([first, second])
+
+        self.assertEqual(
+            set(Item.objects.filter(feed=self.feed).values_list("external_id", flat=True)),
+            {"fresh001", "fresh002"},
+        )
+        run = FetchRun.objects.filter(feed=self.feed).order_by("-id").first()
+        self.assertEqual(run.items_skipped_unchanged, 0)
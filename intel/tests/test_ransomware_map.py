@@ -1,14 +1,21 @@
 from datetime import timedelta
+from unittest import mock
 
-from django.test import TestCase
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
-from intel.models import Feed, Item, Source
+from intel.cache import public_cache_version
+from intel.models import Feed, Item, RansomwareVictim, Source
 
 
 RANSOMWARE_MAP_URL = reverse("ransomware-map")
 RANSOMWARE_MAP_LIVE_URL = reverse("ransomware-map-live")
+RANSOMWARE_MAP_STREAM_URL = reverse("ransomware-map-stream")
 
 
 class RansomwareMapViewTests(TestCase):
@@ -281,3 +288,131 @@ class RansomwareMapViewTests(TestCase):
             {row["country_key"] for row in payload["snapshot"]["map_marker_data"]},
             {"sweden"},
         )
+
+    def test_victim_facts_follow_item_writes(self):
+        victim = self._create_victim(victim="Nordic Mills", group="Akira", country="Sverige", hours_ago=1)
+        self._create_victim(victim="Texas Hosting", group="Lockbit", country="United States", hours_ago=2)
+
+        fact = RansomwareVictim.objects.get(item=victim)
+        self.assertEqual(fact.group_name, "Akira")
+        self.assertEqual(fact.group_key, "akira")
+        self.assertEqual(fact.victim_name, "Nordic Mills")
+        self.assertEqual((fact.country, fact.country_code, fact.country_key), ("Sweden", "SE", "sweden"))
+
+        victim.raw_payload = {**victim.raw_payload, "country": "Finland"}
+        victim.save()
+        self.assertEqual(RansomwareVictim.objects.get(item=victim).country_key, "finland")
+
+        self.feed.adapter_key = ""
+        self.feed.save()
+        self.assertFalse(RansomwareVictim.objects.exists())
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_live_endpoint_answers_current_cursor_from_cache(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        victim = self._create_victim(victim="Nordic Mills", group="Akira", country="Sweden", hours_ago=1)
+        self.client.get(RANSOMWARE_MAP_LIVE_URL, {"window": "7d"})
+
+        # Only the ETag watermark lookup; the payload comes from the cached state.
+        with self.assertNumQueries(1):
+            response = self.client.get(RANSOMWARE_MAP_LIVE_URL, {"window": "7d", "cursor": victim.id})
+
+        payload = response.json()
+        self.assertEqual(payload["cursor"], victim.id)
+        self.assertEqual(payload["events"], [])
+        self.assertEqual(payload["snapshot"]["summary"]["victim_count"], 1)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_map_page_cache_is_keyed_on_known_filter_values(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self._create_victim(victim="Nordic Mills", group="Akira", country="Sweden", hours_ago=1)
+        self.client.get(RANSOMWARE_MAP_URL, {"window": "7d", "country": "Sweden"})
+
+        # Spelling variants of a known country share the cached page.
+        with self.assertNumQueries(0):
+            self.client.get(RANSOMWARE_MAP_URL, {"window": "7d", "country": " sweden "})
+
+        # Countries with no victims in the window are never cached.
+        self.client.get(RANSOMWARE_MAP_URL, {"window": "7d", "country": "Atlantis"})
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(RANSOMWARE_MAP_URL, {"window": "7d", "country": "Atlantis"})
+        self.assertTrue(queries.captured_queries)
+
+    def test_stream_answers_no_content_outside_asgi(self):
+        response = self.client.get(RANSOMWARE_MAP_STREAM_URL, {"window": "7d"})
+
+        self.assertEqual(response.status_code, 204)
+
+    def _read_stream(self, params, **headers):
+        async def read():
+            response = await AsyncClient().get(RANSOMWARE_MAP_STREAM_URL, params, headers=headers)
+            self.assertEqual(response["Content-Type"], "text/event-stream")
+            return b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+        return async_to_sync(read)()
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        LIVE_STREAM_CHECK_SECONDS=0,
+        LIVE_STREAM_MAX_SECONDS=0.05,
+    )
+    def test_stream_pushes_only_records_past_the_cursor(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        old_event = self._create_victim(victim="Older One", group="Akira", country="Sweden", hours_ago=2)
+        new_event = self._create_victim(victim="Fresh One", group="Akira", country="Sweden", hours_ago=1)
+        version = public_cache_version()
+
+        body = self._read_stream({"window": "7d", "cursor": old_event.id})
+
+        self.assertIn(f"id: {new_event.id}:{version}\n", body)
+        self.assertEqual(body.count("data: "), 1)
+        self.assertIn('"victim": "Fresh One"', body)
+        self.assertNotIn('"victim": "Older One"', body)
+
+        with self.assertNumQueries(0):
+            body = self._read_stream(
+                {"window": "7d"},
+                last_event_id=f"{new_event.id}:{version}",
+            )
+        self.assertNotIn("data: ", body)
+
+    @override_settings(LIVE_WINDOW_BUCKET_SECONDS=60)
+    def test_live_endpoint_etag_rolls_over_with_the_window(self):
+        self._create_victim(victim="Nordic Mills", group="Akira", country="Sweden", hours_ago=1)
+        params = {"window": "24h", "cursor": "0"}
+        with mock.patch("intel.live.time.time", return_value=6000):
+            etag = self.client.get(RANSOMWARE_MAP_LIVE_URL, params)["ETag"]
+        with mock.patch("intel.live.time.time", return_value=6059):
+            response = self.client.get(
+                RANSOMWARE_MAP_LIVE_URL, params, headers={"if-none-match": etag}
+            )
+        self.assertEqual(response.status_code, 304)
+
+        # Nothing new was ingested, but the window moved on: answer in full.
+        with mock.patch("intel.live.time.time", return_value=6060):
+            response = self.client.get(
+                RANSOMWARE_MAP_LIVE_URL, params, headers={"if-none-match": etag}
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_live_endpoint_answers_unchanged_poll_with_not_modified(self):
+        self._create_victim(victim="Nordic Mills", group="Akira", country="Sweden", hours_ago=1)
+        params = {"window": "7d", "cursor": "0"}
+        response = self.client.get(RANSOMWARE_MAP_LIVE_URL, params)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(RANSOMWARE_MAP_LIVE_URL, params, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        self._create_victim(victim="Fresh One", group="Akira", country="Sweden")
+        response = self.client.get(RANSOMWARE_MAP_LIVE_URL, params, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
@@ -53,7 +53,7 @@ class SeedDarkSourcesCommandTests(TestCase):
     def _run(self, api_groups, *args, **kwargs):
         mock_resp = _api_response(api_groups)
         with patch(
-            "intel.management.commands.seed_dark_sources.requests.get",
+            "requests.Session.get",
             return_value=mock_resp,
         ):
             out = StringIO()
@@ -110,7 +110,7 @@ class SeedDarkSourcesCommandTests(TestCase):
 
     def test_api_failure_exits(self):
         with patch(
-            "intel.management.commands.seed_dark_sources.requests.get",
+            "requests.Session.get",
             side_effect=Exception("connection refused"),
         ):
             with self.assertRaises(SystemExit) as ctx:
@@ -1,9 +1,16 @@
 from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
 from django.urls import reverse
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from intel.models import Feed, FetchRun, Item, Source
+from intel.ingestion import NormalizedEntry, upsert_normalized_items
+from intel.models import Feed, FetchRun, Item, Source, SourceDailyStat, batched_source_stats
 
 
 class SourcesAnalyticsViewTests(TestCase):
@@ -132,3 +139,129 @@ class SourcesAnalyticsViewTests(TestCase):
         self.assertContains(response, "Browse source")
         self.assertContains(response, "Open Research")
         self.assertContains(response, "No recent items in the last 30 days for this source and section.")
+
+    def _daily_counts(self):
+        return {
+            (row.section, row.day): row.item_count
+            for row in SourceDailyStat.objects.filter(source=self.source_alpha)
+        }
+
+    def test_daily_rollup_follows_item_writes(self):
+        self.assertEqual(sum(self._daily_counts().values()), 3)
+
+        item = Item.objects.get(title="Alpha week")
+        old_day = item.published_at.date()
+        item.published_at = item.published_at - timedelta(days=2)
+        item.save()
+        counts = self._daily_counts()
+        self.assertNotIn((Feed.Section.ADVISORIES, old_day), counts)
+        self.assertEqual(counts[(Feed.Section.ADVISORIES, item.published_at.date())], 1)
+
+        published_at = Item.objects.get(title="Alpha fresh").published_at
+        upsert_normalized_items(
+            self.alpha_feed_ok,
+            [
+                NormalizedEntry(
+                    title=f"Alpha batch {idx}",
+                    url=f"https://example.com/batch-{idx}",
+                    canonical_url=f"https://example.com/batch-{idx}",
+                    published_at=published_at,
+                    summary="",
+                    external_id=f"batch-{idx}",
+                    raw_payload={},
+                )
+                for idx in range(2)
+            ],
+        )
+        stat = SourceDailyStat.objects.get(
+            source=self.source_alpha,
+            section=Feed.Section.ADVISORIES,
+            day=published_at.date(),
+        )
+        self.assertEqual(stat.item_count, 3)
+        self.assertEqual(stat.last_item_at, published_at)
+
+        old_item = Item.objects.get(title="Alpha old")
+        old_item.published_at = timezone.now() - timedelta(days=400)
+        old_item.save()
+        self.assertIn((Feed.Section.ADVISORIES, old_item.published_at.date()), self._daily_counts())
+        call_command("prune_items", stdout=StringIO())
+        self.assertNotIn(
+            (Feed.Section.ADVISORIES, old_item.published_at.date()), self._daily_counts()
+        )
+
+    def test_item_save_only_resyncs_changed_inputs(self):
+        item = Item.objects.select_related("feed").get(title="Alpha week")
+        # No re-read of the row and no CVE, search, victim or stat writes.
+        with self.assertNumQueries(1):
+            item.save()
+
+        item.summary = "Patched now"
+        with CaptureQueriesContext(connection) as queries:
+            item.save()
+        self.assertFalse(
+            any("intel_sourcedailystat" in query["sql"] for query in queries.captured_queries)
+        )
+
+        items = list(Item.objects.filter(source=self.source_alpha))
+        with CaptureQueriesContext(connection) as queries:
+            with batched_source_stats():
+                for item in items:
+                    item.published_at -= timedelta(days=3)
+                    item.save()
+        stat_deletes = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('DELETE FROM "intel_sourcedailystat"')
+        ]
+        self.assertEqual(len(stat_deletes), 1)
+        self.assertEqual(
+            sum(self._daily_counts().values()),
+            Item.objects.filter(source=self.source_alpha).count(),
+        )
+
+    def test_sources_page_reads_totals_from_rollup(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("sources"))
+
+        self.assertEqual(response.status_code, 200)
+        item_scans = [
+            query["sql"]
+            for query in queries.captured_queries
+            if 'FROM "intel_item"' in query["sql"] and "ROW_NUMBER" not in query["sql"]
+        ]
+        self.assertEqual(len(item_scans), 1)
+        self.assertIn('"intel_item"."published_at" >=', item_scans[0])
+
+    def test_feed_and_item_deletes_drop_out_of_source_totals(self):
+        def alpha_advisories():
+            response = self.client.get(reverse("sources"))
+            groups = {group["key"]: group for group in response.context["section_groups"]}
+            rows = groups.get("advisories", {"sources": []})["sources"]
+            return next((row for row in rows if row["source"].slug == "alpha-source"), None)
+
+        admin = get_user_model().objects.create_superuser(
+            username="stats-admin", email="stats@example.com", password="pass-12345"
+        )
+        self.client.force_login(admin)
+        self.assertEqual(alpha_advisories()["item_count"], 3)
+
+        item = Item.objects.get(title="Alpha fresh")
+        response = self.client.post(
+            reverse("admin:intel_item_delete", args=[item.pk]), {"post": "yes"}
+        )
+        self.assertEqual(response.status_code, 302)
+        row = alpha_advisories()
+        self.assertEqual(row["item_count"], 2)
+        self.assertEqual(row["last_item_at"], Item.objects.get(title="Alpha week").published_at)
+
+        response = self.client.post(
+            reverse("intel_admin:feed_delete", kwargs={"feed_id": self.alpha_feed_ok.id})
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertIsNone(alpha_advisories())
+        self.assertFalse(
+            SourceDailyStat.objects.filter(
+                source=self.source_alpha, section=Feed.Section.ADVISORIES
+            ).exists()
+        )
@@ -1,10 +1,13 @@
 from datetime import timedelta
 
-from django.test import TestCase
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
 from intel.models import Feed, Item, Source
+from intel.views import ITEMS_PER_PAGE, NOW_MAX_PER_SOURCE, _filtered_items
 
 
 class ItemListFilterBehaviorTests(TestCase):
@@ -76,6 +79,126 @@ class ItemListFilterBehaviorTests(TestCase):
         self.assertNotContains(response, "Alpha advisory")
         self.assertEqual(response.context["filtered_total"], 1)
 
+    def test_q_search_ranks_title_matches_and_supports_phrases(self):
+        summary_hit = self._create_item(title="Weekly digest", days_ago=1)
+        summary_hit.summary = "Mentions ransomware briefly among other exploitation news."
+        summary_hit.save()
+        self._create_item(title="Ransomware crew hits hospital", days_ago=3)
+        self._create_item(title="Exploitation news roundup", days_ago=2)
+
+        response = self.client.get(reverse("advisories"), {"time": "7d", "q": "ransomware"})
+
+        self.assertEqual(
+            [item.title for item in response.context["page_obj"].object_list],
+            ["Ransomware crew hits hospital", "Weekly digest"],
+        )
+
+        response = self.client.get(reverse("advisories"), {"time": "7d", "q": '"exploitation news"'})
+
+        self.assertEqual(
+            [item.title for item in response.context["page_obj"].object_list],
+            ["Exploitation news roundup", "Weekly digest"],
+        )
+        self.assertEqual(response.context["filtered_total"], 2)
+
+    def test_q_search_matches_term_prefixes_and_cve_fragments(self):
+        self._create_item(title="Patch for CVE-2026-4242 in gateway", days_ago=1)
+        self._create_item(title="Unrelated advisory", days_ago=1)
+
+        for query in ("gate", "CVE-2026", "cve-2026-4242 gateway"):
+            response = self.client.get(reverse("advisories"), {"time": "7d", "q": query})
+            self.assertEqual(
+                [item.title for item in response.context["page_obj"].object_list],
+                ["Patch for CVE-2026-4242 in gateway"],
+                msg=query,
+            )
+
+    def test_q_search_ignores_fts_syntax_in_user_input(self):
+        self._create_item(title="Alpha advisory", days_ago=1)
+
+        for query in ('alpha OR "', "NEAR(", "*", "-"):
+            response = self.client.get(reverse("advisories"), {"time": "7d", "q": query})
+            self.assertEqual(response.status_code, 200, msg=query)
+
+    def test_balanced_listing_caps_each_source_in_sql(self):
+        other_source = Source.objects.create(name="Other Source", slug="other-source")
+        other_feed = Feed.objects.create(
+            source=other_source,
+            name="Other Feed",
+            url="https://example.com/other-feed.xml",
+            feed_type=Feed.FeedType.RSS,
+            section=Feed.Section.ADVISORIES,
+        )
+        for index in range(NOW_MAX_PER_SOURCE + 5):
+            self._create_item(title=f"Busy advisory {index}", days_ago=1)
+        Item.objects.create(
+            source=other_source,
+            feed=other_feed,
+            title="Quiet advisory",
+            url="https://example.com/quiet-advisory",
+            stable_id="",
+            published_at=timezone.now() - timedelta(days=2),
+        )
+
+        request = RequestFactory().get(reverse("advisories"), {"time": "7d"})
+        with CaptureQueriesContext(connection) as queries:
+            context = _filtered_items(
+                request, section=Feed.Section.ADVISORIES, balance_per_source=True
+            )
+
+        page_items = list(context["page_obj"].object_list)
+        self.assertTrue(context["balance_applied"])
+        self.assertEqual(context["page_obj"].paginator.count, NOW_MAX_PER_SOURCE + 1)
+        self.assertEqual(
+            sum(1 for item in page_items if item.source_id == self.source.id),
+            NOW_MAX_PER_SOURCE,
+        )
+        self.assertEqual(page_items[-1].title, "Quiet advisory")
+        self.assertTrue(any("ROW_NUMBER()" in query["sql"] for query in queries.captured_queries))
+
+    def test_item_list_cursor_pages_cover_ties_without_overlap(self):
+        published_at = timezone.now() - timedelta(days=1)
+        for index in range(ITEMS_PER_PAGE + 5):
+            item = self._create_item(title=f"Tied advisory {index}", days_ago=1)
+            Item.objects.filter(pk=item.pk).update(published_at=published_at)
+
+        first = self.client.get(reverse("advisories"), {"time": "7d"})
+        first_page = first.context["page_obj"]
+        self.assertTrue(first.context["keyset_pagination"])
+        self.assertTrue(first_page.has_next)
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(
+                reverse("advisories"),
+                {"time": "7d", "cursor": first_page.next_cursor},
+                HTTP_HX_REQUEST="true",
+            )
+
+        second_ids = [item.pk for item in second.context["page_obj"].object_list]
+        first_ids = [item.pk for item in first_page.object_list]
+        self.assertEqual(len(first_ids) + len(second_ids), ITEMS_PER_PAGE + 5)
+        self.assertFalse(set(first_ids) & set(second_ids))
+        self.assertEqual(first_ids + second_ids, sorted(first_ids + second_ids, reverse=True))
+        self.assertTrue(second.context["load_more"])
+        self.assertNotIn("HX-Trigger", second)
+        # Only the new rows come back: cards for the desktop list, compact rows
+        # out of band for the mobile list, and the pager swapped out of band.
+        self.assertContains(second, 'id="items-mobile" hx-swap-oob="beforeend"', count=1)
+        self.assertContains(second, 'id="items-more" hx-swap-oob="true"', count=1)
+        self.assertNotContains(second, 'id="items-desktop"')
+        self.assertContains(second, 'data-card-layout="standard"', count=len(second_ids))
+        self.assertContains(second, 'aria-label="Open source"', count=len(second_ids))
+        self.assertFalse(any(query["sql"].startswith("SELECT COUNT(") for query in queries.captured_queries))
+
+    def test_item_list_invalid_cursor_falls_back_to_first_page(self):
+        self._create_item(title="Alpha advisory", days_ago=1)
+
+        response = self.client.get(reverse("advisories"), {"time": "7d", "cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Alpha advisory")
+        self.assertTrue(response.context["page_obj"].is_first)
+
     def test_source_facets_follow_current_section_and_time_window(self):
         self._create_item(title="Fresh advisory", days_ago=1)
         self._create_item(title="Old advisory", days_ago=20)
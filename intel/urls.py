@@ -9,11 +9,13 @@ urlpatterns = [
     path("sweden/", views.sweden_view, name="sweden"),
     path("ransomware/map/", views.ransomware_map_view, name="ransomware-map"),
     path("ransomware/map/live/", views.ransomware_map_live_view, name="ransomware-map-live"),
+    path("ransomware/map/stream/", views.ransomware_map_stream_view, name="ransomware-map-stream"),
     path("feed-health/", views.feed_health_view, name="feed-health"),
     path("sources/", views.sources_view, name="sources"),
     path("dark/", views.dark_dashboard_view, name="dark-dashboard"),
     path("dark/map/", views.dark_map_view, name="dark-map"),
     path("dark/map/live/", views.dark_map_live_view, name="dark-map-live"),
+    path("dark/map/stream/", views.dark_map_stream_view, name="dark-map-stream"),
     path("dark/recent/", views.dark_recent_hits_view, name="dark-recent-hits"),
     path("about/", views.about_view, name="about"),
 ]
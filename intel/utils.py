@@ -1,5 +1,6 @@
 import hashlib
 import html
+import json
 import re
 from datetime import datetime, timezone
 from urllib.parse import parse_qsl, urlsplit, urlunsplit
@@ -103,3 +104,46 @@ def build_stable_id(
         raw = f"{feed_id}:{hash_title(normalized_title)}:{day_bucket}"
 
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def build_item_fingerprint(
+    *,
+    source_id: int | None,
+    feed_id: int | None,
+    section: str,
+    adapter_key: str,
+    title: str,
+    external_id: str,
+    url: str,
+    canonical_url: str,
+    summary: str,
+    published_at: datetime,
+    raw_payload,
+    signal_score: int,
+    signal_category: str,
+    signal_flags,
+) -> str:
+    # Covers every column the ingest upsert writes, including the feed copies
+    # and the computed signal, so a section move or a scoring change is
+    # written back on the next fetch. cve_ids is derived from title/summary.
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=timezone.utc)
+    payload = "\n".join(
+        [
+            str(source_id or ""),
+            str(feed_id or ""),
+            section,
+            adapter_key,
+            title,
+            external_id,
+            url,
+            canonical_url,
+            summary,
+            published_at.astimezone(timezone.utc).isoformat(),
+            json.dumps(raw_payload, sort_keys=True, default=str),
+            str(signal_score),
+            signal_category,
+            json.dumps(signal_flags),
+        ]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
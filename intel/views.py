@@ -1,6 +1,5 @@
 import json
 import re
-from collections import Counter
 from datetime import timedelta
 from urllib.parse import urlencode
 
@@ -12,20 +11,23 @@ from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import user_passes_test
 from django.contrib.auth.forms import AuthenticationForm
 from django.core.paginator import Paginator
-from django.db.models import Count, Max, Q
-from django.db.models.functions import Coalesce
+from django.db.models import Case, Count, F, IntegerField, Max, Q, Sum, Value, When, Window
+from django.db.models.functions import RowNumber
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import NoReverseMatch, reverse
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.utils.text import slugify
 from django.utils import timezone
-from django.views.decorators.http import require_POST
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
 
+from .cache import cache_public_page, cached_fragment, public_cache_version
 from .dark_utils import (
     dark_source_suitability_warning,
     extract_links,
     normalize_dark_country,
+    normalized_country_key,
     resolve_group_name,
     summarize_profile_content,
 )
@@ -37,17 +39,28 @@ from .forms import (
     SourceCreateForm,
     SourceEditForm,
 )
+from .live import live_etag, live_event_stream, request_cursor
 from .models import (
-    DarkFetchRun,
     DarkHit,
     DarkSource,
     Feed,
     FetchRun,
     Item,
+    ItemCve,
     OpsJob,
+    RansomwareVictim,
     Source,
+    SourceDailyStat,
 )
 from .ops_jobs import OPS_ACTIONS, launch_ops_job_subprocess, queue_ops_job
+from .pagination import keyset_page
+from .scoring import (
+    FLAG_LOW_SIGNAL_TITLE,
+    RECENCY_BONUSES,
+    RECENCY_DEFAULT_BONUS,
+    SIGNAL_TONES,
+)
+from .search import search_items
 
 TIME_RANGES = {
     "24h": timedelta(hours=24),
@@ -62,6 +75,8 @@ TIME_OPTIONS = [
     ("90d", "Last 90 days"),
 ]
 NOW_MAX_PER_SOURCE = 10
+ITEMS_PER_PAGE = 25
+DARK_HITS_PER_PAGE = 50
 ITEM_SECTION_ROUTE_ORDER = (
     (Feed.Section.ADVISORIES, "advisories", "Advisories"),
     (Feed.Section.ACTIVE, "active", "Active"),
@@ -74,50 +89,8 @@ ITEM_SECTION_ROUTE_NAMES = {
 ITEM_SECTION_ROUTE_LABELS = {
     section: label for section, _route_name, label in ITEM_SECTION_ROUTE_ORDER
 }
-DASHBOARD_EXPLOIT_KEYWORDS = (
-    "actively exploited",
-    "exploited in the wild",
-    "in the wild",
-    "zero-day",
-    "0day",
-    "kev",
-    "authentication bypass",
-    "remote code execution",
-    "rce",
-)
-DASHBOARD_RANSOMWARE_KEYWORDS = (
-    "ransomware",
-    "extortion",
-    "leak site",
-    "data leak",
-    "victim listing",
-)
-DASHBOARD_LOW_SIGNAL_TITLE_HINTS = (
-    "release notes",
-    "release note",
-    "maintenance release",
-    "maintenance update",
-    "version ",
-    "version:",
-    "product update",
-    "feature update",
-    "service update",
-    "platform update",
-    "minor update",
-    "release announcement",
-    "now available",
-)
-CVE_RE = re.compile(r"\bCVE-\d{4}-\d+\b", re.IGNORECASE)
-HIGH_SIGNAL_KEYWORDS = (
-    "actively exploited",
-    "zero-day",
-    "0day",
-    "kev",
-    "rce",
-    "critical",
-    "remote code",
-    "authentication bypass",
-)
+HIGH_SIGNAL_MIN_SCORE = 20
+CVE_ID_RE = re.compile(r"CVE-\d{4}-\d+", re.IGNORECASE)
 
 DARK_SOURCE_PRESETS = (
     {
@@ -224,18 +197,6 @@ def _validated_next_url(request) -> str:
     return default_target
 
 
-def extract_cve_ids(text: str) -> list[str]:
-    seen = set()
-    cves = []
-    for match in CVE_RE.findall(text or ""):
-        cve = match.upper()
-        if cve in seen:
-            continue
-        seen.add(cve)
-        cves.append(cve)
-    return cves
-
-
 def _validated_redirect_target(request, default_target: str) -> str:
     raw = (request.POST.get("next") or request.GET.get("next") or "").strip()
     if not raw:
@@ -249,126 +210,58 @@ def _validated_redirect_target(request, default_target: str) -> str:
     return default_target
 
 
-def _item_text(item) -> str:
-    return f"{item.title or ''}\n{item.summary or ''}"
-
-
-def _item_cves(item) -> list[str]:
-    return extract_cve_ids(_item_text(item))
-
-
-def _dashboard_signal_profile(item, *, cves=None, now=None):
-    if cves is None:
-        cves = _item_cves(item)
-    if now is None:
-        now = timezone.now()
-
-    activity_at = getattr(item, "activity_at", None) or item.published_at or item.created_at or now
-    lowered_text = _item_text(item).lower()
-    lowered_title = (item.title or "").lower()
-
-    has_cves = bool(cves)
-    has_high_signal_keyword = any(keyword in lowered_text for keyword in HIGH_SIGNAL_KEYWORDS)
-    has_exploitation = item.feed.section == Feed.Section.ACTIVE or any(
-        keyword in lowered_text for keyword in DASHBOARD_EXPLOIT_KEYWORDS
-    )
-    has_ransomware = item.feed.adapter_key == "ransomware_live_victims" or any(
-        keyword in lowered_text for keyword in DASHBOARD_RANSOMWARE_KEYWORDS
-    )
-    has_urgent_wording = any(keyword in lowered_text for keyword in ("critical", "urgent", "emergency"))
-    is_low_signal_title = any(hint in lowered_title for hint in DASHBOARD_LOW_SIGNAL_TITLE_HINTS)
-
-    score = 0
-    if has_exploitation:
-        score += 24
-    if has_ransomware:
-        score += 20
-    if has_cves:
-        score += 18 + min(len(cves), 3) * 2
-    if has_high_signal_keyword:
-        score += 12
-    if has_urgent_wording:
-        score += 8
-
-    if item.feed.section == Feed.Section.ADVISORIES:
-        score += 8
-    elif item.feed.section == Feed.Section.SWEDEN:
-        score += 4
-    elif item.feed.section == Feed.Section.RESEARCH:
-        score += 3
-
-    age_hours = max((now - activity_at).total_seconds() / 3600, 0)
-    if age_hours <= 24:
-        score += 10
-    elif age_hours <= 72:
-        score += 6
-    else:
-        score += 3
-
-    if is_low_signal_title and not (has_cves or has_exploitation or has_ransomware or has_high_signal_keyword):
-        score -= 18
-
-    signal_label = ""
-    signal_tone = ""
-    if has_exploitation:
-        signal_label = "Active exploitation"
-        signal_tone = "amber"
-    elif has_ransomware:
-        signal_label = "Ransomware"
-        signal_tone = "rose"
-    elif has_cves and has_urgent_wording:
-        signal_label = "Critical CVE"
-        signal_tone = "sky"
-    elif has_cves:
-        signal_label = "CVE-driven"
-        signal_tone = "sky"
-    elif has_high_signal_keyword or has_urgent_wording:
-        signal_label = "Urgent"
-        signal_tone = "amber"
-
-    return {
-        "score": score,
-        "signal_label": signal_label,
-        "signal_tone": signal_tone,
-        "is_low_signal_title": is_low_signal_title,
-    }
-
-
-def score_dashboard_item(item, *, cves=None) -> int:
-    return _dashboard_signal_profile(item, cves=cves)["score"]
+def _recency_bonus_expression(now):
+    whens = [
+        When(activity_at__gte=now - max_age, then=Value(bonus))
+        for max_age, bonus in RECENCY_BONUSES
+    ]
+    return Case(*whens, default=Value(RECENCY_DEFAULT_BONUS), output_field=IntegerField())
 
 
 def _attach_item_meta(items):
     for item in items:
-        item.cves = _item_cves(item)
+        item.cves = list(item.cve_ids or [])
         item.activity_at = getattr(item, "activity_at", None) or item.published_at or item.created_at
         item.source_browse_url = _source_destination(
-            getattr(item.feed, "section", Feed.Section.ADVISORIES),
+            item.section,
             source_slug=item.source.slug,
         )
     return items
 
 
+def _cap_per_source(
+    queryset,
+    *,
+    per_source_max: int,
+    ordering=("-activity_at", "-id"),
+    partition_by=("source_id",),
+):
+    """Keep at most ``per_source_max`` rows per source (or ``partition_by`` bucket) in SQL."""
+    return (
+        queryset.annotate(
+            source_rank=Window(
+                RowNumber(),
+                partition_by=[F(field) for field in partition_by],
+                order_by=list(ordering),
+            )
+        )
+        .filter(source_rank__lte=per_source_max)
+        .order_by(*ordering)
+    )
+
+
 def _balanced_items(queryset, *, limit: int, per_source_max: int):
-    source_counts = {}
-    balanced = []
-    for item in queryset:
-        count = source_counts.get(item.source_id, 0)
-        if count >= per_source_max:
-            continue
-        balanced.append(item)
-        source_counts[item.source_id] = count + 1
-        if len(balanced) >= limit:
-            break
-    return _attach_item_meta(balanced)
+    return _attach_item_meta(list(_cap_per_source(queryset, per_source_max=per_source_max)[:limit]))
 
 
-def build_trending_cves(items, *, limit: int = 10):
-    counts = Counter()
-    for item in items:
-        for cve in _item_cves(item):
-            counts[cve] += 1
-    return counts.most_common(limit)
+def build_trending_cves(*, since, limit: int = 10):
+    rows = (
+        ItemCve.objects.filter(published_at__gte=since)
+        .values("cve__cve_id")
+        .annotate(item_count=Count("id"), last_seen_at=Max("published_at"))
+        .order_by("-item_count", "-last_seen_at", "cve__cve_id")[:limit]
+    )
+    return [(row["cve__cve_id"], row["item_count"]) for row in rows]
 
 
 def _validated_time_window(raw_value: str) -> str:
@@ -378,12 +271,16 @@ def _validated_time_window(raw_value: str) -> str:
     return selected_time
 
 
+def _item_activity_queryset():
+    # published_at is NOT NULL (ingest falls back to fetch time), so it is the activity
+    # timestamp; referencing the bare column keeps the published_at indexes usable.
+    return Item.objects.select_related("source", "feed").annotate(activity_at=F("published_at"))
+
+
 def _build_item_filter_state(request, *, section=None):
-    queryset = Item.objects.select_related("source", "feed").annotate(
-        activity_at=Coalesce("published_at", "created_at")
-    )
+    queryset = _item_activity_queryset()
     if section is not None:
-        queryset = queryset.filter(feed__section=section)
+        queryset = queryset.filter(section=section)
 
     query = (request.GET.get("q") or "").strip()
     source_slug = (request.GET.get("source") or "").strip()
@@ -420,19 +317,26 @@ def _build_item_filter_state(request, *, section=None):
         )
         sources.sort(key=lambda row: (row["name"].lower(), row["slug"]))
 
-    window_total = window_queryset.count()
+    # The per-source rows already count the window; only a text query needs its own count.
+    window_total = sum(row["item_count"] for row in source_rows)
 
     filtered_queryset = window_queryset
-    if query:
-        filtered_queryset = filtered_queryset.filter(
-            Q(title__icontains=query)
-            | Q(summary__icontains=query)
-            | Q(source__name__icontains=query)
-        )
+    search_ranked = False
+    if CVE_ID_RE.fullmatch(query):
+        # Exact CVE lookups (e.g. trending CVE links) use the ItemCve index.
+        filtered_queryset = filtered_queryset.filter(cve_links__cve__cve_id=query.upper())
+    elif query:
+        filtered_queryset = search_items(filtered_queryset, query)
+        search_ranked = True
 
     if source_slug:
         filtered_queryset = filtered_queryset.filter(source__slug=source_slug)
-    filtered_total = filtered_queryset.count()
+    if query:
+        filtered_total = filtered_queryset.count()
+    elif source_slug:
+        filtered_total = selected_source_row["count"] if selected_source_row else 0
+    else:
+        filtered_total = window_total
     hidden_by_filters = max(0, window_total - filtered_total)
 
     return {
@@ -443,6 +347,7 @@ def _build_item_filter_state(request, *, section=None):
         "window_total": window_total,
         "filtered_total": filtered_total,
         "hidden_by_filters": hidden_by_filters,
+        "search_ranked": search_ranked,
         "sources": sources,
         "time_options": TIME_OPTIONS,
         "filtered_queryset": filtered_queryset,
@@ -451,27 +356,40 @@ def _build_item_filter_state(request, *, section=None):
 
 def _filtered_items(request, section=None, *, balance_per_source=False):
     filter_state = _build_item_filter_state(request, section=section)
-    ordered = filter_state["filtered_queryset"].order_by("-activity_at", "-id")
-
-    if balance_per_source and not filter_state["selected_source"]:
-        source_counts = {}
-        balanced_items = []
-        for item in ordered:
-            count = source_counts.get(item.source_id, 0)
-            if count >= NOW_MAX_PER_SOURCE:
-                continue
-            balanced_items.append(item)
-            source_counts[item.source_id] = count + 1
-        paginator = Paginator(balanced_items, 25)
+    ordering = ["-activity_at", "-id"]
+    if filter_state["search_ranked"]:
+        ordering.insert(0, F("search_rank").desc(nulls_last=True))
+
+    balance_applied = balance_per_source and not filter_state["selected_source"]
+    # Plain recency order pages by cursor; ranked, balanced and legacy ?page= links use offsets.
+    keyset_pagination = not (
+        filter_state["search_ranked"] or balance_applied or "page" in request.GET
+    )
+
+    if keyset_pagination:
+        page_obj = keyset_page(
+            filter_state["filtered_queryset"],
+            cursor=(request.GET.get("cursor") or "").strip(),
+            per_page=ITEMS_PER_PAGE,
+            time_field="activity_at",
+        )
     else:
-        paginator = Paginator(ordered, 25)
-    page_obj = paginator.get_page(request.GET.get("page"))
+        if balance_applied:
+            ordered = _cap_per_source(
+                filter_state["filtered_queryset"],
+                per_source_max=NOW_MAX_PER_SOURCE,
+                ordering=ordering,
+            )
+        else:
+            ordered = filter_state["filtered_queryset"].order_by(*ordering)
+        page_obj = Paginator(ordered, ITEMS_PER_PAGE).get_page(request.GET.get("page"))
     page_obj.object_list = _attach_item_meta(list(page_obj.object_list))
 
     return {
         **{key: value for key, value in filter_state.items() if key != "filtered_queryset"},
         "page_obj": page_obj,
-        "balance_applied": balance_per_source and not filter_state["selected_source"],
+        "keyset_pagination": keyset_pagination,
+        "balance_applied": balance_applied,
     }
 
 
@@ -538,6 +456,10 @@ def _render_items_page(request, *, title, nav_key, section=None):
         }
     )
     if request.headers.get("HX-Request"):
+        load_more = bool(context["keyset_pagination"] and context["page_obj"].cursor)
+        context["load_more"] = load_more
+        if load_more:
+            return render(request, "intel/partials/items_more.html", context)
         count = context["filtered_total"]
         response = render(request, "intel/partials/items_list.html", context)
         response["HX-Trigger"] = json.dumps({"showToast": f"{count} results"})
@@ -545,48 +467,45 @@ def _render_items_page(request, *, title, nav_key, section=None):
     return render(request, "intel/item_list.html", context)
 
 
+@cache_public_page
 def now_view(request):
     now = timezone.now()
-    # Item.created_at is our ingestion-time fallback when feeds lack publish timestamps.
-    item_base = Item.objects.select_related("source", "feed").annotate(
-        activity_at=Coalesce("published_at", "created_at")
-    )
+    item_base = _item_activity_queryset()
     ordered_by_activity = item_base.order_by("-activity_at", "-id")
 
-    high_candidates = list(
-        ordered_by_activity.filter(activity_at__gte=now - timedelta(days=7))[:400]
-    )
-    for item in high_candidates:
-        item.cves = _item_cves(item)
-        item.activity_at = item.activity_at or item.published_at or item.created_at
-        item.source_browse_url = _source_destination(item.feed.section, source_slug=item.source.slug)
-        signal_profile = _dashboard_signal_profile(item, cves=item.cves, now=now)
-        item.dashboard_score = signal_profile["score"]
-        item.signal_label = signal_profile["signal_label"]
-        item.signal_tone = signal_profile["signal_tone"]
-        item.is_low_signal_title = signal_profile["is_low_signal_title"]
-    high_candidates.sort(
-        key=lambda item: (item.dashboard_score, item.activity_at, item.id),
-        reverse=True,
+    max_recency_bonus = max(bonus for _max_age, bonus in RECENCY_BONUSES)
+    high_signal_items = _attach_item_meta(
+        list(
+            ordered_by_activity.filter(
+                activity_at__gte=now - timedelta(days=7),
+                signal_score__gte=HIGH_SIGNAL_MIN_SCORE - max_recency_bonus,
+            )
+            .annotate(dashboard_score=F("signal_score") + _recency_bonus_expression(now))
+            .filter(dashboard_score__gte=HIGH_SIGNAL_MIN_SCORE)
+            .order_by("-dashboard_score", "-activity_at", "-id")[:15]
+        )
     )
-    high_signal_items = [item for item in high_candidates if item.dashboard_score >= 20][:15]
+    for item in high_signal_items:
+        item.signal_label = item.signal_category
+        item.signal_tone = SIGNAL_TONES.get(item.signal_category, "")
+        item.is_low_signal_title = FLAG_LOW_SIGNAL_TITLE in (item.signal_flags or [])
 
     active_items = _balanced_items(
         ordered_by_activity.filter(
-            feed__section=Feed.Section.ACTIVE,
+            section=Feed.Section.ACTIVE,
             activity_at__gte=now - timedelta(days=14),
         ),
         limit=6,
         per_source_max=4,
     )
     advisories_items = _balanced_items(
-        ordered_by_activity.filter(feed__section=Feed.Section.ADVISORIES),
+        ordered_by_activity.filter(section=Feed.Section.ADVISORIES),
         limit=20,
         per_source_max=8,
     )
     research_items = _balanced_items(
         ordered_by_activity.filter(
-            feed__section=Feed.Section.RESEARCH,
+            section=Feed.Section.RESEARCH,
             activity_at__gte=now - timedelta(days=30),
         ),
         limit=15,
@@ -601,92 +520,106 @@ def now_view(request):
     sweden_items = _attach_item_meta(
         list(
             item_base.filter(
-                Q(feed__section=Feed.Section.SWEDEN) | Q(source_id__in=sweden_source_ids)
+                Q(section=Feed.Section.SWEDEN) | Q(source_id__in=sweden_source_ids)
             ).order_by("-activity_at", "-id")[:10]
         )
     )
 
-    trending_source_rows = list(
-        item_base.filter(activity_at__gte=now - timedelta(hours=48))
-        .values("source__name", "source__slug", "feed__section")
-        .annotate(item_count=Count("id"), last_item_at=Max("activity_at"))
-    )
-    trending_sections_by_source = {}
-    for row in trending_source_rows:
-        source_slug = row["source__slug"]
-        trending_sections_by_source.setdefault(source_slug, []).append(
+    context = {
+        "page_title": "Now",
+        "current_page": "now",
+        "high_signal_items": high_signal_items,
+        "active_items": active_items,
+        "advisories_items": advisories_items,
+        "research_items": research_items,
+        "sweden_items": sweden_items,
+        **cached_fragment("now-stats", _now_dashboard_stats),
+    }
+    return render(request, "intel/dashboard.html", context)
+
+
+def _now_dashboard_stats():
+    """Stat tiles, trending panels and feed status for the Now page, cached between ingests."""
+    now = timezone.now()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    since_48h = now - timedelta(hours=48)
+
+    # One pass over the last week feeds the item tiles and the 48h trending sources.
+    items_today_count = 0
+    items_week_count = 0
+    trending_by_source = {}
+    for row in (
+        Item.objects.filter(published_at__gte=now - timedelta(days=7))
+        .values("source__name", "source__slug", "section")
+        .annotate(
+            items_7d=Count("id"),
+            items_today=Count(
+                "id",
+                filter=Q(
+                    published_at__gte=today_start,
+                    published_at__lt=today_start + timedelta(days=1),
+                ),
+            ),
+            items_48h=Count("id", filter=Q(published_at__gte=since_48h)),
+            last_item_at=Max("published_at", filter=Q(published_at__gte=since_48h)),
+        )
+    ):
+        items_week_count += row["items_7d"]
+        items_today_count += row["items_today"]
+        if not row["items_48h"]:
+            continue
+        source_row = trending_by_source.setdefault(
+            row["source__slug"],
+            {
+                "source__name": row["source__name"],
+                "source__slug": row["source__slug"],
+                "item_count": 0,
+                "sections": [],
+            },
+        )
+        source_row["item_count"] += row["items_48h"]
+        source_row["sections"].append(
             {
-                "section": row["feed__section"],
-                "item_count": row["item_count"],
+                "section": row["section"],
+                "item_count": row["items_48h"],
                 "last_item_at": row["last_item_at"],
             }
         )
-    trending_sources = list(
-        item_base.filter(activity_at__gte=now - timedelta(hours=48))
-        .values("source__name", "source__slug")
-        .annotate(item_count=Count("id"))
-        .order_by("-item_count", "source__name")[:8]
-    )
+    trending_sources = sorted(
+        trending_by_source.values(),
+        key=lambda row: (-row["item_count"], row["source__name"]),
+    )[:8]
     for row in trending_sources:
         row["open_url"] = _aggregate_source_destination(
-            trending_sections_by_source.get(row["source__slug"], []),
+            row.pop("sections"),
             source_slug=row["source__slug"],
         )
-    trending_cves = build_trending_cves(
-        list(ordered_by_activity.filter(activity_at__gte=now - timedelta(days=7))[:400]),
-        limit=10,
-    )
-
-    enabled_feeds = list(Feed.objects.filter(enabled=True).only("id"))
-    latest_by_feed = {}
-    for run in FetchRun.objects.filter(feed__enabled=True).order_by("-started_at"):
-        if run.feed_id not in latest_by_feed:
-            latest_by_feed[run.feed_id] = run
-    feed_status_counts = {"ok": 0, "error": 0, "never": 0}
-    for feed in enabled_feeds:
-        latest = latest_by_feed.get(feed.id)
-        if latest is None:
-            feed_status_counts["never"] += 1
-        elif latest.ok:
-            feed_status_counts["ok"] += 1
-        else:
-            feed_status_counts["error"] += 1
 
-    last_ingest_finished_at = (
-        FetchRun.objects.filter(finished_at__isnull=False)
-        .order_by("-finished_at")
-        .values_list("finished_at", flat=True)
-        .first()
+    # The newest finished run is (nearly always) some feed's latest run, so this
+    # reads the per-feed pointers instead of sorting the whole run history.
+    feed_stats = Feed.objects.aggregate(
+        total=Count("id", filter=Q(enabled=True)),
+        ok=Count("id", filter=Q(enabled=True, latest_run__ok=True)),
+        error=Count("id", filter=Q(enabled=True, latest_run__ok=False)),
+        never=Count("id", filter=Q(enabled=True, latest_run__isnull=True)),
+        last_ingest_finished_at=Max("latest_run__finished_at"),
     )
+    enabled_feed_count = feed_stats.pop("total")
+    last_ingest_finished_at = feed_stats.pop("last_ingest_finished_at")
 
-    # Dashboard stat widgets
-    today = now.date()
-    week_ago = now - timedelta(days=7)
-    thirty_days_ago = now - timedelta(days=30)
-    items_today_count = Item.objects.filter(published_at__date=today).count()
-    items_week_count = Item.objects.filter(published_at__gte=week_ago).count()
-    active_feeds_count = Feed.objects.filter(enabled=True).count()
-    dark_hits_30d_count = DarkHit.objects.filter(detected_at__gte=thirty_days_ago).count()
-
-    context = {
-        "page_title": "Now",
-        "current_page": "now",
+    return {
         "items_today_count": items_today_count,
         "items_week_count": items_week_count,
-        "active_feeds_count": active_feeds_count,
-        "dark_hits_30d_count": dark_hits_30d_count,
-        "high_signal_items": high_signal_items,
-        "active_items": active_items,
-        "advisories_items": advisories_items,
-        "research_items": research_items,
-        "sweden_items": sweden_items,
+        "active_feeds_count": enabled_feed_count,
+        "dark_hits_30d_count": DarkHit.objects.filter(
+            detected_at__gte=now - timedelta(days=30)
+        ).count(),
         "trending_sources": trending_sources,
-        "trending_cves": trending_cves,
-        "feed_status_counts": feed_status_counts,
-        "enabled_feed_count": len(enabled_feeds),
+        "trending_cves": build_trending_cves(since=now - timedelta(days=7), limit=10),
+        "feed_status_counts": feed_stats,
+        "enabled_feed_count": enabled_feed_count,
         "last_ingest_finished_at": last_ingest_finished_at,
     }
-    return render(request, "intel/dashboard.html", context)
 
 
 def active_view(request):
@@ -725,30 +658,22 @@ def sweden_view(request):
     )
 
 
+@cache_public_page
 def feed_health_view(request):
-    feeds = (
-        Feed.objects.select_related("source")
-        .prefetch_related("fetch_runs")
-        .order_by("source__name", "name")
-    )
-
-    latest_by_feed = {}
-    for run in FetchRun.objects.order_by("-started_at"):
-        if run.feed_id not in latest_by_feed:
-            latest_by_feed[run.feed_id] = run
+    feeds = Feed.objects.select_related("source", "latest_run").order_by("source__name", "name")
 
     return render(
         request,
         "intel/feed_health.html",
         {
             "feeds": feeds,
-            "latest_by_feed": latest_by_feed,
             "current_page": "feed-health",
             "page_title": "Feed Health",
         },
     )
 
 
+@cache_public_page
 def sources_view(request):
     now = timezone.now()
     since_24h = now - timedelta(hours=24)
@@ -756,47 +681,47 @@ def sources_view(request):
     since_30d = now - timedelta(days=30)
 
     sources = {source.id: source for source in Source.objects.order_by("name")}
-    item_base = Item.objects.select_related("source", "feed").annotate(
-        activity_at=Coalesce("published_at", "created_at")
-    )
+    item_base = _item_activity_queryset()
 
+    # All-time totals come from the daily rollup; only the 24h/7d counts touch items,
+    # and only within the last week.
     item_stats_by_key = {}
+    for row in SourceDailyStat.objects.values("source_id", "section").annotate(
+        item_count=Sum("item_count"),
+        last_item_at=Max("last_item_at"),
+    ):
+        row.update(new_24h=0, new_7d=0)
+        item_stats_by_key[(row["source_id"], row["section"])] = row
     for row in (
-        item_base.values("source_id", "feed__section")
+        Item.objects.filter(published_at__gte=since_7d)
+        .values("source_id", "section")
         .annotate(
-            item_count=Count("id"),
-            new_24h=Count("id", filter=Q(activity_at__gte=since_24h)),
-            new_7d=Count("id", filter=Q(activity_at__gte=since_7d)),
-            last_item_at=Max("activity_at"),
+            new_24h=Count("id", filter=Q(published_at__gte=since_24h)),
+            new_7d=Count("id"),
         )
     ):
-        item_stats_by_key[(row["source_id"], row["feed__section"])] = row
+        stats = item_stats_by_key.get((row["source_id"], row["section"]))
+        if stats is not None:
+            stats.update(new_24h=row["new_24h"], new_7d=row["new_7d"])
 
     recent_items_by_key = {}
     recent_items = _attach_item_meta(
-        list(item_base.filter(activity_at__gte=since_30d).order_by("-activity_at", "-id"))
+        list(
+            _cap_per_source(
+                item_base.filter(activity_at__gte=since_30d),
+                per_source_max=3,
+                partition_by=("source_id", "section"),
+            )
+        )
     )
     for item in recent_items:
-        key = (item.source_id, item.feed.section)
-        bucket = recent_items_by_key.setdefault(key, [])
-        if len(bucket) < 3:
-            bucket.append(item)
+        recent_items_by_key.setdefault((item.source_id, item.section), []).append(item)
 
     enabled_feeds = list(
         Feed.objects.filter(enabled=True)
-        .select_related("source")
-        .only("id", "source_id", "section", "name", "last_error")
-    )
-    latest_run_by_feed = {}
-    enabled_feed_ids = [feed.id for feed in enabled_feeds]
-    if enabled_feed_ids:
-        for run in (
-            FetchRun.objects.filter(feed_id__in=enabled_feed_ids)
-            .only("feed_id", "ok", "error", "started_at")
-            .order_by("feed_id", "-started_at")
-        ):
-            if run.feed_id not in latest_run_by_feed:
-                latest_run_by_feed[run.feed_id] = run
+        .select_related("latest_run")
+        .only("id", "source_id", "section", "name", "last_error", "latest_run__ok")
+    )
 
     feed_health_by_key = {}
     for feed in enabled_feeds:
@@ -807,13 +732,10 @@ def sources_view(request):
         )
         section_health["feeds_total"] += 1
 
-        latest_run = latest_run_by_feed.get(feed.id)
-        if latest_run is None:
+        if feed.latest_run is None:
             section_health["feeds_never"] += 1
-        elif latest_run.ok:
+        elif feed.latest_run.ok:
             section_health["feeds_ok"] += 1
-        elif (latest_run.error or "").strip() or (feed.last_error or "").strip():
-            section_health["feeds_error"] += 1
         else:
             section_health["feeds_error"] += 1
 
@@ -923,7 +845,6 @@ RANSOMWARE_MAP_WINDOW_RANGES = {
     "30d": timedelta(days=30),
 }
 RANSOMWARE_MAP_WINDOW_OPTIONS = [("24h", "24h"), ("7d", "7d"), ("30d", "30d")]
-RANSOMWARE_MAP_ADAPTER_KEY = "ransomware_live_victims"
 RANSOMWARE_ECHARTS_MAP_NAMES = {
     "United States": "United States of America",
     "Czechia": "Czech Republic",
@@ -972,140 +893,111 @@ RANSOMWARE_MAP_COORDINATES = {
 }
 
 
-def _ransomware_group_name(item) -> str:
-    raw = item.raw_payload or {}
-    title_prefix, separator, _title_suffix = (item.title or "").partition(":")
-    title_group = title_prefix.strip() if separator else ""
-    raw_group = str(raw.get("group") or "").strip()
-    if title_group and raw_group and title_group.lower() == raw_group.lower():
-        return title_group
-    if title_group:
-        return title_group
-    if raw_group:
-        return raw_group.title() if raw_group == raw_group.lower() else raw_group
-    return ""
-
-
-def _ransomware_victim_name(item) -> str:
-    raw = item.raw_payload or {}
-    victim_name = str(raw.get("victim") or "").strip()
-    if victim_name:
-        return victim_name
-    _title_prefix, separator, title_suffix = (item.title or "").partition(":")
-    if separator and title_suffix.strip():
-        return title_suffix.strip()
-    return item.title
-
-
-def _serialize_ransomware_item(item):
-    raw = item.raw_payload or {}
-    group_name = _ransomware_group_name(item)
-    victim_name = _ransomware_victim_name(item)
-    raw_country = str(raw.get("country") or "").strip()
-    country_display, country_code = normalize_dark_country(raw_country)
-    activity_at = getattr(item, "activity_at", None) or item.published_at or item.created_at
-    return {
-        "id": item.id,
-        "item": item,
-        "title": item.title,
-        "url": item.url,
-        "group_name": group_name,
-        "group_key": slugify(group_name),
-        "victim_name": victim_name,
-        "country": country_display,
-        "country_code": country_code,
-        "country_key": _normalized_country_key(country_display),
-        "activity_at": activity_at,
-        "excerpt": item.summary or str(raw.get("description") or "").strip(),
-    }
-
-
-def _ransomware_group_rows(records):
-    grouped = {}
-    for record in records:
-        group_name = record["group_name"]
-        if not group_name:
-            continue
-        row = grouped.get(record["group_key"])
-        if row is None:
-            row = {
-                "group_name": group_name,
-                "group_key": record["group_key"],
-                "record_count": 0,
-                "latest_activity_at": record["activity_at"],
-                "latest_victim_name": "",
-                "latest_country": "",
-                "country_keys": set(),
-                "countries": [],
+def _ransomware_victims(window: str, *, group_key: str = "", country_key: str = ""):
+    since = timezone.now() - RANSOMWARE_MAP_WINDOW_RANGES[window]
+    victims = RansomwareVictim.objects.filter(published_at__gte=since)
+    if group_key:
+        victims = victims.filter(group_key=group_key)
+    if country_key:
+        victims = victims.filter(country_key=country_key)
+    return victims
+
+
+def _ransomware_records(victims, limit: int):
+    records = []
+    for victim in victims.select_related("item").order_by("-published_at", "-pk")[:limit]:
+        item = victim.item
+        records.append(
+            {
+                "id": victim.pk,
+                "title": item.title,
+                "url": item.url,
+                "group_name": victim.group_name,
+                "group_key": victim.group_key,
+                "victim_name": victim.victim_name,
+                "country": victim.country,
+                "country_code": victim.country_code,
+                "country_key": victim.country_key,
+                "activity_at": victim.published_at,
+                "excerpt": item.summary
+                or str((item.raw_payload or {}).get("description") or "").strip(),
             }
-            grouped[record["group_key"]] = row
+        )
+    return records
 
-        row["record_count"] += 1
-        if record["country"] and record["country_key"] not in row["country_keys"]:
-            row["country_keys"].add(record["country_key"])
-            row["countries"].append(record["country"])
-        if record["activity_at"] >= row["latest_activity_at"]:
-            row["latest_activity_at"] = record["activity_at"]
-            row["latest_victim_name"] = record["victim_name"]
-            row["latest_country"] = record["country"]
 
-    rows = []
-    for row in grouped.values():
-        row["country_count"] = len(row["country_keys"])
-        del row["country_keys"]
-        rows.append(row)
-    rows.sort(
-        key=lambda row: (
-            row["record_count"],
-            row["latest_activity_at"],
-            row["group_name"].lower(),
-        ),
-        reverse=True,
+def _latest_ransomware_victims_by(victims, key_field: str, fields):
+    """Map each non-blank ``key_field`` value to the listed fields of its newest victim."""
+    rows = (
+        victims.exclude(**{key_field: ""})
+        .annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=[F(key_field)],
+                order_by=[F("published_at").desc(), F("pk").asc()],
+            )
+        )
+        .filter(rank=1)
+        .values(key_field, *fields)
     )
-    return rows
+    return {row[key_field]: row for row in rows}
 
 
-def _ransomware_country_rows(records):
-    grouped = {}
-    for record in records:
-        if not record["country"]:
-            continue
-        row = grouped.get(record["country_key"])
-        if row is None:
-            row = {
-                "country": record["country"],
-                "country_code": record["country_code"],
-                "country_key": record["country_key"],
-                "record_count": 0,
-                "group_keys": set(),
-                "latest_activity_at": record["activity_at"],
-                "latest_group_name": "",
-                "latest_victim_name": "",
-            }
-            grouped[record["country_key"]] = row
+def _ransomware_group_rows(victims):
+    latest = _latest_ransomware_victims_by(
+        victims, "group_key", ("group_name", "victim_name", "country")
+    )
+    counts = (
+        victims.exclude(group_key="")
+        .values("group_key")
+        .annotate(
+            record_count=Count("pk"),
+            latest_activity_at=Max("published_at"),
+            country_count=Count("country_key", distinct=True, filter=~Q(country_key="")),
+        )
+        .order_by("-record_count", "-latest_activity_at", "-group_key")
+    )
+    return [
+        {
+            "group_name": latest[row["group_key"]]["group_name"],
+            "group_key": row["group_key"],
+            "record_count": row["record_count"],
+            "latest_activity_at": row["latest_activity_at"],
+            "latest_victim_name": latest[row["group_key"]]["victim_name"],
+            "latest_country": latest[row["group_key"]]["country"],
+            "country_count": row["country_count"],
+        }
+        for row in counts
+    ]
 
-        row["record_count"] += 1
-        if record["group_name"]:
-            row["group_keys"].add(record["group_key"])
-        if record["activity_at"] >= row["latest_activity_at"]:
-            row["latest_activity_at"] = record["activity_at"]
-            row["latest_group_name"] = record["group_name"]
-            row["latest_victim_name"] = record["victim_name"]
 
-    rows = []
-    for row in grouped.values():
-        row["group_count"] = len(row["group_keys"])
-        del row["group_keys"]
-        rows.append(row)
-    rows.sort(
-        key=lambda row: (
-            row["record_count"],
-            row["latest_activity_at"],
-            row["country"].lower(),
-        ),
-        reverse=True,
+def _ransomware_country_rows(victims):
+    latest = _latest_ransomware_victims_by(
+        victims, "country_key", ("country", "country_code", "group_name", "victim_name")
     )
-    return rows
+    counts = (
+        victims.exclude(country_key="")
+        .values("country_key")
+        .annotate(
+            record_count=Count("pk"),
+            latest_activity_at=Max("published_at"),
+            group_count=Count("group_key", distinct=True, filter=~Q(group_key="")),
+        )
+        .order_by("-record_count", "-latest_activity_at", "-country_key")
+    )
+    return [
+        {
+            "country": latest[row["country_key"]]["country"],
+            "country_code": latest[row["country_key"]]["country_code"],
+            "country_key": row["country_key"],
+            "record_count": row["record_count"],
+            "group_count": row["group_count"],
+            "latest_activity_at": row["latest_activity_at"],
+            "latest_group_name": latest[row["country_key"]]["group_name"],
+            "latest_victim_name": latest[row["country_key"]]["victim_name"],
+        }
+        for row in counts
+    ]
 
 
 def _ransomware_map_url(*, window: str, selected_group: str = "", country: str = "") -> str:
@@ -1131,7 +1023,7 @@ def _ransomware_map_data(country_rows, *, selected_country: str, window: str, se
     country_data = []
     marker_data = []
     max_record_count = max((row["record_count"] for row in country_rows), default=0)
-    selected_country_key = _normalized_country_key(selected_country)
+    selected_country_key = normalized_country_key(selected_country)
 
     for row in country_rows:
         row["url"] = _ransomware_map_url(
@@ -1191,10 +1083,10 @@ def _ransomware_map_data(country_rows, *, selected_country: str, window: str, se
     return country_data, marker_data, unmapped_rows
 
 
-def _ransomware_map_empty_state(records, country_rows):
+def _ransomware_map_empty_state(victim_count: int, country_rows):
     if country_rows:
         return {}
-    if not records:
+    if not victim_count:
         return {
             "title": "No ransomware victims in current scope",
             "message": "No ransomware.live victim records matched the current window and filters.",
@@ -1274,21 +1166,10 @@ def _serialize_ransomware_live_event(record):
 
 def _build_ransomware_map_state(*, window: str, selected_group: str = "", requested_country: str = ""):
     window = _validated_ransomware_window(window)
-    since = timezone.now() - RANSOMWARE_MAP_WINDOW_RANGES[window]
 
-    window_items = list(
-        Item.objects.select_related("source", "feed")
-        .filter(feed__adapter_key=RANSOMWARE_MAP_ADAPTER_KEY)
-        .annotate(activity_at=Coalesce("published_at", "created_at"))
-        .filter(activity_at__gte=since)
-        .order_by("-activity_at", "-id")
-    )
-    window_records = [_serialize_ransomware_item(item) for item in window_items]
-
-    all_group_rows = _ransomware_group_rows(window_records)
     group_options = [
         {"slug": row["group_key"], "name": row["group_name"], "count": row["record_count"]}
-        for row in all_group_rows
+        for row in _ransomware_group_rows(_ransomware_victims(window))
     ]
     selected_group = (selected_group or "").strip()
     valid_group_slugs = {row["slug"] for row in group_options}
@@ -1299,44 +1180,42 @@ def _build_ransomware_map_state(*, window: str, selected_group: str = "", reques
         "",
     )
 
-    group_records = window_records
-    if selected_group:
-        group_records = [record for record in group_records if record["group_key"] == selected_group]
-
-    scope_country_rows = _ransomware_country_rows(group_records)
     selected_country = ""
     requested_country = (requested_country or "").strip()
     if requested_country:
-        requested_country_key = _normalized_country_key(requested_country)
-        for row in scope_country_rows:
-            if row["country_key"] == requested_country_key:
-                selected_country = row["country"]
-                break
+        selected_country = (
+            _ransomware_victims(window, group_key=selected_group)
+            .filter(country_key=normalized_country_key(requested_country))
+            .values_list("country", flat=True)
+            .first()
+        )
         if not selected_country:
             normalized_country, _country_code = normalize_dark_country(requested_country)
             selected_country = normalized_country or requested_country
 
-    focused_records = group_records
-    selected_country_key = _normalized_country_key(selected_country)
-    if selected_country_key:
-        focused_records = [
-            record for record in focused_records if record["country_key"] == selected_country_key
-        ]
+    selected_country_key = normalized_country_key(selected_country)
+    focused_victims = _ransomware_victims(
+        window,
+        group_key=selected_group,
+        country_key=selected_country_key,
+    )
+    totals = focused_victims.aggregate(victim_count=Count("pk"), live_cursor=Max("pk"))
 
-    country_rows = _ransomware_country_rows(focused_records)
+    country_rows = _ransomware_country_rows(focused_victims)
     for row in country_rows:
         row["is_selected"] = row["country_key"] == selected_country_key
 
-    top_groups = _ransomware_group_rows(focused_records)[:8]
+    group_rows = _ransomware_group_rows(focused_victims)
+    top_groups = group_rows[:8]
     top_countries = country_rows[:8]
-    latest_victims = focused_records[:10]
+    latest_victims = _ransomware_records(focused_victims, 10)
     map_country_data, map_marker_data, unmapped_country_rows = _ransomware_map_data(
         country_rows,
         selected_country=selected_country,
         window=window,
         selected_group=selected_group,
     )
-    map_empty_state = _ransomware_map_empty_state(focused_records, country_rows)
+    map_empty_state = _ransomware_map_empty_state(totals["victim_count"], country_rows)
 
     for row in top_groups:
         row["url"] = _ransomware_map_url(
@@ -1367,10 +1246,12 @@ def _build_ransomware_map_state(*, window: str, selected_group: str = "", reques
         )
 
     summary = {
-        "victim_count": len(focused_records),
+        "victim_count": totals["victim_count"],
         "country_count": len(country_rows),
-        "group_count": len(_ransomware_group_rows(focused_records)),
-        "countryless_count": max(len(focused_records) - sum(row["record_count"] for row in country_rows), 0),
+        "group_count": len(group_rows),
+        "countryless_count": max(
+            totals["victim_count"] - sum(row["record_count"] for row in country_rows), 0
+        ),
     }
 
     return {
@@ -1399,18 +1280,79 @@ def _build_ransomware_map_state(*, window: str, selected_group: str = "", reques
             selected_group=selected_group,
             country=selected_country,
         ),
-        "live_cursor": max((record["id"] for record in focused_records), default=0),
-        "focused_records": focused_records,
+        "live_cursor": totals["live_cursor"] or 0,
     }
 
 
-def ransomware_map_view(request):
-    state = _build_ransomware_map_state(
-        window=request.GET.get("window") or "7d",
-        selected_group=request.GET.get("group") or "",
-        requested_country=request.GET.get("country") or "",
+RANSOMWARE_MAP_PARAMS = {"window", "group", "country"}
+
+
+def _ransomware_map_filter_values(window: str):
+    """Group keys and country names (by key) present in ``window``, cached per version."""
+
+    def build():
+        victims = _ransomware_victims(window)
+        groups = set(victims.exclude(group_key="").values_list("group_key", flat=True).distinct())
+        countries = dict(
+            victims.exclude(country_key="").values_list("country_key", "country").distinct()
+        )
+        return groups, countries
+
+    return cached_fragment("ransomware-map-filters", build, window)
+
+
+def _ransomware_map_filters(request):
+    """Normalized (window, group, country) for cache keys, or None when not cacheable.
+
+    Unknown groups fall back to all groups, as the page does. A country that has
+    no victims in the window is served uncached so arbitrary values cannot grow
+    the cache.
+    """
+    window = _validated_ransomware_window(request.GET.get("window"))
+    groups, countries = _ransomware_map_filter_values(window)
+    selected_group = (request.GET.get("group") or "").strip()
+    if selected_group not in groups:
+        selected_group = ""
+    requested_country = (request.GET.get("country") or "").strip()
+    if requested_country:
+        requested_country = countries.get(normalized_country_key(requested_country))
+        if requested_country is None:
+            return None
+    return window, selected_group, requested_country
+
+
+def _ransomware_map_page_params(request):
+    if not set(request.GET) <= RANSOMWARE_MAP_PARAMS:
+        return None
+    return _ransomware_map_filters(request)
+
+
+def _cached_ransomware_map_state(request):
+    filters = _ransomware_map_filters(request)
+    if filters is None:
+        return _build_ransomware_map_state(
+            window=request.GET.get("window") or "7d",
+            selected_group=request.GET.get("group") or "",
+            requested_country=request.GET.get("country") or "",
+        )
+    window, selected_group, requested_country = filters
+    return cached_fragment(
+        "ransomware-map-state",
+        lambda: _build_ransomware_map_state(
+            window=window,
+            selected_group=selected_group,
+            requested_country=requested_country,
+        ),
+        window,
+        selected_group,
+        requested_country,
     )
 
+
+@cache_public_page(params=_ransomware_map_page_params)
+def ransomware_map_view(request):
+    state = _cached_ransomware_map_state(request)
+
     return render(
         request,
         "intel/ransomware_map.html",
@@ -1419,29 +1361,29 @@ def ransomware_map_view(request):
             "current_page": "ransomware-map",
             "window_options": RANSOMWARE_MAP_WINDOW_OPTIONS,
             "reset_url": reverse("ransomware-map"),
-            **{key: value for key, value in state.items() if key != "focused_records"},
+            "live_stream_url": reverse("ransomware-map-stream"),
+            "live_version": public_cache_version(),
+            **state,
         },
     )
 
 
-def ransomware_map_live_view(request):
-    cursor_raw = (request.GET.get("cursor") or "").strip()
-    try:
-        cursor = max(int(cursor_raw), 0)
-    except (TypeError, ValueError):
-        cursor = 0
-
-    state = _build_ransomware_map_state(
-        window=request.GET.get("window") or "7d",
-        selected_group=request.GET.get("group") or "",
-        requested_country=request.GET.get("country") or "",
-    )
-    new_events = [
-        _serialize_ransomware_live_event(record)
-        for record in state["focused_records"]
-        if record["id"] > cursor
-    ][:12]
-    payload = {
+def _ransomware_map_live_payload(request, cursor: int):
+    state = _cached_ransomware_map_state(request)
+    new_events = []
+    if cursor < state["live_cursor"]:
+        # Only victims between the client's cursor and the cached snapshot's are
+        # read; an up-to-date poll is answered from the cache alone.
+        new_victims = _ransomware_victims(
+            state["window"],
+            group_key=state["selected_group"],
+            country_key=state["selected_country_key"],
+        ).filter(pk__gt=cursor, pk__lte=state["live_cursor"])
+        new_events = [
+            _serialize_ransomware_live_event(record)
+            for record in _ransomware_records(new_victims, 12)
+        ]
+    return {
         "cursor": state["live_cursor"],
         "events": new_events,
         "snapshot": {
@@ -1462,7 +1404,19 @@ def ransomware_map_live_view(request):
             "selected_country": state["selected_country"],
         },
     }
-    return JsonResponse(payload)
+
+
+@condition(etag_func=lambda request: live_etag(request, RansomwareVictim))
+@cache_control(no_cache=True)
+def ransomware_map_live_view(request):
+    return JsonResponse(_ransomware_map_live_payload(request, request_cursor(request)))
+
+
+def ransomware_map_stream_view(request):
+    return live_event_stream(
+        request,
+        lambda cursor: _ransomware_map_live_payload(request, cursor),
+    )
 
 
 DARK_WINDOW_RANGES = {
@@ -1578,6 +1532,7 @@ def _dark_filtered_hits_queryset(request):
 def _dark_source_health_context():
     sources = list(
         DarkSource.objects.filter(enabled=True)
+        .select_related("latest_run")
         .annotate(
             hit_count=Count("hits", distinct=True),
             document_count=Count("documents", distinct=True),
@@ -1585,20 +1540,9 @@ def _dark_source_health_context():
         )
         .order_by("name")
     )
-    latest_run_by_source = {}
-    source_ids = [source.id for source in sources]
-    if source_ids:
-        for run in (
-            DarkFetchRun.objects.filter(dark_source_id__in=source_ids)
-            .only("dark_source_id", "ok", "error", "started_at", "finished_at")
-            .order_by("dark_source_id", "-started_at")
-        ):
-            if run.dark_source_id not in latest_run_by_source:
-                latest_run_by_source[run.dark_source_id] = run
-
     source_rows = []
     for source in sources:
-        latest_run = latest_run_by_source.get(source.id)
+        latest_run = source.latest_run
         if latest_run is None:
             status = "never"
             last_run_at = None
@@ -1718,13 +1662,6 @@ def _live_incident_hits(hits):
     return [hit for hit in hits if hit.record_type == "incident"][:6]
 
 
-def _normalized_country_key(value: str) -> str:
-    country_display, _country_code = normalize_dark_country(value)
-    if country_display:
-        return country_display.lower()
-    return (value or "").strip().lower()
-
-
 def _dark_map_tile_palette(*, intensity_level: int, is_selected: bool, has_activity: bool):
     if not has_activity:
         return {
@@ -1794,7 +1731,7 @@ def _dark_map_tiles(country_rows, *, selected_country: str, window: str, selecte
     for tile in DARK_MAP_TILE_LAYOUT:
         row = row_by_layout_key.get(tile["key"])
         has_activity = row is not None
-        is_selected = has_activity and row["country_key"] == _normalized_country_key(selected_country)
+        is_selected = has_activity and row["country_key"] == normalized_country_key(selected_country)
         intensity_level = _dark_map_intensity_level(
             row["record_count"] if row else 0,
             max_record_count,
@@ -1997,7 +1934,7 @@ def _dark_map_group_rows(hits, *, selected_country: str = ""):
         country_map = group_countries.setdefault(group_name.lower(), {})
         country_map.setdefault(country_display.lower(), country_display)
 
-    selected_country_key = _normalized_country_key(selected_country)
+    selected_country_key = normalized_country_key(selected_country)
     for row in rows:
         countries = sorted(group_countries.get(row["group_name"].lower(), {}).values())
         row["countries"] = countries
@@ -2066,7 +2003,7 @@ def _dark_map_source_rows(hits):
 
 
 def _dark_map_signal_hits(hits, *, selected_country: str = ""):
-    selected_country_key = _normalized_country_key(selected_country)
+    selected_country_key = normalized_country_key(selected_country)
     group_country_keys = {}
     for hit in hits:
         group_name = resolve_group_name(
@@ -2090,7 +2027,7 @@ def _dark_map_signal_hits(hits, *, selected_country: str = ""):
         )
         if selected_country_key:
             if hit.record_type == "incident":
-                if _normalized_country_key(country_display) != selected_country_key:
+                if normalized_country_key(country_display) != selected_country_key:
                     continue
             elif selected_country_key not in group_country_keys.get(group_name.lower() if group_name else "", set()):
                 continue
@@ -2127,7 +2064,7 @@ def _dark_map_match_summary(hits, group_rows):
 
 
 def _dark_map_overlay(top_groups, map_tiles, *, selected_country: str = ""):
-    selected_country_key = _normalized_country_key(selected_country)
+    selected_country_key = normalized_country_key(selected_country)
     tile_lookup = {
         tile["country_key"]: tile
         for tile in map_tiles
@@ -2139,7 +2076,7 @@ def _dark_map_overlay(top_groups, map_tiles, *, selected_country: str = ""):
     for row in top_groups:
         countries = [
             country for country in row["countries"]
-            if _normalized_country_key(country) in tile_lookup
+            if normalized_country_key(country) in tile_lookup
         ]
         if countries:
             eligible_groups.append((row, countries[:3]))
@@ -2162,7 +2099,7 @@ def _dark_map_overlay(top_groups, map_tiles, *, selected_country: str = ""):
             }
         )
         for country in countries:
-            country_key = _normalized_country_key(country)
+            country_key = normalized_country_key(country)
             tile = tile_lookup[country_key]
             x1 = tile["x"] + (tile["width"] / 2)
             y1 = tile["y"] + (tile["height"] / 2)
@@ -2204,7 +2141,7 @@ def _dark_map_selected_country(request, country_rows):
     requested_country = (request.GET.get("country") or "").strip()
     if not requested_country:
         return ""
-    requested_country_key = _normalized_country_key(requested_country)
+    requested_country_key = normalized_country_key(requested_country)
     for row in country_rows:
         if row["country_key"] == requested_country_key:
             selected_country = row["country"]
@@ -2219,7 +2156,7 @@ def _dark_map_build_state(request, *, selected_hits, filter_context):
     country_rows = _dark_country_activity_rows(selected_hits)
     selected_source_name = _dark_map_selected_source_name(filter_context["selected_source"])
     selected_country = _dark_map_selected_country(request, country_rows)
-    selected_country_key = _normalized_country_key(selected_country)
+    selected_country_key = normalized_country_key(selected_country)
     for row in country_rows:
         row["is_selected"] = row["country_key"] == selected_country_key
 
@@ -2297,7 +2234,7 @@ def _serialize_dark_map_signal_hit(hit, *, filter_context):
     )
     signal_group_key = getattr(hit, "signal_group_key", "") or _dark_map_group_key(signal_group_name)
     map_country = getattr(hit, "map_country", "") or normalize_dark_country(hit.country)[0]
-    map_country_key = _normalized_country_key(map_country)
+    map_country_key = normalized_country_key(map_country)
     raw_params = {"window": filter_context["window"], "q": signal_title}
     if filter_context["selected_source"]:
         raw_params["source"] = filter_context["selected_source"]
@@ -2411,6 +2348,8 @@ def dark_map_view(request):
             "dashboard_url": reverse("dark-dashboard"),
             "recent_hits_url": reverse("dark-recent-hits"),
             "live_poll_url": reverse("dark-map-live"),
+            "live_stream_url": reverse("dark-map-stream"),
+            "live_version": public_cache_version(),
             "window_options": DARK_WINDOW_OPTIONS,
             **_dark_source_health_context(),
             **filter_context,
@@ -2419,14 +2358,7 @@ def dark_map_view(request):
     )
 
 
-@superuser_required
-def dark_map_live_view(request):
-    cursor_raw = (request.GET.get("cursor") or "").strip()
-    try:
-        cursor = max(int(cursor_raw), 0)
-    except (TypeError, ValueError):
-        cursor = 0
-
+def _dark_map_live_payload(request, cursor: int):
     _, hits, filter_context = _dark_filtered_hits_queryset(request)
     selected_hits = list(hits)
     state = _dark_map_build_state(
@@ -2439,7 +2371,7 @@ def dark_map_live_view(request):
         for hit in state["signal_hits"]
         if hit.id > cursor
     ][:12]
-    payload = {
+    return {
         "cursor": state["live_cursor"],
         "events": new_events,
         "snapshot": {
@@ -2465,14 +2397,34 @@ def dark_map_live_view(request):
             "selected_country_key": state["selected_country_key"],
         },
     }
-    return JsonResponse(payload)
+
+
+@superuser_required
+@condition(etag_func=lambda request: live_etag(request, DarkHit))
+@cache_control(private=True, no_cache=True)
+def dark_map_live_view(request):
+    return JsonResponse(_dark_map_live_payload(request, request_cursor(request)))
+
+
+@superuser_required
+def dark_map_stream_view(request):
+    return live_event_stream(
+        request,
+        lambda cursor: _dark_map_live_payload(request, cursor),
+    )
 
 
 @superuser_required
 def dark_recent_hits_view(request):
     _, hits, filter_context = _dark_filtered_hits_queryset(request)
-    paginator = Paginator(hits, 50)
-    page_obj = paginator.get_page(request.GET.get("page"))
+    page_obj = keyset_page(
+        hits,
+        cursor=(request.GET.get("cursor") or "").strip(),
+        per_page=DARK_HITS_PER_PAGE,
+        time_field="detected_at",
+    )
+    # Only the first page shows a total; later pages are a pure index seek.
+    hits_total = hits.count() if page_obj.is_first else None
     health_context = _dark_source_health_context()
 
     return render(
@@ -2481,8 +2433,9 @@ def dark_recent_hits_view(request):
         {
             "page_title": "Dark Intel",
             "current_page": "dark",
-            "hits": page_obj,
+            "hits": page_obj.object_list,
             "page_obj": page_obj,
+            "hits_total": hits_total,
             "groups_url": reverse("dark-dashboard"),
             "window_options": DARK_WINDOW_OPTIONS,
             **health_context,
@@ -2536,16 +2489,9 @@ def admin_logout_view(request):
 
 
 def _build_feed_rows(feeds):
-    latest_run_by_feed = {}
-    feed_ids = [feed.id for feed in feeds]
-    if feed_ids:
-        for run in FetchRun.objects.filter(feed_id__in=feed_ids).order_by("feed_id", "-started_at"):
-            if run.feed_id not in latest_run_by_feed:
-                latest_run_by_feed[run.feed_id] = run
-
     feed_rows = []
     for feed in feeds:
-        latest_run = latest_run_by_feed.get(feed.id)
+        latest_run = feed.latest_run
         display_error = ""
         if latest_run is not None:
             if latest_run.ok:
@@ -2623,7 +2569,7 @@ def ops_dashboard(request):
             messages.error(request, "Unknown action.")
         return redirect("intel_admin:ops")
 
-    enabled_feeds_qs = Feed.objects.filter(enabled=True).select_related("source")
+    enabled_feeds_qs = Feed.objects.filter(enabled=True).select_related("source", "latest_run")
     enabled_feeds = list(enabled_feeds_qs.order_by("source__name", "name"))
 
     enabled_feeds_count = len(enabled_feeds)
@@ -2706,7 +2652,7 @@ def admin_panel_view(request):
     if selected_status not in {"all", "ok", "error", "never"}:
         selected_status = "all"
 
-    feeds_qs = Feed.objects.select_related("source")
+    feeds_qs = Feed.objects.select_related("source", "latest_run")
     if query:
         feeds_qs = feeds_qs.filter(
             Q(source__name__icontains=query)
@@ -2786,7 +2732,7 @@ def admin_panel_sources_list(request):
         Source.objects.annotate(
             feed_count=Count("feeds", distinct=True),
             item_count=Count("items", distinct=True),
-            last_item_at=Max(Coalesce("items__published_at", "items__created_at")),
+            last_item_at=Max("items__published_at"),
         ).order_by("name")
     )
     return render(
@@ -2805,37 +2751,17 @@ def admin_panel_sources_list(request):
 
 def _dark_source_rows():
     sources = list(
-        DarkSource.objects.annotate(
+        DarkSource.objects.select_related("latest_run")
+        .annotate(
             hit_count=Count("hits", distinct=True),
             document_count=Count("documents", distinct=True),
             last_hit_at=Max("hits__last_seen_at"),
-        ).order_by("name")
+        )
+        .order_by("name")
     )
-    latest_run_by_source = {}
-    source_ids = [source.id for source in sources]
-    if source_ids:
-        for run in (
-            DarkFetchRun.objects.filter(dark_source_id__in=source_ids)
-            .only(
-                "dark_source_id",
-                "ok",
-                "error",
-                "started_at",
-                "finished_at",
-                "bytes_received",
-                "http_status",
-                "documents_fetched",
-                "hits_new",
-                "hits_updated",
-            )
-            .order_by("dark_source_id", "-started_at")
-        ):
-            if run.dark_source_id not in latest_run_by_source:
-                latest_run_by_source[run.dark_source_id] = run
-
     source_rows = []
     for source in sources:
-        latest_run = latest_run_by_source.get(source.id)
+        latest_run = source.latest_run
         if latest_run is None:
             status = "never"
             last_run_at = None
@@ -4,6 +4,8 @@ import sys
 
 
 def main() -> None:
+    if sys.argv[1:2] == ["test"]:
+        os.environ.setdefault("DJANGO_ENV", "test")
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
     from django.core.management import execute_from_command_line
 